@@ -0,0 +1,62 @@
+"""Measures how long it takes to import the simulator in a fresh interpreter.
+
+Usage:
+    python -m benchmarks.import_time [module ...]
+"""
+
+import statistics
+import subprocess
+import sys
+
+# Heavy modules the core of the simulator should not load when imported.
+HEAVY_MODULES: tuple[str] = ("pandas", "matplotlib", "PySimpleGUI", "tkinter")
+
+_MEASURE_IMPORT = """
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+
+heavy = [name for name in {heavy_modules!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure_import_time(
+    module: str = "scheduling_sim", repeat: int = 5
+) -> tuple[float, list[str]]:
+    """Measures the import time of a module in fresh interpreters.
+
+    Args:
+        module (str, optional): The module to import. Defaults to "scheduling_sim".
+        repeat (int, optional): The number of interpreters to measure. Defaults
+        to 5.
+
+    Returns:
+        tuple[float, list[str]]: The median import time, in seconds, and the heavy
+        modules loaded by the import.
+    """
+
+    code = _MEASURE_IMPORT.format(module=module, heavy_modules=HEAVY_MODULES)
+    times = []
+
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+
+        times.append(float(output[0]))
+        heavy_modules = output[1].split(",") if len(output) > 1 else []
+
+    return statistics.median(times), heavy_modules
+
+
+if __name__ == "__main__":
+    for module in sys.argv[1:] or ["scheduling_sim"]:
+        elapsed, heavy_modules = measure_import_time(module)
+        print(
+            f"{module}: {elapsed * 1000:.1f} ms"
+            f" (heavy modules: {', '.join(heavy_modules) or 'none'})"
+        )
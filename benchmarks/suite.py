@@ -0,0 +1,298 @@
+"""Benchmarks every scheduler across a grid of workloads, and flags regressions.
+
+Usage:
+    python -m benchmarks.suite run [-o results.json] [--quick]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.2]
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.import_time import measure_import_time
+from scheduling_sim.generator import WorkloadGenerator
+from scheduling_sim.scheduling_algorithms import (
+    FirstComeFirstServeScheduler,
+    MultilevelFeedbackQueueScheduler,
+    PriorityCooperativeScheduler,
+    PriorityPreemptiveScheduler,
+    RoundRobinScheduler,
+    ShortestJobFirstScheduler,
+    ShortestRemainingTimeFirstScheduler,
+)
+
+SCHEDULERS: tuple[type] = (
+    FirstComeFirstServeScheduler,
+    ShortestJobFirstScheduler,
+    PriorityCooperativeScheduler,
+    RoundRobinScheduler,
+    ShortestRemainingTimeFirstScheduler,
+    PriorityPreemptiveScheduler,
+    MultilevelFeedbackQueueScheduler,
+)
+
+# The grid of workloads. The mean burst sets the simulated horizon, which is
+# about the number of processes times the mean burst.
+GRID: dict[str, list] = {
+    "number_of_processes": [1_000, 10_000, 100_000],
+    "mean_burst": [4, 64],
+    "arrival_pattern": ["poisson", "bursty"],
+}
+
+QUICK_GRID: dict[str, list] = {
+    "number_of_processes": [100, 1_000],
+    "mean_burst": [4],
+    "arrival_pattern": ["poisson", "bursty"],
+}
+
+# Measurements compared against a baseline, where higher values are worse.
+COMPARED_MEASUREMENTS: tuple[str] = ("wall_time", "peak_memory")
+
+
+def benchmark_case(
+    scheduler_type: type, workload_parameters: dict[str,], repeat: int = 3
+) -> dict[str,]:
+    """Measures the simulation of a scheduler on a generated workload.
+
+    The wall time is the best of the repetitions, and the peak memory is the
+    largest amount of memory allocated while simulating.
+
+    Args:
+        scheduler_type (type): The scheduling algorithm class.
+        workload_parameters (dict[str,]): The number of processes, mean burst and
+        arrival pattern of the workload.
+        repeat (int, optional): The number of repetitions. Defaults to 3.
+
+    Returns:
+        dict[str,]: The parameters of the case and its measurements.
+    """
+
+    parameters = dict(workload_parameters)
+    number_of_processes = parameters.pop("number_of_processes")
+
+    # the load is kept at about 90%, so the processor is rarely idle
+    arrival_rate = 0.9 / (parameters["mean_burst"] + 0.5)
+    table = WorkloadGenerator(arrival_rate=arrival_rate, seed=0, **parameters).generate(
+        number_of_processes
+    )
+
+    wall_times = []
+    peak_memory = 0
+
+    for _ in range(repeat):
+        scheduler = scheduler_type(table)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        scheduler.results
+        wall_times.append(time.perf_counter() - start)
+        peak_memory = max(peak_memory, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    # tracing memory slows the simulation down, so wall times are measured again
+    for _ in range(repeat):
+        scheduler = scheduler_type(table)
+
+        start = time.perf_counter()
+        scheduler.results
+        wall_times.append(time.perf_counter() - start)
+
+    wall_time = min(wall_times[repeat:])
+    number_of_steps = (
+        int(scheduler.results.conclusion_times.max())
+        - int(table.arrival_time.min())
+        + 1
+    )
+
+    return {
+        "scheduler": scheduler_type.__name__,
+        **workload_parameters,
+        "number_of_steps": number_of_steps,
+        "wall_time": wall_time,
+        "tick_time": wall_time / number_of_steps,
+        "peak_memory": peak_memory,
+    }
+
+
+def run_suite(grid: dict[str, list] = GRID, repeat: int = 3) -> dict[str,]:
+    """Benchmarks every scheduler on every workload of a grid.
+
+    Args:
+        grid (dict[str, list], optional): The values of each workload parameter.
+        Defaults to `GRID`.
+        repeat (int, optional): The number of repetitions of each case. Defaults
+        to 3.
+
+    Returns:
+        dict[str,]: The environment of the run and the results of each case.
+    """
+
+    results = []
+
+    for values in itertools.product(*grid.values()):
+        workload_parameters = dict(zip(grid.keys(), values))
+
+        for scheduler_type in SCHEDULERS:
+            result = benchmark_case(scheduler_type, workload_parameters, repeat)
+            results.append(result)
+
+            print(
+                f"{result['scheduler']:>36} {_case_label(result):<40}"
+                f" {result['wall_time'] * 1000:10.2f} ms"
+                f" {result['peak_memory'] / 2**10:10.1f} KiB",
+                file=sys.stderr,
+            )
+
+    import_time, _ = measure_import_time()
+
+    return {
+        "environment": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+        },
+        "import_time": import_time,
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str,], current: dict[str,], threshold: float = 0.2
+) -> list[dict[str,]]:
+    """Compares benchmark results against a baseline.
+
+    Args:
+        baseline (dict[str,]): The results of the baseline run.
+        current (dict[str,]): The results of the current run.
+        threshold (float, optional): The largest relative increase of a
+        measurement that is not a regression. Defaults to 0.2.
+
+    Returns:
+        list[dict[str,]]: The measurements of every case found in both runs, with
+        their ratio to the baseline and whether they regressed.
+    """
+
+    baseline_results = {_case_key(result): result for result in baseline["results"]}
+    comparisons = []
+
+    cases = [
+        (_case_key(result), baseline_results.get(_case_key(result)), result)
+        for result in current["results"]
+    ]
+    cases.append((("import",), baseline, current))
+
+    for key, baseline_result, result in cases:
+        if baseline_result == None:
+            continue
+
+        measurements = COMPARED_MEASUREMENTS if key != ("import",) else ("import_time",)
+
+        for measurement in measurements:
+            if measurement not in baseline_result or measurement not in result:
+                continue
+
+            ratio = result[measurement] / max(baseline_result[measurement], 1e-12)
+            comparisons.append(
+                {
+                    "case": " ".join(map(str, key)),
+                    "measurement": measurement,
+                    "baseline": baseline_result[measurement],
+                    "current": result[measurement],
+                    "ratio": ratio,
+                    "regression": ratio > 1 + threshold,
+                }
+            )
+
+    return comparisons
+
+
+def _case_key(result: dict[str,]) -> tuple:
+    """Identifies the case of a result.
+
+    Args:
+        result (dict[str,]): The result of a case.
+
+    Returns:
+        tuple: The scheduler and the workload parameters of the case.
+    """
+
+    return (result["scheduler"], *(result[parameter] for parameter in GRID))
+
+
+def _case_label(result: dict[str,]) -> str:
+    """Describes the workload of a result.
+
+    Args:
+        result (dict[str,]): The result of a case.
+
+    Returns:
+        str: The workload parameters of the case.
+    """
+
+    return ", ".join(f"{parameter}={result[parameter]}" for parameter in GRID)
+
+
+def main(arguments: list[str] = None) -> int:
+    """Runs the command line interface of the benchmark suite.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults to
+        the arguments of the current process.
+
+    Returns:
+        int: The exit code, which is 1 if a comparison found regressions.
+    """
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmark suite")
+    run_parser.add_argument("-o", "--output", default="benchmark_results.json")
+    run_parser.add_argument("-r", "--repeat", type=int, default=3)
+    run_parser.add_argument("--quick", action="store_true", help="use a small grid")
+
+    compare_parser = commands.add_parser(
+        "compare", help="flag regressions against a baseline"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("-t", "--threshold", type=float, default=0.2)
+
+    options = parser.parse_args(arguments)
+
+    if options.command == "run":
+        results = run_suite(QUICK_GRID if options.quick else GRID, options.repeat)
+
+        with open(options.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+        return 0
+
+    with open(options.baseline) as file:
+        baseline = json.load(file)
+
+    with open(options.current) as file:
+        current = json.load(file)
+
+    comparisons = compare_results(baseline, current, options.threshold)
+
+    for comparison in comparisons:
+        flag = "REGRESSION" if comparison["regression"] else "ok"
+        print(
+            f"{flag:>10} {comparison['ratio']:6.2f}x"
+            f" {comparison['measurement']:<12} {comparison['case']}"
+        )
+
+    return int(any(comparison["regression"] for comparison in comparisons))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,4 @@
 from scheduling_sim import SchedulingSimulatorAPP
 
-SchedulingSimulatorAPP().run()
+if __name__ == "__main__":
+    SchedulingSimulatorAPP().run()
@@ -1,8 +1,13 @@
-from scheduling_sim.ui import SchedulingSimulatorAPP
+import importlib
 
+from .checkpoint import load_checkpoint, save_checkpoint
+from .generator import WorkloadGenerator
 from .process import Process, ProcessStatus
+from .process_table import ProcessTable
+from .profiling import SimulationStats
 from .scheduling_algorithms import (
     FirstComeFirstServeScheduler,
+    MultilevelFeedbackQueueScheduler,
     PriorityCooperativeScheduler,
     PriorityPreemptiveScheduler,
     RoundRobinScheduler,
@@ -10,3 +15,21 @@ from .scheduling_algorithms import (
     ShortestJobFirstScheduler,
     ShortestRemainingTimeFirstScheduler,
 )
+from .tuning import tune_quantum_length
+
+# Attributes whose modules need pandas, matplotlib or a graphical environment.
+# They are only imported when first used, so the core can run on headless hosts.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "SchedulingSimulatorAPP": "scheduling_sim.ui",
+    "compare_algorithms": "scheduling_sim.batch",
+    "simulate_batch": "scheduling_sim.batch",
+    "sweep_quantum_lengths": "scheduling_sim.batch",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name])
+        return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,500 @@
+import inspect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from scheduling_sim.metrics import PERCENTILES
+from scheduling_sim.process_table import ProcessTable
+from scheduling_sim.scheduling_algorithms import (
+    FirstComeFirstServeScheduler,
+    MultilevelFeedbackQueueScheduler,
+    PriorityCooperativeScheduler,
+    PriorityPreemptiveScheduler,
+    RoundRobinScheduler,
+    SchedulingAlgorithm,
+    ShortestJobFirstScheduler,
+    ShortestRemainingTimeFirstScheduler,
+)
+
+# Columns of a workload that are shared with the worker processes, in the order
+# they are stored in shared memory.
+_SHARED_COLUMNS: tuple[str] = ("arrival_time", "execution_time", "priority_level")
+
+# Workloads shared with a worker process, set once by the pool initializer.
+_shared_memory: shared_memory.SharedMemory = None
+_shared_workloads: np.ndarray = None
+_shared_offsets: np.ndarray = None
+_shared_algorithms: list[type] = None
+
+METRICS_COLUMNS: tuple[str] = (
+    "workload",
+    "algorithm",
+    "number_of_processes",
+    "total_execution_time",
+    "completion_time",
+    "average_wait_time",
+    "average_turnaround_time",
+    "average_response_time",
+    "throughput",
+    "cpu_utilization",
+    "idle_time",
+    "context_switches",
+    *(f"wait_time_p{percentile}" for percentile in PERCENTILES),
+    *(f"turnaround_time_p{percentile}" for percentile in PERCENTILES),
+)
+
+# Columns of a quantum sweep: the quantum length and the metrics of its schedule.
+SWEEP_COLUMNS: tuple[str] = ("quantum_length", *METRICS_COLUMNS[2:])
+
+DEFAULT_ALGORITHMS: tuple[type] = (
+    FirstComeFirstServeScheduler,
+    ShortestJobFirstScheduler,
+    PriorityCooperativeScheduler,
+    RoundRobinScheduler,
+    ShortestRemainingTimeFirstScheduler,
+    PriorityPreemptiveScheduler,
+    MultilevelFeedbackQueueScheduler,
+)
+
+# Metrics used to rank algorithms, with the name of their rank column. Lower
+# values rank better.
+RANKED_METRICS: dict[str, str] = {
+    "average_wait_time": "wait_time_rank",
+    "average_turnaround_time": "turnaround_time_rank",
+    "completion_time": "completion_time_rank",
+}
+
+
+def simulate_batch(
+    workloads,
+    algorithms,
+    params: dict[str,] = None,
+    max_workers: int = None,
+) -> pd.DataFrame:
+    """Simulates every algorithm on every workload, spreading the runs over
+    worker processes.
+
+    The workloads are copied once into shared memory, from which each worker
+    builds its own process table. Only the job indexes and the metrics travel
+    between processes.
+
+    Args:
+        workloads (list | dict): The workloads to simulate, each one a list of
+        `Process` objects or a `ProcessTable`. If a dict is given, its keys label
+        the workloads; otherwise, they are labeled by position.
+        algorithms (list[type] | dict[str, type]): The scheduling algorithm
+        classes to simulate. If a dict is given, its keys label the algorithms;
+        otherwise, they are labeled by their `algorithm_name`.
+        params (dict[str,], optional): Keyword arguments for the algorithms, such
+        as `quantum_length` or `use_reverse_priority`. Each algorithm only gets
+        the arguments it accepts.
+        max_workers (int, optional): The number of worker processes. Defaults to
+        the number of processors. If 1, the batch runs in the current process.
+
+    Raises:
+        TypeError: If an algorithm is not a subclass of `SchedulingAlgorithm`.
+
+    Returns:
+        pd.DataFrame: A table with one row per workload and algorithm, in the
+        order they were given, with the columns in `METRICS_COLUMNS`. The
+        completion time is the time when the last process concludes, and the
+        percentiles are estimated by quantile sketches.
+    """
+
+    if isinstance(workloads, dict):
+        labels = list(workloads.keys())
+        workloads = list(workloads.values())
+    else:
+        workloads = list(workloads)
+        labels = list(range(len(workloads)))
+
+    if isinstance(algorithms, dict):
+        algorithm_labels = list(algorithms.keys())
+        algorithms = list(algorithms.values())
+    else:
+        algorithms = list(algorithms)
+        algorithm_labels = None
+
+    for algorithm in algorithms:
+        if not (
+            isinstance(algorithm, type) and issubclass(algorithm, SchedulingAlgorithm)
+        ):
+            raise TypeError(
+                f"expected a SchedulingAlgorithm subclass. Got {algorithm!r} instead."
+            )
+
+    if algorithm_labels == None:
+        algorithm_labels = [algorithm.algorithm_name for algorithm in algorithms]
+
+    arguments = [select_arguments(algorithm, params or {}) for algorithm in algorithms]
+    jobs = [
+        (workload, algorithm, arguments[algorithm], None)
+        for workload in range(len(workloads))
+        for algorithm in range(len(algorithms))
+    ]
+    columns, offsets = _pack_workloads(workloads)
+
+    if max_workers == 1 or len(jobs) <= 1:
+        metrics = [_run_job(columns, offsets, algorithms, job) for job in jobs]
+    else:
+        metrics = _run_jobs_in_pool(columns, offsets, algorithms, jobs, max_workers)
+
+    report = pd.DataFrame(metrics, columns=METRICS_COLUMNS[2:])
+    report.insert(0, "algorithm", [algorithm_labels[job[1]] for job in jobs])
+    report.insert(0, "workload", [labels[job[0]] for job in jobs])
+
+    return report
+
+
+def compare_algorithms(
+    workload,
+    algorithms=DEFAULT_ALGORITHMS,
+    params: dict[str,] = None,
+    max_workers: int = None,
+) -> pd.DataFrame:
+    """Ranks scheduling algorithms by how well they schedule a workload.
+
+    The workload is loaded once and each algorithm runs concurrently in a worker
+    process, on its own copy of the processes.
+
+    Args:
+        workload (list[Process] | ProcessTable): The processes to schedule.
+        algorithms (list[type] | dict[str, type], optional): The scheduling
+        algorithm classes to compare. If a dict is given, its keys label the
+        algorithms. Defaults to all algorithms in `DEFAULT_ALGORITHMS`.
+        params (dict[str,], optional): Keyword arguments for the algorithms, as
+        in `simulate_batch`.
+        max_workers (int, optional): The number of worker processes, as in
+        `simulate_batch`.
+
+    Returns:
+        pd.DataFrame: The metrics of each algorithm and its rank in each of the
+        metrics in `RANKED_METRICS`, best first. Algorithms are ordered by wait
+        time, then by turnaround time, then by completion time; ties keep the
+        given order.
+    """
+
+    ranking = simulate_batch([workload], algorithms, params, max_workers)
+    ranking = ranking.drop(columns="workload")
+
+    for metric, rank in RANKED_METRICS.items():
+        ranking[rank] = ranking[metric].rank(method="min").astype(int)
+
+    ranking = ranking.sort_values(list(RANKED_METRICS), kind="stable")
+
+    return ranking.reset_index(drop=True)
+
+
+def sweep_quantum_lengths(
+    workload, quantum_lengths, max_workers: int = None
+) -> pd.DataFrame:
+    """Simulates a workload under Round Robin with each of the given quantum
+    lengths, spreading the runs over worker processes.
+
+    Round Robin schedules with different quantum lengths are identical until a
+    process runs for as long as the shortest quantum, so the prefix they share
+    is only simulated once. A single schedule, with the longest quantum, is
+    simulated up to the step in which each shorter quantum would first expire,
+    and forked there. The rest of every schedule then runs in the worker
+    processes, which build their processes from a single copy of the workload
+    in shared memory.
+
+    Args:
+        workload (list[Process] | ProcessTable): The processes to schedule.
+        quantum_lengths (Iterable[int]): The quantum lengths to simulate.
+        max_workers (int, optional): The number of worker processes, as in
+        `simulate_batch`.
+
+    Raises:
+        TypeError: If a quantum length is not an integer.
+        ValueError: If no quantum length is given, or one is less than 1.
+
+    Returns:
+        pd.DataFrame: A table with one row per distinct quantum length, in
+        increasing order, and the columns in `SWEEP_COLUMNS`.
+    """
+
+    quantum_lengths = list(quantum_lengths)
+
+    if len(quantum_lengths) == 0:
+        raise ValueError("At least one quantum length should be given.")
+
+    for quantum_length in quantum_lengths:
+        if type(quantum_length) != int:
+            raise TypeError(
+                f"Quantum length should be an integer. Got {type(quantum_length)} instead."
+            )
+
+        if quantum_length < 1:
+            raise ValueError(
+                f"Quantum length should be higher than 0. Got {quantum_length} instead."
+            )
+
+    quantum_lengths = sorted(set(quantum_lengths))
+    columns, offsets = _pack_workloads([workload])
+    jobs = _quantum_sweep_jobs(ProcessTable(*columns), quantum_lengths)
+    algorithms = [RoundRobinScheduler]
+
+    if max_workers == 1 or len(jobs) <= 1:
+        metrics = [_run_job(columns, offsets, algorithms, job) for job in jobs]
+    else:
+        metrics = _run_jobs_in_pool(columns, offsets, algorithms, jobs, max_workers)
+
+    report = pd.DataFrame(metrics, columns=SWEEP_COLUMNS[1:])
+    report.insert(0, "quantum_length", quantum_lengths)
+
+    return report
+
+
+def _quantum_sweep_jobs(table: ProcessTable, quantum_lengths: list[int]) -> list:
+    """Simulates the prefixes shared by Round Robin schedules, and forks a job
+    for each quantum length where its schedule diverges.
+
+    Round Robin only interrupts a process when its quantum progress reaches the
+    quantum length, so a schedule with a shorter quantum follows the one with
+    the longest quantum up to the first step in which the running process has
+    run for as long as the shorter quantum.
+
+    Args:
+        table (ProcessTable): The processes of the workload.
+        quantum_lengths (list[int]): The distinct quantum lengths, in increasing
+        order.
+
+    Returns:
+        list[tuple]: A job for each quantum length, with the state its schedule
+        goes on from.
+    """
+
+    scheduler = RoundRobinScheduler(table, quantum_length=quantum_lengths[-1])
+    jobs = []
+
+    for quantum_length in quantum_lengths:
+        if quantum_length < scheduler.quantum_length:
+            _advance_to_quantum_expiry(scheduler, quantum_length)
+
+        scalars, arrays = scheduler._checkpoint_state()
+        state = {
+            name: array.copy()
+            for name, array in arrays.items()
+            if name not in ProcessTable.attribute_columns
+        }
+        jobs.append((0, 0, {"quantum_length": quantum_length}, (scalars, state)))
+
+    return jobs
+
+
+def _advance_to_quantum_expiry(scheduler: RoundRobinScheduler, quantum_length: int):
+    """Advances a Round Robin simulation up to the first step in which the
+    running process has run for a whole quantum of the given length.
+
+    The simulation stops before that step, or at the end of the schedule, so
+    its state is also the state of a schedule with the given quantum length.
+
+    Args:
+        scheduler (RoundRobinScheduler): A scheduler with a longer quantum.
+        quantum_length (int): The shorter quantum length.
+    """
+
+    while scheduler._horizon == None:
+        step = scheduler.current_time
+
+        if not scheduler.is_executing_a_process:
+            # nothing runs until the next arrival or re-enqueued process
+            scheduler.advance(scheduler._next_event_step(step - 1))
+            continue
+
+        quantum_progress = scheduler._quantum_progress[scheduler._current_running_index]
+
+        if quantum_progress >= quantum_length:
+            return
+
+        scheduler.advance(step + quantum_length - quantum_progress - 1)
+
+
+def select_arguments(algorithm: type, params: dict[str,]) -> dict[str,]:
+    """Selects the keyword arguments accepted by an algorithm.
+
+    Args:
+        algorithm (type): The scheduling algorithm class.
+        params (dict[str,]): The keyword arguments given to the batch.
+
+    Returns:
+        dict[str,]: The keyword arguments to build the algorithm with.
+    """
+
+    accepted = inspect.signature(algorithm.__init__).parameters
+
+    return {name: value for name, value in params.items() if name in accepted}
+
+
+def _pack_workloads(workloads: list) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenates the columns of the workloads into a single array.
+
+    Args:
+        workloads (list): The workloads, each one a list of `Process` objects or
+        a `ProcessTable`.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: An array with one row per shared column and
+        one column per process, and the offset of each workload in it.
+    """
+
+    tables = [
+        workload
+        if isinstance(workload, ProcessTable)
+        else ProcessTable.from_processes(list(workload))
+        for workload in workloads
+    ]
+
+    offsets = np.zeros(len(tables) + 1, dtype=np.int64)
+    np.cumsum([len(table) for table in tables], out=offsets[1:])
+
+    columns = np.empty((len(_SHARED_COLUMNS), int(offsets[-1])), dtype=np.int64)
+
+    for table, start, stop in zip(tables, offsets[:-1], offsets[1:]):
+        for row, column in enumerate(_SHARED_COLUMNS):
+            columns[row, start:stop] = getattr(table, column)
+
+    return columns, offsets
+
+
+def _run_job(
+    columns: np.ndarray, offsets: np.ndarray, algorithms: list[type], job: tuple
+) -> tuple:
+    """Simulates an algorithm on one of the packed workloads.
+
+    Args:
+        columns (np.ndarray): The packed columns of the workloads.
+        offsets (np.ndarray): The offset of each workload in the columns.
+        algorithms (list[type]): The scheduling algorithm classes of the batch.
+        job (tuple): The workload index, the algorithm index, the keyword
+        arguments of the algorithm and the state the simulation goes on from, or
+        None to simulate the whole schedule.
+
+    Returns:
+        tuple: The metrics of the simulation, in the order of `METRICS_COLUMNS`.
+    """
+
+    workload, algorithm, arguments, state = job
+    start, stop = offsets[workload], offsets[workload + 1]
+
+    table = ProcessTable(*columns[:, start:stop])
+    scheduler = algorithms[algorithm](table, **arguments)
+
+    if state != None:
+        scheduler._restore_checkpoint_state(*state)
+
+    return scheduler_metrics(scheduler)
+
+
+def scheduler_metrics(scheduler: SchedulingAlgorithm) -> tuple:
+    """Collects the metrics of a scheduler, simulating it if needed.
+
+    Args:
+        scheduler (SchedulingAlgorithm): The scheduler.
+
+    Returns:
+        tuple: The metrics of the scheduler, in the order of `METRICS_COLUMNS`,
+        without the workload and algorithm labels.
+    """
+
+    results = scheduler.results
+
+    return (
+        scheduler.number_of_processes,
+        scheduler.total_execution_time,
+        int(results.conclusion_times.max(initial=0)),
+        results.average_wait_time,
+        results.average_turnaround_time,
+        results.average_response_time,
+        results.throughput,
+        results.cpu_utilization,
+        results.idle_time,
+        results.context_switches,
+        *results.wait_time_percentiles.values(),
+        *results.turnaround_time_percentiles.values(),
+    )
+
+
+def _run_jobs_in_pool(
+    columns: np.ndarray,
+    offsets: np.ndarray,
+    algorithms: list[type],
+    jobs: list[tuple],
+    max_workers: int = None,
+) -> list[tuple]:
+    """Runs the jobs of a batch in a pool of worker processes.
+
+    Args:
+        columns (np.ndarray): The packed columns of the workloads.
+        offsets (np.ndarray): The offset of each workload in the columns.
+        algorithms (list[type]): The scheduling algorithm classes of the batch.
+        jobs (list[tuple]): The jobs to run.
+        max_workers (int, optional): The number of worker processes.
+
+    Returns:
+        list[tuple]: The metrics of each job, in the order of the jobs.
+    """
+
+    workers = max_workers or os.cpu_count() or 1
+    memory = shared_memory.SharedMemory(create=True, size=max(columns.nbytes, 1))
+
+    try:
+        shared_columns = np.ndarray(
+            columns.shape, dtype=columns.dtype, buffer=memory.buf
+        )
+        shared_columns[:] = columns
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach_workloads,
+            initargs=(memory.name, columns.shape, offsets, algorithms),
+        ) as executor:
+            # a few chunks per worker balance the load without paying for one
+            # message per job
+            chunk_size = max(1, len(jobs) // (4 * workers))
+            metrics = list(executor.map(_run_shared_job, jobs, chunksize=chunk_size))
+
+        del shared_columns
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return metrics
+
+
+def _attach_workloads(
+    name: str, shape: tuple[int, int], offsets: np.ndarray, algorithms: list[type]
+):
+    """Attaches a worker process to the shared workloads of a batch.
+
+    Args:
+        name (str): The name of the shared memory block.
+        shape (tuple[int, int]): The shape of the packed columns.
+        offsets (np.ndarray): The offset of each workload in the columns.
+        algorithms (list[type]): The scheduling algorithm classes of the batch.
+    """
+
+    global _shared_memory, _shared_workloads, _shared_offsets, _shared_algorithms
+
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    _shared_workloads = np.ndarray(shape, dtype=np.int64, buffer=_shared_memory.buf)
+    _shared_offsets = offsets
+    _shared_algorithms = algorithms
+
+
+def _run_shared_job(job: tuple) -> tuple:
+    """Simulates an algorithm on one of the shared workloads of a worker process.
+
+    Args:
+        job (tuple): The workload index, the algorithm index, the keyword
+        arguments of the algorithm and the state the simulation goes on from.
+
+    Returns:
+        tuple: The metrics of the simulation.
+    """
+
+    return _run_job(_shared_workloads, _shared_offsets, _shared_algorithms, job)
@@ -0,0 +1,113 @@
+import json
+
+import numpy as np
+
+from scheduling_sim.process_table import ProcessTable
+from scheduling_sim.scheduling_algorithms import SchedulingAlgorithm
+
+# Version of the checkpoint format. Checkpoints of other versions are rejected.
+CHECKPOINT_VERSION: int = 1
+
+
+def save_checkpoint(scheduler: SchedulingAlgorithm, path: str):
+    """Saves the state of a simulation to a file.
+
+    The checkpoint is an uncompressed NumPy archive holding the process table
+    columns and the ready queue as arrays, and the scalars of the simulation,
+    the metrics accumulated so far and the parameters of the algorithm as a JSON
+    document. Writing it takes a single pass over the columns, and loading it
+    never unpickles objects, so checkpoints can be shared between hosts.
+
+    Profiling is not saved, so a resumed simulation is only profiled if enabled
+    again, from the step it resumes on.
+
+    Args:
+        scheduler (SchedulingAlgorithm): The scheduler whose simulation is saved,
+        usually after calling its `advance` method. A scheduler without a
+        simulation in flight is saved at the start of its schedule, or at its end
+        if it already has a result.
+        path (str): The path of the checkpoint file.
+    """
+
+    scalars, arrays = scheduler._checkpoint_state()
+
+    metadata = {
+        "version": CHECKPOINT_VERSION,
+        "algorithm": type(scheduler).__name__,
+        "parameters": scheduler._parameters(),
+        "state": scalars,
+    }
+
+    arrays["names"] = np.array(scheduler._table.names, dtype=str)
+    arrays["metadata"] = np.array(json.dumps(metadata))
+
+    with open(path, "wb") as file:
+        np.savez(file, **arrays)
+
+
+def load_checkpoint(path: str) -> SchedulingAlgorithm:
+    """Loads a simulation saved by `save_checkpoint`.
+
+    The simulation is in flight, so it can be advanced further with `advance`
+    or concluded by reading `results`, exactly as the saved one would.
+
+    Args:
+        path (str): The path of the checkpoint file.
+
+    Raises:
+        ValueError: If the checkpoint has another version or was saved by an
+        unknown scheduling algorithm.
+
+    Returns:
+        SchedulingAlgorithm: A scheduler of the same algorithm, with the same
+        processes and parameters, that goes on from the saved step.
+    """
+
+    with np.load(path, allow_pickle=False) as archive:
+        arrays = {name: archive[name] for name in archive.files}
+
+    metadata = json.loads(arrays.pop("metadata").item())
+
+    if metadata["version"] != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Checkpoint version should be {CHECKPOINT_VERSION}. Got {metadata['version']} instead."
+        )
+
+    algorithm = _find_algorithm(metadata["algorithm"])
+    table = ProcessTable(
+        arrays["arrival_time"],
+        arrays["execution_time"],
+        arrays["priority_level"],
+        arrays["names"].tolist(),
+    )
+
+    scheduler = algorithm(table, **metadata["parameters"])
+    scheduler._restore_checkpoint_state(metadata["state"], arrays)
+
+    return scheduler
+
+
+def _find_algorithm(name: str) -> type:
+    """Finds a scheduling algorithm class by its name.
+
+    Args:
+        name (str): The name of the class.
+
+    Raises:
+        ValueError: If no subclass of `SchedulingAlgorithm` has the name.
+
+    Returns:
+        type: The scheduling algorithm class.
+    """
+
+    algorithms = [SchedulingAlgorithm]
+
+    while len(algorithms) > 0:
+        algorithm = algorithms.pop()
+
+        if algorithm.__name__ == name:
+            return algorithm
+
+        algorithms.extend(algorithm.__subclasses__())
+
+    raise ValueError(f"Unknown scheduling algorithm {name!r}.")
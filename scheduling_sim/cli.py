@@ -0,0 +1,232 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from scheduling_sim.batch import (
+    METRICS_COLUMNS,
+    scheduler_metrics,
+    select_arguments,
+    simulate_batch,
+)
+from scheduling_sim.scheduling_algorithms import (
+    FirstComeFirstServeScheduler,
+    MultilevelFeedbackQueueScheduler,
+    PriorityCooperativeScheduler,
+    PriorityPreemptiveScheduler,
+    RoundRobinScheduler,
+    ShortestJobFirstScheduler,
+    ShortestRemainingTimeFirstScheduler,
+)
+from scheduling_sim.workload import read_workload
+
+# Algorithms available in the command line, by the acronyms used in the README.
+ALGORITHMS: dict[str, type] = {
+    "FCFS": FirstComeFirstServeScheduler,
+    "SJF": ShortestJobFirstScheduler,
+    "SRTF": ShortestRemainingTimeFirstScheduler,
+    "RR": RoundRobinScheduler,
+    "PRIOc": PriorityCooperativeScheduler,
+    "PRIOp": PriorityPreemptiveScheduler,
+    "MLFQ": MultilevelFeedbackQueueScheduler,
+}
+
+
+def positive_int(value: str) -> int:
+    """Parses a command line argument that should be a positive integer.
+
+    Args:
+        value (str): The argument.
+
+    Raises:
+        argparse.ArgumentTypeError: If the argument is not a positive integer.
+
+    Returns:
+        int: The parsed argument.
+    """
+
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer. Got {value!r} instead.")
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected an integer higher than 0. Got {number} instead."
+        )
+
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the command line arguments.
+
+    Returns:
+        argparse.ArgumentParser: The argument parser.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="python -m scheduling_sim",
+        description="Simulates scheduling algorithms on workload files without the user interface.",
+    )
+    parser.add_argument(
+        "workloads",
+        nargs="+",
+        help="workload files (.xlsx, .csv, .parquet, .arrow or .feather) with the same columns as the user interface input",
+    )
+    parser.add_argument(
+        "-a",
+        "--algorithms",
+        nargs="+",
+        choices=list(ALGORITHMS),
+        default=list(ALGORITHMS),
+        metavar="ALGORITHM",
+        help=f"algorithms to simulate, among {', '.join(ALGORITHMS)} (default: all)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quantum",
+        type=positive_int,
+        default=2,
+        help="quantum length of Round Robin (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-p",
+        "--priority-order",
+        choices=["ascending", "descending"],
+        default="descending",
+        help="whether higher priority levels mean higher (descending) or lower (ascending) priority (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--aging",
+        type=positive_int,
+        default=None,
+        help="number of steps a waiting process takes to gain one priority level in PRIOc and PRIOp (default: no aging)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="output",
+        help="directory where metrics and reports are written (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        help="number of worker processes (default: number of processors)",
+    )
+    parser.add_argument(
+        "--no-report",
+        action="store_true",
+        help="only compute metrics, without building the per-tick execution reports",
+    )
+
+    return parser
+
+
+def main(arguments: list[str] = None):
+    """Runs the command line interface.
+
+    The metrics of every workload and algorithm are written to `metrics.csv` in
+    the output directory. Unless disabled, the execution report of each run is
+    written to `<workload>_<algorithm>.csv` as well, so workload files should
+    have different names.
+
+    Args:
+        arguments (list[str], optional): The command line arguments. Defaults to
+        the arguments of the current process.
+    """
+
+    parser = build_parser()
+    options = parser.parse_args(arguments)
+    params = {
+        "quantum_length": options.quantum,
+        "use_reverse_priority": options.priority_order == "descending",
+        "aging_interval": options.aging,
+    }
+    labels = [os.path.splitext(os.path.basename(path))[0] for path in options.workloads]
+
+    # workloads are told apart by their file names in the metrics and reports
+    for index, label in enumerate(labels):
+        if label in labels[:index]:
+            first_path = options.workloads[labels.index(label)]
+            parser.error(
+                f"workloads {first_path!r} and {options.workloads[index]!r} have the same name {label!r}."
+            )
+
+    algorithms = {code: ALGORITHMS[code] for code in options.algorithms}
+
+    os.makedirs(options.output, exist_ok=True)
+
+    if options.no_report:
+        workloads = {
+            label: read_workload(path) for label, path in zip(labels, options.workloads)
+        }
+        metrics = simulate_batch(workloads, algorithms, params, options.jobs)
+    else:
+        metrics = _export_execution_reports(
+            options.workloads, labels, algorithms, params, options
+        )
+
+    metrics.to_csv(os.path.join(options.output, "metrics.csv"), index=False)
+
+
+def _export_execution_reports(
+    paths: list[str],
+    labels: list[str],
+    algorithms: dict[str, type],
+    params: dict[str,],
+    options: argparse.Namespace,
+):
+    """Simulates every algorithm on every workload and exports their reports.
+
+    Args:
+        paths (list[str]): The paths of the workload files.
+        labels (list[str]): The label of each workload.
+        algorithms (dict[str, type]): The algorithms to simulate, by acronym.
+        params (dict[str,]): The keyword arguments of the algorithms.
+        options (argparse.Namespace): The command line options.
+
+    Returns:
+        pd.DataFrame: The metrics of each simulation, as in `simulate_batch`.
+    """
+
+    import pandas as pd
+
+    jobs = [
+        (path, algorithm, select_arguments(algorithm, params), report_path)
+        for path, label in zip(paths, labels)
+        for code, algorithm in algorithms.items()
+        for report_path in [os.path.join(options.output, f"{label}_{code}.csv")]
+    ]
+
+    if options.jobs == 1 or len(jobs) <= 1:
+        metrics = [_export_execution_report(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=options.jobs) as executor:
+            metrics = list(executor.map(_export_execution_report, jobs))
+
+    metrics = pd.DataFrame(metrics, columns=METRICS_COLUMNS[2:])
+    metrics.insert(0, "algorithm", [code for _ in labels for code in algorithms])
+    metrics.insert(0, "workload", [label for label in labels for _ in algorithms])
+
+    return metrics
+
+
+def _export_execution_report(job: tuple) -> tuple:
+    """Simulates an algorithm on a workload file and exports its report.
+
+    Args:
+        job (tuple): The workload path, the algorithm class, its keyword arguments
+        and the path of the report.
+
+    Returns:
+        tuple: The metrics of the simulation, as in `scheduler_metrics`.
+    """
+
+    path, algorithm, arguments, report_path = job
+    scheduler = algorithm(read_workload(path), **arguments)
+
+    scheduler.run().to_csv(report_path, index=False)
+
+    return scheduler_metrics(scheduler)
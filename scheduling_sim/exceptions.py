@@ -37,7 +37,8 @@ class NoProcessWithArrivalTimeZeroError(Exception):
 
     This exception is raised when a scheduling algorithm or process management code
     expects at least one process to have an arrival time of 0 but none of the processes
-    meet this criteria.
+    meet this criteria. Schedulers no longer raise it, since their schedules start
+    when the first process arrives.
 
     Attributes:
         message (str): A custom error message describing the exception.
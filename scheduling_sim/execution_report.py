@@ -0,0 +1,478 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from scheduling_sim.process import ProcessStatus
+from scheduling_sim.process_table import ProcessTable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class ExecutionReportBuilder:
+    """Collects the execution report of a schedule into column buffers.
+
+    The report has one row per process per step. Since the number of processes
+    and steps is known beforehand, every column is preallocated once and filled
+    step by step. The DataFrame is only built when the schedule is over.
+
+    Attributes:
+        columns (tuple[str]): The columns of the execution report.
+
+    Methods:
+        add_step(step: int, table: ProcessTable): Adds the status of the processes
+        at the given step to the report.
+        to_columns() -> dict[str, np.ndarray]: Returns the columns of the report.
+        to_dataframe() -> pd.DataFrame: Builds the execution report.
+
+    Properties:
+        is_full (bool): Whether all the steps of the report were added.
+    """
+
+    columns: tuple[str] = (
+        "time",
+        "process_name",
+        "process_status",
+        "remaining_execution_time",
+        "quantum_progress",
+    )
+
+    # status values indexed by their status code in a ProcessTable
+    _status_values = np.array([status.value for status in ProcessStatus], dtype=object)
+
+    def __init__(self, process_names: list[str], number_of_steps: int):
+        self._process_names = np.array(process_names, dtype=object)
+        self._number_of_processes = len(process_names)
+        self._number_of_rows = 0
+
+        size = self._number_of_processes * number_of_steps
+        self._size = size
+
+        self._time = np.empty(size, dtype=np.int64)
+        self._process_status = np.empty(size, dtype=np.int8)
+        self._remaining_execution_time = np.empty(size, dtype=np.int64)
+        self._quantum_progress = np.empty(size, dtype=np.int64)
+
+    @property
+    def is_full(self) -> bool:
+        """bool: Whether all the steps of the report were added."""
+
+        return self._number_of_rows == self._size
+
+    def add_step(self, step: int, table: ProcessTable):
+        """Adds the status of the processes at the given step to the report.
+
+        Args:
+            step (int): The current step.
+            table (ProcessTable): The processes of the schedule, in the same order
+            as the process names.
+        """
+
+        start = self._number_of_rows
+        stop = start + self._number_of_processes
+
+        self._time[start:stop] = step
+        self._process_status[start:stop] = table.status
+        self._remaining_execution_time[start:stop] = table.remaining_execution_time
+        self._quantum_progress[start:stop] = table.quantum_progress
+
+        self._number_of_rows = stop
+
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """Returns the columns of the report.
+
+        Returns:
+            dict[str, np.ndarray]: The values of each column of the report, for the
+            steps added so far.
+        """
+
+        rows = self._number_of_rows
+        number_of_steps = rows // max(self._number_of_processes, 1)
+
+        return {
+            "time": self._time[:rows],
+            "process_name": np.tile(self._process_names, number_of_steps),
+            "process_status": self._status_values[self._process_status[:rows]],
+            "remaining_execution_time": self._remaining_execution_time[:rows],
+            "quantum_progress": self._quantum_progress[:rows],
+        }
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Builds the execution report.
+
+        Returns:
+            pd.DataFrame: A DataFrame with one row per process per step.
+        """
+
+        return execution_report_from_batches([self.to_columns()])
+
+
+def execution_report_from_batches(
+    batches: list[dict[str, np.ndarray]]
+) -> "pd.DataFrame":
+    """Builds an execution report from batches of report columns.
+
+    Args:
+        batches (list[dict[str, np.ndarray]]): The columns of consecutive parts of
+        the report, as returned by `ExecutionReportBuilder.to_columns`.
+
+    Returns:
+        pd.DataFrame: A DataFrame with one row per process per step.
+    """
+
+    # pandas is only imported when a report is built, so that schedulers can
+    # be used without it
+    import pandas as pd
+
+    columns = concatenate_batches(batches)
+
+    return pd.DataFrame(columns, columns=ExecutionReportBuilder.columns)
+
+
+def concatenate_batches(batches: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    """Joins batches of report columns into a single batch.
+
+    Args:
+        batches (list[dict[str, np.ndarray]]): The columns of consecutive parts of
+        the report, as returned by `ExecutionReportBuilder.to_columns`.
+
+    Returns:
+        dict[str, np.ndarray]: The columns of the whole report.
+    """
+
+    if len(batches) == 1:
+        return batches[0]
+
+    return {
+        column: np.concatenate([batch[column] for batch in batches])
+        for column in ExecutionReportBuilder.columns
+    }
+
+
+class SegmentReportBuilder:
+    """Collects the execution report of a schedule as run-length segments.
+
+    Each segment is an interval of steps in which a process keeps its status,
+    and its remaining execution time and quantum progress change by a constant
+    amount per step. The report grows with the number of scheduling events, not
+    with the length of the schedule.
+
+    Steps do not have to be added one by one: the processes are assumed to change
+    at a constant rate over the steps skipped after an added step.
+
+    Attributes:
+        columns (tuple[str]): The columns of the segment report.
+
+    Methods:
+        add_step(step: int, table: ProcessTable): Adds the status of the processes
+        at the given step to the report.
+        to_columns() -> dict[str, np.ndarray]: Returns the columns of the report.
+        to_dataframe() -> pd.DataFrame: Builds the segment report.
+    """
+
+    columns: tuple[str] = (
+        "process_name",
+        "process_status",
+        "start",
+        "end",
+        "remaining_execution_time_start",
+        "remaining_execution_time_end",
+        "quantum_progress_start",
+        "quantum_progress_end",
+    )
+
+    def __init__(self, process_names: list[str]):
+        self._process_names = np.array(process_names, dtype=object)
+        self._last_step: int = None
+        self._segments: list[tuple[np.ndarray, ...]] = []
+
+    def add_step(self, step: int, table: ProcessTable):
+        """Adds the status of the processes at the given step to the report.
+
+        Args:
+            step (int): The current step, after every step added so far.
+            table (ProcessTable): The processes of the schedule, in the same order
+            as the process names.
+        """
+
+        status = table.status.copy()
+        remaining_execution_time = table.remaining_execution_time.copy()
+        quantum_progress = table.quantum_progress.copy()
+
+        if self._last_step == None:
+            self._open_segments(
+                slice(None), step, status, remaining_execution_time, quantum_progress
+            )
+            self._last_step = step
+            return
+
+        gap = step - self._last_step
+        remaining_change = remaining_execution_time - self._remaining_execution_time
+        progress_change = quantum_progress - self._quantum_progress
+
+        # a segment seen only once takes the slope of its second step
+        new = ~self._has_slope
+        self._remaining_slope[new] = remaining_change[new] // gap
+        self._progress_slope[new] = progress_change[new] // gap
+
+        # a process runs for at most one step per step, so any other change is a
+        # reset, such as a new quantum, that starts a new segment
+        continues = (
+            (status == self._status)
+            & (remaining_change == self._remaining_slope * gap)
+            & (progress_change == self._progress_slope * gap)
+            & ((self._remaining_slope == 0) | (self._remaining_slope == -1))
+            & ((self._progress_slope == 0) | (self._progress_slope == 1))
+        )
+
+        # a broken segment seen only once has no slope yet
+        self._remaining_slope[new & ~continues] = 0
+        self._progress_slope[new & ~continues] = 0
+
+        if gap > 1:
+            continues |= self._split_segments(
+                ~continues & ~new & (status == self._status),
+                gap,
+                remaining_change,
+                progress_change,
+            )
+
+        closed = (~continues).nonzero()[0]
+
+        if len(closed) > 0:
+            self._close_segments(closed, step)
+            self._open_segments(
+                closed,
+                step,
+                status[closed],
+                remaining_execution_time[closed],
+                quantum_progress[closed],
+            )
+
+        self._has_slope[continues] = True
+        self._remaining_execution_time = remaining_execution_time
+        self._quantum_progress = quantum_progress
+        self._last_step = step
+
+    def _split_segments(
+        self,
+        broken: np.ndarray,
+        gap: int,
+        remaining_change: np.ndarray,
+        progress_change: np.ndarray,
+    ) -> np.ndarray:
+        """Ends segments at the last step added when the skipped steps after it
+        change at another rate.
+
+        A segment may change its rate on its last step, as when a running process
+        starts a new quantum, and the skipped steps then go on at the new rate.
+        They get a segment of their own, which starts on the first skipped step.
+
+        Args:
+            broken (np.ndarray): Whether the segment of each process does not
+            continue at the given step.
+            gap (int): The number of steps since the last step added.
+            remaining_change (np.ndarray): The change of the remaining execution
+            time of each process since the last step added.
+            progress_change (np.ndarray): The change of the quantum progress of
+            each process since the last step added.
+
+        Returns:
+            np.ndarray: Whether the segment of each process was split, so the new
+            one continues at the given step.
+        """
+
+        remaining_slope = remaining_change // gap
+        progress_slope = progress_change // gap
+        split = (
+            broken
+            & (remaining_change == remaining_slope * gap)
+            & (progress_change == progress_slope * gap)
+            & ((remaining_slope == 0) | (remaining_slope == -1))
+            & ((progress_slope == 0) | (progress_slope == 1))
+        )
+        processes = split.nonzero()[0]
+
+        if len(processes) == 0:
+            return split
+
+        step = self._last_step + 1
+        self._close_segments(processes, step)
+        self._open_segments(
+            processes,
+            step,
+            self._status[processes],
+            self._remaining_execution_time[processes] + remaining_slope[processes],
+            self._quantum_progress[processes] + progress_slope[processes],
+        )
+        self._remaining_slope[processes] = remaining_slope[processes]
+        self._progress_slope[processes] = progress_slope[processes]
+        self._has_slope[processes] = True
+
+        return split
+
+    def _open_segments(
+        self,
+        processes,
+        step: int,
+        status: np.ndarray,
+        remaining_execution_time: np.ndarray,
+        quantum_progress: np.ndarray,
+    ):
+        """Starts new segments for some of the processes.
+
+        Args:
+            processes (np.ndarray | slice): The indexes of the processes.
+            step (int): The first step of the segments.
+            status (np.ndarray): The status code of each process.
+            remaining_execution_time (np.ndarray): The remaining execution time of
+            each process.
+            quantum_progress (np.ndarray): The quantum progress of each process.
+        """
+
+        if type(processes) == slice:
+            size = len(self._process_names)
+            self._start = np.full(size, step, dtype=np.int64)
+            self._status = status
+            self._start_remaining_execution_time = remaining_execution_time.copy()
+            self._start_quantum_progress = quantum_progress.copy()
+            self._remaining_execution_time = remaining_execution_time
+            self._quantum_progress = quantum_progress
+            self._remaining_slope = np.zeros(size, dtype=np.int64)
+            self._progress_slope = np.zeros(size, dtype=np.int64)
+            self._has_slope = np.zeros(size, dtype=bool)
+            return
+
+        self._start[processes] = step
+        self._status[processes] = status
+        self._start_remaining_execution_time[processes] = remaining_execution_time
+        self._start_quantum_progress[processes] = quantum_progress
+        self._remaining_slope[processes] = 0
+        self._progress_slope[processes] = 0
+        self._has_slope[processes] = False
+
+    def _close_segments(self, processes: np.ndarray, end: int):
+        """Ends the open segments of some of the processes.
+
+        Args:
+            processes (np.ndarray): The indexes of the processes.
+            end (int): The step after the last step of the segments.
+        """
+
+        # the segments last until the step before the end, which may not have
+        # been added
+        steps_after_last = end - 1 - self._last_step
+
+        self._segments.append(
+            (
+                processes,
+                self._status[processes],
+                self._start[processes],
+                np.full(len(processes), end, dtype=np.int64),
+                self._start_remaining_execution_time[processes],
+                self._remaining_execution_time[processes]
+                + self._remaining_slope[processes] * steps_after_last,
+                self._start_quantum_progress[processes],
+                self._quantum_progress[processes]
+                + self._progress_slope[processes] * steps_after_last,
+            )
+        )
+
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """Returns the columns of the report.
+
+        The open segments end at the last step added. Segments are ordered by
+        process and then by start.
+
+        Returns:
+            dict[str, np.ndarray]: The values of each column of the report.
+        """
+
+        segments = list(self._segments)
+
+        if self._last_step != None:
+            open_segments = np.arange(len(self._process_names))
+            segments.append(
+                (
+                    open_segments,
+                    self._status,
+                    self._start,
+                    np.full(len(open_segments), self._last_step + 1, dtype=np.int64),
+                    self._start_remaining_execution_time,
+                    self._remaining_execution_time,
+                    self._start_quantum_progress,
+                    self._quantum_progress,
+                )
+            )
+
+        if len(segments) == 0:
+            values = [np.zeros(0, dtype=np.int64)] * len(self.columns)
+        else:
+            values = [np.concatenate(column) for column in zip(*segments)]
+
+        processes, status, *values = values
+        order = np.lexsort((values[0], processes))
+
+        columns = {
+            "process_name": self._process_names[processes[order]],
+            "process_status": ExecutionReportBuilder._status_values[status[order]],
+        }
+        columns.update(
+            (column, column_values[order])
+            for column, column_values in zip(self.columns[2:], values)
+        )
+
+        return columns
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Builds the segment report.
+
+        Returns:
+            pd.DataFrame: A DataFrame with one row per segment.
+        """
+
+        import pandas as pd
+
+        return pd.DataFrame(self.to_columns(), columns=self.columns)
+
+
+def expand_segment_report(segment_report: "pd.DataFrame") -> "pd.DataFrame":
+    """Expands a segment report into an execution report with one row per step.
+
+    Args:
+        segment_report (pd.DataFrame): A segment report, with its segments ordered
+        by process and then by start, as built by `SegmentReportBuilder`.
+
+    Returns:
+        pd.DataFrame: The execution report, with one row per process per step.
+    """
+
+    start = segment_report["start"].to_numpy()
+    end = segment_report["end"].to_numpy()
+    lengths = end - start
+
+    # the segments of each process start at the first step of the report
+    first_step = start.min(initial=0)
+    process = np.cumsum(start == first_step) - 1
+
+    rows = np.repeat(np.arange(len(segment_report)), lengths)
+    offset = np.arange(len(rows)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    time = start[rows] + offset
+
+    columns = {
+        "time": time,
+        "process_name": segment_report["process_name"].to_numpy()[rows],
+        "process_status": segment_report["process_status"].to_numpy()[rows],
+    }
+
+    for column in ("remaining_execution_time", "quantum_progress"):
+        column_start = segment_report[f"{column}_start"].to_numpy()
+        column_end = segment_report[f"{column}_end"].to_numpy()
+        slope = (column_end - column_start) // np.maximum(lengths - 1, 1)
+        columns[column] = column_start[rows] + slope[rows] * offset
+
+    order = np.lexsort((process[rows], time))
+
+    return execution_report_from_batches(
+        [{column: values[order] for column, values in columns.items()}]
+    )
@@ -0,0 +1,131 @@
+import numpy as np
+
+from scheduling_sim.process import ProcessStatus
+from scheduling_sim.utils import fade_color
+
+# Statuses drawn in a Gantt chart, by the kind of bar they are drawn as.
+GANTT_STATUSES: dict[str, tuple[str]] = {
+    "running": (ProcessStatus.RUNNING.value,),
+    "waiting": (ProcessStatus.WAITING.value, ProcessStatus.INTERRUPTED.value),
+}
+
+
+def merge_intervals(
+    start: np.ndarray, end: np.ndarray, groups: np.ndarray, resolution: float = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Merges the intervals of each group that touch or are closer than a
+    resolution.
+
+    Args:
+        start (np.ndarray): The start of each interval, in ascending order within
+        each group.
+        end (np.ndarray): The end of each interval.
+        groups (np.ndarray): The group of each interval, with the intervals of a
+        group next to each other.
+        resolution (float, optional): The largest gap between two intervals that
+        is filled when merging them. Defaults to 0, which only merges intervals
+        that touch.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: An array with one row per merged interval,
+        holding its start and its width as expected by `broken_barh`, and the
+        group of each merged interval.
+    """
+
+    if len(start) == 0:
+        return np.zeros((0, 2), dtype=np.int64), groups[:0]
+
+    breaks = (start[1:] - end[:-1] > resolution) | (groups[1:] != groups[:-1])
+    first = np.concatenate(([0], breaks.nonzero()[0] + 1))
+    last = np.concatenate((first[1:] - 1, [len(start) - 1]))
+
+    return np.column_stack((start[first], end[last] - start[first])), groups[first]
+
+
+def gantt_intervals(
+    segment_report, max_bars: int = 1000
+) -> dict[str, dict[str, np.ndarray]]:
+    """Groups the segments of a schedule into the bars of a Gantt chart.
+
+    Args:
+        segment_report (pd.DataFrame): The segment report of the schedule.
+        max_bars (int, optional): The most bars per process and kind of bar.
+        Longer timelines are aggregated by filling the gaps shorter than their
+        length divided by `max_bars`, so drawing them takes about the same time
+        regardless of the length of the schedule. If None, bars are only merged
+        when they touch. Defaults to 1000, about the width of a chart in pixels.
+
+    Returns:
+        dict[str, dict[str, np.ndarray]]: The bars of each process that runs or
+        waits, by kind of bar, with processes in the order they first appear.
+    """
+
+    kinds = list(GANTT_STATUSES)
+    kind = np.full(len(segment_report), -1)
+
+    for code, statuses in enumerate(GANTT_STATUSES.values()):
+        kind[segment_report["process_status"].isin(statuses).to_numpy()] = code
+
+    segments = segment_report.loc[kind >= 0]
+    kind = kind[kind >= 0]
+
+    process, processes = segments["process_name"].factorize()
+    start = segments["start"].to_numpy()
+    end = segments["end"].to_numpy()
+
+    resolution = 0
+
+    if max_bars != None and len(segments) > 0:
+        resolution = (end.max() - start.min()) / max_bars
+
+    groups = process * len(kinds) + kind
+    order = np.lexsort((start, groups))
+    bars, bar_groups = merge_intervals(
+        start[order], end[order], groups[order], resolution
+    )
+
+    # bars of each group, which are sorted by group
+    bounds = np.searchsorted(bar_groups, np.arange(len(processes) * len(kinds) + 1))
+
+    first_start = np.full(len(processes), np.iinfo(np.int64).max)
+    np.minimum.at(first_start, process, start)
+
+    return {
+        processes[index]: {
+            kind_name: bars[bounds[group] : bounds[group + 1]]
+            for code, kind_name in enumerate(kinds)
+            for group in [index * len(kinds) + code]
+        }
+        for index in np.argsort(first_start, kind="stable")
+    }
+
+
+def plot_gantt_chart(
+    ax, intervals: dict[str, dict[str, np.ndarray]], process_colors: dict[str, str]
+):
+    """Draws the Gantt chart of a schedule.
+
+    Each process is drawn with a single batched artist per kind of bar, with the
+    first process at the bottom.
+
+    Args:
+        ax (matplotlib.axes.Axes): The axes to draw on.
+        intervals (dict[str, dict[str, np.ndarray]]): The bars of each process,
+        as returned by `gantt_intervals`.
+        process_colors (dict[str, str]): The color of each process.
+    """
+
+    for position, (process, bars) in enumerate(intervals.items()):
+        color = process_colors[process]
+
+        ax.broken_barh(
+            bars["waiting"], (position - 0.25, 0.5), facecolors=fade_color(color)
+        )
+        ax.broken_barh(
+            bars["running"],
+            (position - 0.25, 0.5),
+            facecolors=color,
+            edgecolor="black",
+        )
+
+    ax.set_yticks(range(len(intervals)), list(intervals))
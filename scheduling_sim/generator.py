@@ -0,0 +1,309 @@
+import os
+
+import numpy as np
+
+from scheduling_sim.process_table import ProcessTable
+
+ARRIVAL_PATTERNS: tuple[str] = ("poisson", "bursty")
+BURST_DISTRIBUTIONS: tuple[str] = ("exponential", "lognormal", "bimodal")
+
+# Independent random streams of a generator, so the same processes are generated
+# regardless of how they are split into chunks.
+_STREAMS: tuple[str] = ("arrival", "batch", "burst", "mode", "priority")
+
+
+class WorkloadGenerator:
+    """Generates random workloads, reproducibly and in bulk.
+
+    Arrivals follow a Poisson process or, if bursty, a compound Poisson process
+    in which processes arrive in batches of geometrically distributed size. The
+    execution times, or CPU bursts, follow an exponential, lognormal or bimodal
+    distribution and are rounded up to whole ticks. Priority levels are drawn
+    from given weights.
+
+    Every attribute is drawn from its own random stream, so a seed always
+    generates the same processes, whether all at once or in chunks of any size.
+    The first process always arrives at time 0.
+
+    Attributes:
+        arrival_pattern (str): How processes arrive, one of `ARRIVAL_PATTERNS`.
+        arrival_rate (float): The mean number of processes that arrive per tick.
+        mean_batch_size (float): The mean number of processes that arrive
+        together, if arrivals are bursty.
+        burst_distribution (str): The distribution of the execution times, one of
+        `BURST_DISTRIBUTIONS`.
+        mean_burst (float): The mean execution time, before rounding.
+        burst_sigma (float): The standard deviation of the logarithm of the
+        execution times, if they are lognormal.
+        long_burst (float): The mean execution time of long processes, if the
+        execution times are bimodal. `mean_burst` is then the mean of short ones.
+        long_burst_fraction (float): The fraction of long processes, if the
+        execution times are bimodal.
+        priority_weights (list[float]): The relative weight of each priority level,
+        from level 1 upwards.
+        seed (int): The seed of the random streams.
+
+    Methods:
+        generate(number_of_processes: int) -> ProcessTable: Generates a workload.
+        chunks(number_of_processes: int, chunk_size: int): Generates a workload in
+        chunks.
+        write(path: str, number_of_processes: int, chunk_size: int): Streams a
+        workload to a file.
+    """
+
+    def __init__(
+        self,
+        arrival_pattern: str = "poisson",
+        arrival_rate: float = 0.2,
+        mean_batch_size: float = 4.0,
+        burst_distribution: str = "exponential",
+        mean_burst: float = 4.0,
+        burst_sigma: float = 1.0,
+        long_burst: float = 40.0,
+        long_burst_fraction: float = 0.1,
+        priority_weights: list[float] = None,
+        seed: int = None,
+    ):
+        """Initializes a new WorkloadGenerator instance.
+
+        Raises:
+            ValueError: If a pattern or distribution is unknown, or a parameter is
+            out of its valid range.
+        """
+
+        if arrival_pattern not in ARRIVAL_PATTERNS:
+            raise ValueError(
+                f"Arrival pattern should be one of {ARRIVAL_PATTERNS}. Got {arrival_pattern!r} instead."
+            )
+
+        if burst_distribution not in BURST_DISTRIBUTIONS:
+            raise ValueError(
+                f"Burst distribution should be one of {BURST_DISTRIBUTIONS}. Got {burst_distribution!r} instead."
+            )
+
+        for name, value in (
+            ("Arrival rate", arrival_rate),
+            ("Mean burst", mean_burst),
+            ("Burst sigma", burst_sigma),
+            ("Long burst", long_burst),
+        ):
+            if not value > 0:
+                raise ValueError(f"{name} should be positive. Got {value} instead.")
+
+        if not mean_batch_size >= 1:
+            raise ValueError(
+                f"Mean batch size should be at least 1. Got {mean_batch_size} instead."
+            )
+
+        if not 0 <= long_burst_fraction <= 1:
+            raise ValueError(
+                f"Long burst fraction should be between 0 and 1. Got {long_burst_fraction} instead."
+            )
+
+        priority_weights = np.asarray(
+            [1.0] if priority_weights is None else priority_weights, dtype=float
+        )
+
+        if len(priority_weights) == 0 or priority_weights.min() < 0:
+            raise ValueError("Priority weights should be non-negative and not empty.")
+
+        if not priority_weights.sum() > 0:
+            raise ValueError(
+                f"Priority weights should not all be zero. Got {priority_weights.tolist()} instead."
+            )
+
+        self.arrival_pattern = arrival_pattern
+        self.arrival_rate = arrival_rate
+        self.mean_batch_size = mean_batch_size
+        self.burst_distribution = burst_distribution
+        self.mean_burst = mean_burst
+        self.burst_sigma = burst_sigma
+        self.long_burst = long_burst
+        self.long_burst_fraction = long_burst_fraction
+        self.priority_weights = priority_weights.tolist()
+        self.seed = seed
+
+    def generate(self, number_of_processes: int) -> ProcessTable:
+        """Generates a workload.
+
+        Args:
+            number_of_processes (int): The number of processes.
+
+        Returns:
+            ProcessTable: The processes of the workload, in order of arrival.
+        """
+
+        return next(self.chunks(number_of_processes, max(number_of_processes, 1)))
+
+    def chunks(self, number_of_processes: int, chunk_size: int):
+        """Generates a workload in chunks.
+
+        The chunks hold consecutive processes of the same workload that
+        `generate` would return, so only one chunk has to be in memory at a time.
+
+        Args:
+            number_of_processes (int): The number of processes.
+            chunk_size (int): The most processes per chunk.
+
+        Raises:
+            ValueError: If the chunk size is not positive.
+
+        Yields:
+            ProcessTable: The processes of the next chunk, in order of arrival.
+        """
+
+        if chunk_size < 1:
+            raise ValueError(
+                f"Chunk size should be positive. Got {chunk_size} instead."
+            )
+
+        seeds = np.random.SeedSequence(self.seed).spawn(len(_STREAMS))
+        streams = {
+            name: np.random.default_rng(seed) for name, seed in zip(_STREAMS, seeds)
+        }
+        time = 0.0
+
+        for start in range(0, max(number_of_processes, 1), chunk_size):
+            size = min(chunk_size, number_of_processes - start)
+            gaps = self._arrival_gaps(streams, size)
+
+            if start == 0 and size > 0:
+                gaps[0] = 0
+
+            # the running time is accumulated from the previous chunk, so the
+            # arrival times do not depend on the chunk size
+            times = np.cumsum(np.concatenate(([time], gaps)))[1:]
+            time = times[-1] if size > 0 else time
+
+            yield ProcessTable(
+                np.floor(times).astype(np.int64),
+                self._bursts(streams, size),
+                self._priorities(streams, size),
+            )
+
+    def write(self, path: str, number_of_processes: int, chunk_size: int = 1_000_000):
+        """Streams a workload to a file, one chunk at a time.
+
+        The file has the columns read by `read_workload`, without process names.
+
+        Args:
+            path (str): The path of a CSV (.csv) or Parquet (.parquet) file. Parquet
+            files need pyarrow.
+            number_of_processes (int): The number of processes.
+            chunk_size (int, optional): The most processes generated at a time.
+            Defaults to 1,000,000.
+
+        Raises:
+            ValueError: If the file format is not supported.
+        """
+
+        import pandas as pd
+
+        extension = os.path.splitext(path)[1].lower()
+
+        if extension not in (".csv", ".parquet"):
+            raise ValueError(
+                f"unsupported workload file format. Expected .csv or .parquet, got {extension or path!r} instead."
+            )
+
+        writer = None
+
+        for index, table in enumerate(self.chunks(number_of_processes, chunk_size)):
+            chunk = pd.DataFrame(
+                {
+                    "Arrival Time": table.arrival_time,
+                    "Execution Time": table.execution_time,
+                    "Priority Level": table.priority_level,
+                }
+            )
+
+            if extension == ".csv":
+                chunk.to_csv(
+                    path,
+                    mode="w" if index == 0 else "a",
+                    header=index == 0,
+                    index=False,
+                )
+                continue
+
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            chunk = pa.Table.from_pandas(chunk, preserve_index=False)
+
+            if writer == None:
+                writer = pq.ParquetWriter(path, chunk.schema)
+
+            writer.write_table(chunk)
+
+        if writer != None:
+            writer.close()
+
+    def _arrival_gaps(self, streams: dict, size: int) -> np.ndarray:
+        """Draws the time between consecutive arrivals.
+
+        Args:
+            streams (dict): The random streams of the workload.
+            size (int): The number of processes.
+
+        Returns:
+            np.ndarray: The time since the previous arrival of each process.
+        """
+
+        if self.arrival_pattern == "poisson":
+            return streams["arrival"].exponential(1 / self.arrival_rate, size)
+
+        # each process joins the batch of the previous one with a fixed
+        # probability, so batch sizes are geometric with the given mean
+        batch_gap = self.mean_batch_size / self.arrival_rate
+        gaps = streams["arrival"].exponential(batch_gap, size)
+        same_batch = streams["batch"].random(size) < 1 - 1 / self.mean_batch_size
+        gaps[same_batch] = 0
+
+        return gaps
+
+    def _bursts(self, streams: dict, size: int) -> np.ndarray:
+        """Draws the execution times of the processes.
+
+        Args:
+            streams (dict): The random streams of the workload.
+            size (int): The number of processes.
+
+        Returns:
+            np.ndarray: The execution time of each process, of at least 1 tick.
+        """
+
+        if self.burst_distribution == "exponential":
+            bursts = streams["burst"].exponential(self.mean_burst, size)
+        elif self.burst_distribution == "lognormal":
+            mean = np.log(self.mean_burst) - self.burst_sigma**2 / 2
+            bursts = streams["burst"].lognormal(mean, self.burst_sigma, size)
+        else:
+            bursts = streams["burst"].exponential(1, size)
+            long = streams["mode"].random(size) < self.long_burst_fraction
+            bursts *= np.where(long, self.long_burst, self.mean_burst)
+
+        return np.maximum(np.ceil(bursts), 1).astype(np.int64)
+
+    def _priorities(self, streams: dict, size: int) -> np.ndarray:
+        """Draws the priority levels of the processes.
+
+        Args:
+            streams (dict): The random streams of the workload.
+            size (int): The number of processes.
+
+        Returns:
+            np.ndarray: The priority level of each process, starting at 1.
+        """
+
+        weights = np.asarray(self.priority_weights)
+
+        if len(weights) == 1:
+            return np.ones(size, dtype=np.int64)
+
+        cumulative_weights = np.cumsum(weights) / weights.sum()
+        levels = np.searchsorted(
+            cumulative_weights, streams["priority"].random(size), side="right"
+        )
+
+        return np.minimum(levels, len(weights) - 1).astype(np.int64) + 1
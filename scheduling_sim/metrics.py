@@ -0,0 +1,519 @@
+import math
+
+import numpy as np
+
+from scheduling_sim.process_table import ProcessTable
+
+# Percentiles of the wait and turnaround times kept in a scheduling result.
+PERCENTILES: tuple[int] = (50, 95, 99)
+
+
+class QuantileSketch:
+    """Streaming estimate of the quantiles of non-negative values.
+
+    Values are counted in buckets whose bounds grow geometrically, as in a
+    DDSketch, so every quantile is estimated within a fixed relative error while
+    the memory only grows with the logarithm of the range of the values. Zeros
+    are counted apart.
+
+    Attributes:
+        relative_accuracy (float): The largest relative error of an estimate.
+        count (int): The number of values added.
+        min (float): The smallest value added.
+        max (float): The largest value added.
+
+    Methods:
+        add(value: float): Adds a value to the sketch.
+        add_array(values: np.ndarray): Adds many values to the sketch at once.
+        merge(other: QuantileSketch): Adds the values of another sketch.
+        quantile(q: float) -> float: Estimates a quantile of the values.
+        to_dict() -> dict[str,]: Returns the state of the sketch as a dict.
+        from_dict(state: dict[str,]) -> QuantileSketch: Builds a sketch from the
+        state returned by `to_dict`.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """Initializes a new QuantileSketch instance.
+
+        Args:
+            relative_accuracy (float, optional): The largest relative error of an
+            estimate. Defaults to 0.01.
+
+        Raises:
+            ValueError: If the relative accuracy is not between 0 and 1.
+        """
+
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"Relative accuracy should be between 0 and 1. Got {relative_accuracy} instead."
+            )
+
+        self.relative_accuracy = relative_accuracy
+        self.count: int = 0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inverse_log_gamma = 1 / math.log(self._gamma)
+        self._zero_count = 0
+        self._buckets: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, value: float):
+        """Adds a value to the sketch.
+
+        Args:
+            value (float): The value, which should not be negative.
+        """
+
+        if value > 0:
+            key = math.ceil(math.log(value) * self._inverse_log_gamma)
+            self._buckets[key] = self._buckets.get(key, 0) + 1
+        else:
+            self._zero_count += 1
+
+        self.count += 1
+
+        if value < self.min:
+            self.min = value
+
+        if value > self.max:
+            self.max = value
+
+    def add_array(self, values: np.ndarray):
+        """Adds many values to the sketch at once.
+
+        Args:
+            values (np.ndarray): The values, which should not be negative.
+        """
+
+        values = np.asarray(values, dtype=float)
+
+        if len(values) == 0:
+            return
+
+        positive = values[values > 0]
+        keys, counts = np.unique(
+            np.ceil(np.log(positive) * self._inverse_log_gamma).astype(np.int64),
+            return_counts=True,
+        )
+
+        for key, count in zip(keys.tolist(), counts.tolist()):
+            self._buckets[key] = self._buckets.get(key, 0) + count
+
+        self._zero_count += len(values) - len(positive)
+        self.count += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: "QuantileSketch"):
+        """Adds the values of another sketch.
+
+        Args:
+            other (QuantileSketch): A sketch with the same relative accuracy.
+
+        Raises:
+            ValueError: If the sketches have different relative accuracies.
+        """
+
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy merge.")
+
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile of the values.
+
+        Like `np.quantile`, the quantile lies at rank `q * (count - 1)` of the
+        sorted values, and is interpolated linearly between the estimates of the
+        two values around that rank. Both estimates are within the relative
+        accuracy, so the interpolation is as well.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Raises:
+            ValueError: If the quantile is not between 0 and 1.
+
+        Returns:
+            float: The estimated value below which a fraction `q` of the values
+            lie, or NaN if the sketch is empty.
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile should be between 0 and 1. Got {q} instead.")
+
+        if self.count == 0:
+            return math.nan
+
+        rank = q * (self.count - 1)
+        lower_rank = math.floor(rank)
+        fraction = rank - lower_rank
+        lower = self._value_at_rank(lower_rank)
+
+        if fraction == 0:
+            return lower
+
+        upper = self._value_at_rank(lower_rank + 1)
+
+        return lower + (upper - lower) * fraction
+
+    def _value_at_rank(self, rank: int) -> float:
+        """Estimates the value at a rank of the sorted values.
+
+        Args:
+            rank (int): The rank, between 0 and the number of values minus 1.
+
+        Returns:
+            float: The estimated value.
+        """
+
+        if rank < self._zero_count:
+            return 0.0
+
+        seen = self._zero_count
+
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+
+            if seen > rank:
+                estimate = 2 * self._gamma**key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+
+        return self.max
+
+    def to_dict(self) -> dict[str,]:
+        """Returns the state of the sketch as a dict.
+
+        Returns:
+            dict[str,]: The relative accuracy, counters and buckets of the sketch,
+            as plain numbers and lists.
+        """
+
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "zero_count": self._zero_count,
+            "buckets": sorted(self._buckets.items()),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict[str,]) -> "QuantileSketch":
+        """Builds a sketch from the state returned by `to_dict`.
+
+        Args:
+            state (dict[str,]): The state of a sketch.
+
+        Returns:
+            QuantileSketch: A sketch with the same values.
+        """
+
+        sketch = cls(state["relative_accuracy"])
+        sketch.count = state["count"]
+        sketch.min = state["min"]
+        sketch.max = state["max"]
+        sketch._zero_count = state["zero_count"]
+        sketch._buckets = {int(key): int(count) for key, count in state["buckets"]}
+
+        return sketch
+
+
+class MetricsAccumulator:
+    """Accumulates the metrics of a schedule while it is simulated.
+
+    Schedulers record each dispatch, conclusion and idle processor as it
+    happens, so the metrics are known when the simulation ends, without a report
+    or another pass over the processes. The wait and turnaround times are also
+    kept in quantile sketches.
+
+    Attributes:
+        start_time (int): The first step of the schedule.
+        concluded_processes (int): The number of processes concluded.
+        completion_time (int): The time when the last process concluded.
+        idle_time (int): The number of steps, up to the completion time, in which
+        no process ran.
+        context_switches (int): The number of dispatches of a process other than
+        the last one that ran.
+        response_time_sum (int): The sum of the response times of the dispatched
+        processes.
+        responded_processes (int): The number of processes dispatched at least
+        once.
+        wait_times (QuantileSketch): The wait times of the concluded processes.
+        turnaround_times (QuantileSketch): The turnaround times of the concluded
+        processes.
+
+    Methods:
+        record_dispatch(time: int, response_time: int, context_switch: bool):
+        Records the dispatch of a process.
+        record_idle(time: int): Records that no process runs from the given step.
+        record_conclusion(time: int, arrival_time: int, execution_time: int):
+        Records the conclusion of a process.
+        record_conclusions(conclusion_time: np.ndarray, arrival_time: np.ndarray,
+        execution_time: np.ndarray): Records the conclusion of many processes.
+        to_dict() -> dict[str,]: Returns the state of the accumulator as a dict.
+        from_dict(state: dict[str,]) -> MetricsAccumulator: Builds an accumulator
+        from the state returned by `to_dict`.
+
+    Properties:
+        average_response_time (float): The average response time.
+        throughput (float): The number of processes concluded per step.
+        cpu_utilization (float): The fraction of steps in which a process ran.
+    """
+
+    def __init__(self, start_time: int = 0):
+        """Initializes a new MetricsAccumulator instance.
+
+        Args:
+            start_time (int, optional): The first step of the schedule. Defaults to
+            0.
+        """
+
+        self.start_time: int = start_time
+        self.concluded_processes: int = 0
+        self.completion_time: int = 0
+        self.idle_time: int = 0
+        self.context_switches: int = 0
+        self.response_time_sum: int = 0
+        self.responded_processes: int = 0
+        self.wait_times = QuantileSketch()
+        self.turnaround_times = QuantileSketch()
+
+        # the step since which no process runs, if the processor is idle, and
+        # the idle steps up to the last dispatch
+        self._idle_since: int = None
+        self._idle_time: int = 0
+
+    @property
+    def average_response_time(self) -> float:
+        """float: The average time between the arrival of a process and its first
+        dispatch."""
+
+        if self.responded_processes == 0:
+            return 0.0
+
+        return self.response_time_sum / self.responded_processes
+
+    @property
+    def throughput(self) -> float:
+        """float: The number of processes concluded per step, from the start of the
+        schedule up to the completion time."""
+
+        if self.completion_time <= self.start_time:
+            return 0.0
+
+        return self.concluded_processes / (self.completion_time - self.start_time)
+
+    @property
+    def cpu_utilization(self) -> float:
+        """float: The fraction of steps, from the start of the schedule up to the
+        completion time, in which a process ran."""
+
+        if self.completion_time <= self.start_time:
+            return 0.0
+
+        elapsed_time = self.completion_time - self.start_time
+
+        return (elapsed_time - self.idle_time) / elapsed_time
+
+    def record_dispatch(
+        self, time: int, response_time: int = None, context_switch: bool = False
+    ):
+        """Records the dispatch of a process.
+
+        Args:
+            time (int): The step of the dispatch.
+            response_time (int, optional): The time since the process arrived, if it
+            is its first dispatch.
+            context_switch (bool, optional): Whether the process is not the last one
+            that ran. Defaults to False.
+        """
+
+        if self._idle_since != None:
+            self._idle_time += time - self._idle_since
+            self._idle_since = None
+
+        if response_time != None:
+            self.response_time_sum += response_time
+            self.responded_processes += 1
+
+        if context_switch:
+            self.context_switches += 1
+
+    def record_idle(self, time: int):
+        """Records that no process runs from the given step on.
+
+        Args:
+            time (int): The step.
+        """
+
+        if self._idle_since == None:
+            self._idle_since = time
+
+    def record_conclusion(self, time: int, arrival_time: int, execution_time: int):
+        """Records the conclusion of a process.
+
+        Args:
+            time (int): The step of the conclusion.
+            arrival_time (int): The arrival time of the process.
+            execution_time (int): The execution time of the process.
+        """
+
+        turnaround_time = time - arrival_time
+
+        self.concluded_processes += 1
+        self.completion_time = max(self.completion_time, time)
+
+        # the processor is never idle while a process concludes, so every idle
+        # step before the conclusion has been recorded already
+        self.idle_time = self._idle_time
+        self.turnaround_times.add(turnaround_time)
+        self.wait_times.add(turnaround_time - execution_time)
+
+    def record_conclusions(
+        self,
+        conclusion_time: np.ndarray,
+        arrival_time: np.ndarray,
+        execution_time: np.ndarray,
+    ):
+        """Records the conclusion of many processes at once.
+
+        Args:
+            conclusion_time (np.ndarray): The conclusion time of each process.
+            arrival_time (np.ndarray): The arrival time of each process.
+            execution_time (np.ndarray): The execution time of each process.
+        """
+
+        turnaround_time = conclusion_time - arrival_time
+
+        self.concluded_processes += len(conclusion_time)
+        self.completion_time = max(
+            self.completion_time, int(conclusion_time.max(initial=0))
+        )
+        self.turnaround_times.add_array(turnaround_time)
+        self.wait_times.add_array(turnaround_time - execution_time)
+
+    def to_dict(self) -> dict[str,]:
+        """Returns the state of the accumulator as a dict.
+
+        Returns:
+            dict[str,]: The counters and sketches of the accumulator, as plain
+            numbers, lists and dicts.
+        """
+
+        return {
+            "start_time": self.start_time,
+            "concluded_processes": self.concluded_processes,
+            "completion_time": self.completion_time,
+            "idle_time": self.idle_time,
+            "context_switches": self.context_switches,
+            "response_time_sum": self.response_time_sum,
+            "responded_processes": self.responded_processes,
+            "wait_times": self.wait_times.to_dict(),
+            "turnaround_times": self.turnaround_times.to_dict(),
+            "idle_since": self._idle_since,
+            "pending_idle_time": self._idle_time,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict[str,]) -> "MetricsAccumulator":
+        """Builds an accumulator from the state returned by `to_dict`.
+
+        Args:
+            state (dict[str,]): The state of an accumulator.
+
+        Returns:
+            MetricsAccumulator: An accumulator that goes on from that state.
+        """
+
+        metrics = cls(state["start_time"])
+        metrics.concluded_processes = state["concluded_processes"]
+        metrics.completion_time = state["completion_time"]
+        metrics.idle_time = state["idle_time"]
+        metrics.context_switches = state["context_switches"]
+        metrics.response_time_sum = state["response_time_sum"]
+        metrics.responded_processes = state["responded_processes"]
+        metrics.wait_times = QuantileSketch.from_dict(state["wait_times"])
+        metrics.turnaround_times = QuantileSketch.from_dict(state["turnaround_times"])
+        metrics._idle_since = state["idle_since"]
+        metrics._idle_time = state["pending_idle_time"]
+
+        return metrics
+
+
+class SchedulingResult:
+    """The outcome of a simulated schedule.
+
+    Schedulers keep the result of their last simulation, so metrics can be read
+    any number of times without simulating the same workload again.
+
+    Attributes:
+        conclusion_times (np.ndarray): The conclusion time of each process.
+        turnaround_times (np.ndarray): The turnaround time of each process.
+        wait_times (np.ndarray): The wait time of each process.
+        average_turnaround_time (float): The average turnaround time of all
+        processes.
+        average_wait_time (float): The average wait time of all processes.
+        average_response_time (float): The average time between the arrival of a
+        process and its first dispatch.
+        throughput (float): The number of processes concluded per step.
+        cpu_utilization (float): The fraction of steps in which a process ran, up
+        to the completion time.
+        idle_time (int): The number of steps in which no process ran, up to the
+        completion time.
+        context_switches (int): The number of dispatches of a process other than
+        the last one that ran.
+        wait_time_percentiles (dict[int, float]): The estimated percentiles in
+        `PERCENTILES` of the wait times of the concluded processes.
+        turnaround_time_percentiles (dict[int, float]): The estimated percentiles
+        in `PERCENTILES` of the turnaround times of the concluded processes.
+        execution_report (pd.DataFrame): The execution report of the schedule, or
+        None if it was not built.
+        segment_report (pd.DataFrame): The segment report of the schedule, or None
+        if it was not built.
+    """
+
+    def __init__(
+        self,
+        table: ProcessTable,
+        metrics: MetricsAccumulator = None,
+        execution_report=None,
+        segment_report=None,
+    ):
+        self.conclusion_times: np.ndarray = table.conclusion_time.copy()
+        self.turnaround_times: np.ndarray = self.conclusion_times - table.arrival_time
+        self.wait_times: np.ndarray = self.turnaround_times - table.execution_time
+
+        self.average_turnaround_time: float = int(self.turnaround_times.sum()) / len(
+            table
+        )
+        self.average_wait_time: float = int(self.wait_times.sum()) / len(table)
+
+        if metrics == None:
+            metrics = MetricsAccumulator()
+
+        self.average_response_time: float = metrics.average_response_time
+        self.throughput: float = metrics.throughput
+        self.cpu_utilization: float = metrics.cpu_utilization
+        self.idle_time: int = metrics.idle_time
+        self.context_switches: int = metrics.context_switches
+        self.wait_time_percentiles: dict[int, float] = {
+            percentile: metrics.wait_times.quantile(percentile / 100)
+            for percentile in PERCENTILES
+        }
+        self.turnaround_time_percentiles: dict[int, float] = {
+            percentile: metrics.turnaround_times.quantile(percentile / 100)
+            for percentile in PERCENTILES
+        }
+
+        self.execution_report = execution_report
+        self.segment_report = segment_report
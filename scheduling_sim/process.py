@@ -1,6 +1,14 @@
 from enum import Enum
 
 from scheduling_sim.exceptions import InvalidProcessNameError
+from scheduling_sim.process_table import (
+    INTERRUPTED,
+    READY,
+    RUNNING,
+    TERMINATED,
+    WAITING,
+    ProcessTable,
+)
 
 
 class ProcessStatus(Enum):
@@ -30,6 +38,44 @@ class ProcessStatus(Enum):
     """The process has completed execution."""
 
 
+# process statuses indexed by their status code in a ProcessTable
+_STATUSES: dict[int, ProcessStatus] = {
+    READY: ProcessStatus.READY,
+    WAITING: ProcessStatus.WAITING,
+    INTERRUPTED: ProcessStatus.INTERRUPTED,
+    RUNNING: ProcessStatus.RUNNING,
+    TERMINATED: ProcessStatus.TERMINATED,
+}
+
+
+class _ProcessRow:
+    """The row of a process that is not part of a process table.
+
+    It has the columns of a `ProcessTable`, each as a list holding a single value,
+    which takes far less time and memory to build than a table of NumPy arrays.
+    """
+
+    __slots__ = (*ProcessTable.columns, "names")
+
+    def __init__(self):
+        for column in ProcessTable.columns:
+            setattr(self, column, [0])
+
+        self.names = [None]
+
+    def name(self, index: int) -> str:
+        """Returns the name of the process.
+
+        Args:
+            index (int): The index of the process, which is always 0.
+
+        Returns:
+            str: The name of the process.
+        """
+
+        return self.names[index]
+
+
 class Process:
     """The representation of a computer process.
 
@@ -37,6 +83,11 @@ class Process:
     Systems. It's a program in the state of execution, and have it's own memory
     space, system resources and execution context.
 
+    A process is a thin view of a row of a `ProcessTable`. A process created on
+    its own keeps its attributes in a plain single row until it is added to a
+    table, and processes added to a scheduler become views of the scheduler's
+    table when it runs.
+
     Methods:
         reset(): Resets the process attributes for scheduling.
         run(): Changes the process status to `running`.
@@ -65,6 +116,8 @@ class Process:
         quantum_progress (int): The progress made within the quantum time slice.
     """
 
+    __slots__ = ("_table", "_index")
+
     def __init__(
         self,
         name: str,
@@ -72,6 +125,9 @@ class Process:
         priority_level: int = 1,
         arrival_time: int = 0,
     ):
+        self._table = _ProcessRow()
+        self._index = 0
+
         self.name = name
         self.execution_time = execution_time
         self.priority_level = priority_level
@@ -82,21 +138,39 @@ class Process:
     def __repr__(self) -> str:
         return f"Process({self.name})"
 
+    @classmethod
+    def _view(cls, table: ProcessTable, index: int) -> "Process":
+        """Creates a view of a row of a process table.
+
+        Args:
+            table (ProcessTable): The table that holds the process.
+            index (int): The row of the process.
+
+        Returns:
+            Process: A process backed by the table row.
+        """
+
+        process = cls.__new__(cls)
+        process._table = table
+        process._index = index
+
+        return process
+
     def reset(self):
         """Resets the process properties for scheduling."""
 
         self.conclusion_time = self.arrival_time + self.execution_time
         self.enqueue_time = self.arrival_time
         self.remaining_execution_time = self.execution_time
-        self._quantum_progress = 0
-        self._status = ProcessStatus.READY
+        self.quantum_progress = 0
+        self._table.status[self._index] = READY
 
     # Process attributes
 
     @property
     def name(self) -> str:
         """str: The name of the process."""
-        return self._name
+        return self._table.name(self._index)
 
     @name.setter
     def name(self, value: str) -> str:
@@ -114,12 +188,12 @@ class Process:
         if value == "":
             raise InvalidProcessNameError(value)
 
-        self._name = str(value)
+        self._table.names[self._index] = str(value)
 
     @property
     def priority_level(self) -> int:
         """int: The priority level of the process, used by scheduling algorithms."""
-        return self._priority_level
+        return int(self._table.priority_level[self._index])
 
     @priority_level.setter
     def priority_level(self, value: int):
@@ -143,14 +217,14 @@ class Process:
                 f"Priority level should be higher than 0. Got {value} instead."
             )
 
-        self._priority_level = value
+        self._table.priority_level[self._index] = value
 
     # Execution attributes
 
     @property
     def execution_time(self) -> int:
         """int: The time required for the process to complete execution."""
-        return self._execution_time
+        return int(self._table.execution_time[self._index])
 
     @execution_time.setter
     def execution_time(self, value: int):
@@ -174,12 +248,12 @@ class Process:
                 f"Execution time should be higher than 0. Got {value} instead."
             )
 
-        self._execution_time = value
+        self._table.execution_time[self._index] = value
 
     @property
     def arrival_time(self) -> int:
         """int: The instant when the process arrives and becomes ready for execution."""
-        return self._arrival_time
+        return int(self._table.arrival_time[self._index])
 
     @arrival_time.setter
     def arrival_time(self, value: int):
@@ -201,12 +275,12 @@ class Process:
         if value < 0:
             raise ValueError(f"Arrival time should be positive. Got {value} instead.")
 
-        self._arrival_time = value
+        self._table.arrival_time[self._index] = value
 
     @property
     def conclusion_time(self) -> int:
         """int: The instant when the process is concluded."""
-        return self._conclusion_time
+        return int(self._table.conclusion_time[self._index])
 
     @conclusion_time.setter
     def conclusion_time(self, value: int):
@@ -230,7 +304,7 @@ class Process:
                 f"Conclusion time should be positive. Got {value} instead."
             )
 
-        self._conclusion_time = value
+        self._table.conclusion_time[self._index] = value
 
     @property
     def wait_time(self) -> int:
@@ -240,7 +314,7 @@ class Process:
     @property
     def remaining_execution_time(self) -> int:
         """int: The time remaining for the process to complete execution."""
-        return self._remaining_execution_time
+        return int(self._table.remaining_execution_time[self._index])
 
     @remaining_execution_time.setter
     def remaining_execution_time(self, value: int):
@@ -264,7 +338,7 @@ class Process:
                 f"Remaining execution time should be positive. Got {value} instead."
             )
 
-        self._remaining_execution_time = value
+        self._table.remaining_execution_time[self._index] = value
 
     @property
     def turnaround_time(self) -> int:
@@ -273,7 +347,7 @@ class Process:
 
     @property
     def enqueue_time(self) -> int:
-        return self._enqueue_time
+        return int(self._table.enqueue_time[self._index])
 
     @enqueue_time.setter
     def enqueue_time(self, value: int):
@@ -285,12 +359,12 @@ class Process:
         if value < 0:
             raise ValueError(f"Enqueue time should be positive. Got {value} instead.")
 
-        self._enqueue_time = value
+        self._table.enqueue_time[self._index] = value
 
     @property
     def quantum_progress(self):
         """int: The progress made within the current quantum."""
-        return self._quantum_progress
+        return int(self._table.quantum_progress[self._index])
 
     @quantum_progress.setter
     def quantum_progress(self, value: int):
@@ -313,14 +387,14 @@ class Process:
                 f"Quantum progress should be positive. Got {value} instead."
             )
 
-        self._quantum_progress = value
+        self._table.quantum_progress[self._index] = value
 
     # Status attributes
 
     @property
     def status(self) -> ProcessStatus:
         """ProcessStatus: The status of the process."""
-        return self._status
+        return _STATUSES[self._table.status[self._index]]
 
     @property
     def is_ready(self) -> bool:
@@ -349,16 +423,16 @@ class Process:
 
     def run(self):
         """Changes the process status to `running`."""
-        self._status = ProcessStatus.RUNNING
+        self._table.status[self._index] = RUNNING
 
     def wait(self):
         """Changes the process status to `waiting`."""
-        self._status = ProcessStatus.WAITING
+        self._table.status[self._index] = WAITING
 
     def interrupt(self):
         """Changes the process status to `interrupted`."""
-        self._status = ProcessStatus.INTERRUPTED
+        self._table.status[self._index] = INTERRUPTED
 
     def conclude(self):
         """Changes the process status to `terminated`."""
-        self._status = ProcessStatus.TERMINATED
+        self._table.status[self._index] = TERMINATED
@@ -0,0 +1,350 @@
+import math
+
+import numpy as np
+
+from scheduling_sim.exceptions import InvalidProcessNameError
+
+# Status codes stored in the status column of a ProcessTable, in the order the
+# ProcessStatus enumerator declares the statuses.
+READY = 0
+WAITING = 1
+INTERRUPTED = 2
+RUNNING = 3
+TERMINATED = 4
+
+
+class ProcessTable:
+    """A compact, column-oriented collection of processes.
+
+    Each process attribute is stored in its own NumPy array, with one element per
+    process. This takes a few dozen bytes per process, and lets schedulers and
+    metrics work on whole columns at once. `Process` objects are thin views of a
+    row of a process table.
+
+    Attributes:
+        arrival_time (np.ndarray): The arrival time of each process.
+        execution_time (np.ndarray): The execution time of each process.
+        priority_level (np.ndarray): The priority level of each process.
+        remaining_execution_time (np.ndarray): The remaining execution time of each
+        process.
+        status (np.ndarray): The status code of each process.
+        enqueue_time (np.ndarray): The time when each process was enqueued.
+        conclusion_time (np.ndarray): The time when each process was concluded.
+        quantum_progress (np.ndarray): The progress of each process within its
+        current quantum.
+
+    Methods:
+        from_processes(processes: list[Process]) -> ProcessTable: Builds a table
+        with the attributes of the given processes.
+        bind(processes: list[Process]): Makes the processes views of the table rows.
+        reset(): Resets the processes for scheduling.
+        append(process: Process): Adds a process to the table.
+        copy(share_attributes: bool = False) -> ProcessTable: Copies the processes
+        into a new table.
+        name(index: int) -> str: Returns the name of a process.
+
+    Properties:
+        names (list[str]): The name of each process.
+    """
+
+    columns: tuple[str] = (
+        "arrival_time",
+        "execution_time",
+        "priority_level",
+        "remaining_execution_time",
+        "status",
+        "enqueue_time",
+        "conclusion_time",
+        "quantum_progress",
+    )
+
+    # Columns that a simulation only reads, and the ones that hold its state.
+    attribute_columns: tuple[str] = columns[:3]
+    state_columns: tuple[str] = columns[3:]
+
+    _column_types: dict[str, type] = {
+        "arrival_time": np.int64,
+        "execution_time": np.int64,
+        "priority_level": np.int64,
+        "remaining_execution_time": np.int64,
+        "status": np.int8,
+        "enqueue_time": np.int64,
+        "conclusion_time": np.int64,
+        "quantum_progress": np.int64,
+    }
+
+    def __init__(
+        self,
+        arrival_time,
+        execution_time,
+        priority_level=None,
+        names: list[str] = None,
+    ):
+        """Initializes a new ProcessTable instance.
+
+        Args:
+            arrival_time (array-like): The arrival time of each process.
+            execution_time (array-like): The execution time of each process.
+            priority_level (array-like, optional): The priority level of each
+            process. Defaults to 1 for every process.
+            names (list[str], optional): The name of each process. Defaults to
+            "P1", "P2" and so on, which are only built when requested.
+
+        Raises:
+            TypeError: If a column does not hold integers.
+            ValueError: If the columns have different lengths or hold values out of
+            their valid ranges.
+            InvalidProcessNameError: If a name is missing or empty.
+        """
+
+        arrival_time = self._validate_column("Arrival time", arrival_time, 0)
+        execution_time = self._validate_column("Execution time", execution_time, 1)
+
+        if priority_level is None:
+            priority_level = np.ones(len(arrival_time), dtype=np.int64)
+
+        priority_level = self._validate_column("Priority level", priority_level, 1)
+
+        lengths = {len(arrival_time), len(execution_time), len(priority_level)}
+
+        if names is not None:
+            names = [self._validate_name(name) for name in names]
+            lengths.add(len(names))
+
+        if len(lengths) > 1:
+            raise ValueError(
+                f"All process columns should have the same length. Got {sorted(lengths)} instead."
+            )
+
+        self._allocate(len(arrival_time))
+        self.arrival_time[:] = arrival_time
+        self.execution_time[:] = execution_time
+        self.priority_level[:] = priority_level
+        self._names = names
+
+        self.reset()
+
+    def __len__(self) -> int:
+        return len(self.arrival_time)
+
+    def __repr__(self) -> str:
+        return f"ProcessTable(Processes: {len(self)})"
+
+    def __getitem__(self, index: int):
+        from scheduling_sim.process import Process
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("Process table index out of range.")
+
+        return Process._view(self, index)
+
+    def __iter__(self):
+        return (self[index] for index in range(len(self)))
+
+    @classmethod
+    def from_processes(cls, processes: list) -> "ProcessTable":
+        """Builds a table with the attributes of the given processes.
+
+        Args:
+            processes (list[Process]): The processes to copy into the table.
+
+        Returns:
+            ProcessTable: A new table with one row per process.
+        """
+
+        table = cls._empty(len(processes))
+
+        for index, process in enumerate(processes):
+            table.arrival_time[index] = process.arrival_time
+            table.execution_time[index] = process.execution_time
+            table.priority_level[index] = process.priority_level
+            table._names[index] = process.name
+
+        table.reset()
+
+        return table
+
+    def copy(self, share_attributes: bool = False) -> "ProcessTable":
+        """Copies the processes into a new table.
+
+        Args:
+            share_attributes (bool, optional): Whether the new table shares the
+            `attribute_columns` of this one instead of copying them. Shared columns
+            are read-only in the new table, but changes made to them through this
+            one show in both. Defaults to False.
+
+        Returns:
+            ProcessTable: A table with the same processes, reset for scheduling.
+        """
+
+        table = self._empty(len(self))
+
+        for column in self.attribute_columns:
+            if share_attributes:
+                shared_column = getattr(self, column).view()
+                shared_column.flags.writeable = False
+                setattr(table, column, shared_column)
+            else:
+                getattr(table, column)[:] = getattr(self, column)
+
+        table._names = None if self._names is None else list(self._names)
+
+        table.reset()
+
+        return table
+
+    @classmethod
+    def _empty(cls, size: int) -> "ProcessTable":
+        """Builds a table of the given size without validating its contents.
+
+        Args:
+            size (int): The number of processes in the table.
+
+        Returns:
+            ProcessTable: A table whose names and attributes are still to be set.
+        """
+
+        table = cls.__new__(cls)
+        table._allocate(size)
+        table._names = [None] * size
+
+        return table
+
+    def _allocate(self, size: int):
+        """Allocates every column of the table.
+
+        Args:
+            size (int): The number of processes in the table.
+        """
+
+        for column, column_type in self._column_types.items():
+            setattr(self, column, np.zeros(size, dtype=column_type))
+
+    @staticmethod
+    def _validate_name(name) -> str:
+        """Converts a process name to a string and validates it.
+
+        Args:
+            name: The name of a process.
+
+        Raises:
+            InvalidProcessNameError: If the name is missing, as None or NaN, or
+            empty.
+
+        Returns:
+            str: The name, without surrounding whitespace.
+        """
+
+        # missing names of workload files are read as NaN, which is not a name
+        if name is None or (isinstance(name, float) and math.isnan(name)):
+            raise InvalidProcessNameError(name)
+
+        value = str(name).strip()
+
+        if value == "":
+            raise InvalidProcessNameError(name)
+
+        return value
+
+    @staticmethod
+    def _validate_column(label: str, values, minimum: int) -> np.ndarray:
+        """Converts a column to a NumPy array and validates its values.
+
+        Args:
+            label (str): The name of the attribute stored in the column.
+            values (array-like): The values of the column.
+            minimum (int): The lowest valid value.
+
+        Raises:
+            TypeError: If the column does not hold integers.
+            ValueError: If some value is lower than the minimum.
+
+        Returns:
+            np.ndarray: The validated column.
+        """
+
+        values = np.asarray(values)
+
+        if values.ndim != 1:
+            raise ValueError(f"{label} should be a one-dimensional column.")
+
+        if len(values) > 0 and values.dtype.kind not in "iu":
+            raise TypeError(
+                f"{label} should be an integer. Got {values.dtype} instead."
+            )
+
+        if len(values) > 0 and values.min() < minimum:
+            raise ValueError(
+                f"{label} should be at least {minimum}. Got {values.min()} instead."
+            )
+
+        return values.astype(np.int64, copy=False)
+
+    @property
+    def names(self) -> list[str]:
+        """list[str]: The name of each process."""
+
+        if self._names is None:
+            self._names = [f"P{index + 1}" for index in range(len(self))]
+
+        return self._names
+
+    def name(self, index: int) -> str:
+        """Returns the name of a process.
+
+        Args:
+            index (int): The index of the process.
+
+        Returns:
+            str: The name of the process.
+        """
+
+        if self._names is None:
+            return f"P{index + 1}"
+
+        return self._names[index]
+
+    def bind(self, processes: list):
+        """Makes the processes views of the table rows.
+
+        Args:
+            processes (list[Process]): The processes of the table, in row order.
+        """
+
+        for index, process in enumerate(processes):
+            process._table = self
+            process._index = index
+
+    def reset(self):
+        """Resets the processes for scheduling."""
+
+        self.conclusion_time[:] = self.arrival_time + self.execution_time
+        self.enqueue_time[:] = self.arrival_time
+        self.remaining_execution_time[:] = self.execution_time
+        self.quantum_progress[:] = 0
+        self.status[:] = READY
+
+    def append(self, process):
+        """Adds a process to the table.
+
+        The process becomes a view of the new row. Every column is copied, so
+        building a large table this way is slow.
+
+        Args:
+            process (Process): The process to add.
+        """
+
+        index = len(self)
+        names = self.names
+        row = {column: getattr(process, column) for column in self.columns}
+        row["status"] = process._table.status[process._index]
+
+        for column in self.columns:
+            setattr(self, column, np.append(getattr(self, column), row[column]))
+
+        names.append(process.name)
+        process._table = self
+        process._index = index
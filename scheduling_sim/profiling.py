@@ -0,0 +1,110 @@
+import time
+from typing import Callable
+
+# Phases of a simulation that are timed when profiling, by the name of the
+# scheduler method that runs them.
+PROFILED_PHASES: dict[str, str] = {
+    "update_processes_statuses": "_update_processes_statuses",
+    "refresh_ready_queue": "_refresh_ready_queue",
+    "determine_current_running_process": "_determine_current_running_process",
+    "skip_steps": "_skip_steps",
+    "report_step_status": "_report_step_status",
+    "conclude_in_closed_form": "_conclude_in_closed_form",
+}
+
+
+class SimulationStats:
+    """Timers and counters of a profiled simulation.
+
+    Schedules concluded in closed form are not simulated step by step, so only
+    the time of that phase and the number of ticks are recorded for them.
+
+    Attributes:
+        phase_times (dict[str, float]): The cumulative time spent in each phase of
+        `PROFILED_PHASES`, in seconds.
+        phase_calls (dict[str, int]): The number of times each phase ran.
+        ticks (int): The number of steps of the schedule, including the skipped
+        ones.
+        dispatches (int): The number of times a process was dispatched to run.
+        preemptions (int): The number of times a running process was interrupted.
+        max_ready_queue_length (int): The most processes in the ready queue at the
+        end of a step.
+
+    Methods:
+        to_dict() -> dict[str,]: Returns the timers and counters as a dict.
+
+    Properties:
+        simulated_steps (int): The number of steps that were fully simulated.
+        total_time (float): The time spent in all phases, in seconds.
+    """
+
+    def __init__(self):
+        self.phase_times: dict[str, float] = {phase: 0.0 for phase in PROFILED_PHASES}
+        self.phase_calls: dict[str, int] = {phase: 0 for phase in PROFILED_PHASES}
+        self.ticks: int = 0
+        self.dispatches: int = 0
+        self.preemptions: int = 0
+        self.max_ready_queue_length: int = 0
+
+    def __repr__(self):
+        return (
+            f"SimulationStats(ticks={self.ticks}, simulated_steps={self.simulated_steps},"
+            f" dispatches={self.dispatches}, preemptions={self.preemptions},"
+            f" total_time={self.total_time:.6f})"
+        )
+
+    @property
+    def simulated_steps(self) -> int:
+        """int: The number of steps that were fully simulated."""
+
+        return self.phase_calls["update_processes_statuses"]
+
+    @property
+    def total_time(self) -> float:
+        """float: The time spent in all phases, in seconds."""
+
+        return sum(self.phase_times.values())
+
+    def to_dict(self) -> dict[str,]:
+        """Returns the timers and counters as a dict.
+
+        Returns:
+            dict[str,]: The counters, and the time and calls of each phase.
+        """
+
+        return {
+            "ticks": self.ticks,
+            "simulated_steps": self.simulated_steps,
+            "dispatches": self.dispatches,
+            "preemptions": self.preemptions,
+            "max_ready_queue_length": self.max_ready_queue_length,
+            "phase_times": dict(self.phase_times),
+            "phase_calls": dict(self.phase_calls),
+        }
+
+
+def profile_phase(stats: SimulationStats, phase: str, method: Callable) -> Callable:
+    """Wraps a phase of a simulation so its calls are timed and counted.
+
+    Args:
+        stats (SimulationStats): The stats the phase is accounted in.
+        phase (str): The name of the phase.
+        method (Callable): The bound method that runs the phase.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+
+    clock = time.perf_counter
+    phase_times = stats.phase_times
+    phase_calls = stats.phase_calls
+
+    def profiled_phase(*args):
+        start = clock()
+        result = method(*args)
+        phase_times[phase] += clock() - start
+        phase_calls[phase] += 1
+
+        return result
+
+    return profiled_phase
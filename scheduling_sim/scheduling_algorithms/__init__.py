@@ -1,4 +1,5 @@
 from .fcfs import FirstComeFirstServeScheduler
+from .mlfq import MultilevelFeedbackQueueScheduler
 from .prioc import PriorityCooperativeScheduler
 from .priop import PriorityPreemptiveScheduler
 from .rr import RoundRobinScheduler
@@ -0,0 +1,144 @@
+import heapq
+
+import numpy as np
+
+
+def first_come_first_serve_start_times(
+    arrival_time: np.ndarray, execution_time: np.ndarray, order: np.ndarray = None
+) -> np.ndarray:
+    """Computes when each process starts to run under First Come First Serve.
+
+    Processes run in order of arrival, ties being broken by their position. Each
+    process starts when it arrives or when the previous one concludes, whichever
+    comes last, which has a closed form over prefix sums.
+
+    Args:
+        arrival_time (np.ndarray): The arrival time of each process.
+        execution_time (np.ndarray): The execution time of each process.
+        order (np.ndarray, optional): The indexes of the processes sorted by
+        arrival time, if already known.
+
+    Returns:
+        np.ndarray: The start time of each process.
+    """
+
+    if order is None:
+        order = np.argsort(arrival_time, kind="stable")
+    sorted_arrival_time = arrival_time[order]
+    sorted_execution_time = execution_time[order]
+
+    # execution time of all processes that run before each one
+    previous_execution_time = np.cumsum(sorted_execution_time) - sorted_execution_time
+    idle_time = np.maximum.accumulate(sorted_arrival_time - previous_execution_time)
+
+    start_time = np.empty_like(arrival_time)
+    start_time[order] = previous_execution_time + idle_time
+
+    return start_time
+
+
+def non_preemptive_start_times(
+    arrival_time: np.ndarray,
+    execution_time: np.ndarray,
+    keys: np.ndarray,
+    order: np.ndarray = None,
+) -> np.ndarray:
+    """Computes when each process starts to run under a non-preemptive policy.
+
+    Whenever the processor is free, the waiting process with the lowest key runs
+    to completion. Ties are broken by arrival time and then by position, which is
+    the order of the schedulers' ready queues.
+
+    The processes are dispatched one at a time from a heap until the last one
+    arrives. The processes still waiting then run back to back in key order,
+    which takes a single sort, so overloaded workloads, in which most processes
+    are still waiting after the last arrival, are mostly computed by NumPy.
+
+    Args:
+        arrival_time (np.ndarray): The arrival time of each process.
+        execution_time (np.ndarray): The execution time of each process.
+        keys (np.ndarray): The policy key of each process.
+        order (np.ndarray, optional): The indexes of the processes sorted by
+        arrival time, if already known.
+
+    Returns:
+        np.ndarray: The start time of each process.
+    """
+
+    number_of_processes = len(arrival_time)
+    if order is None:
+        order = np.argsort(arrival_time, kind="stable")
+    sorted_arrival_time = arrival_time[order].tolist()
+    sorted_execution_time = execution_time[order].tolist()
+
+    # the position in arrival order breaks ties, so each heap entry is a single
+    # integer that sorts by key first. Entries are built by NumPy unless they
+    # could overflow 64-bit integers
+    sorted_keys = keys[order]
+    fits_in_int64 = (int(np.abs(sorted_keys).max(initial=0)) + 1) * max(
+        number_of_processes, 1
+    ) < 2**63
+
+    if fits_in_int64:
+        entries = (
+            sorted_keys.astype(np.int64) * number_of_processes
+            + np.arange(number_of_processes)
+        ).tolist()
+    else:
+        entries = [
+            key * number_of_processes + position
+            for position, key in enumerate(sorted_keys.tolist())
+        ]
+
+    # a sentinel arrival saves a bounds check per arrival
+    sorted_arrival_time.append(float("inf"))
+
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    ready_queue = []
+    sorted_start_time = [0] * number_of_processes
+    time = 0
+    next_arrival = 0
+
+    for _ in range(number_of_processes):
+        if next_arrival == number_of_processes:
+            break
+
+        if not ready_queue:
+            if sorted_arrival_time[next_arrival] > time:
+                time = sorted_arrival_time[next_arrival]
+
+            # a process that arrives alone to a free processor runs right away
+            if sorted_arrival_time[next_arrival + 1] > time:
+                sorted_start_time[next_arrival] = time
+                time += sorted_execution_time[next_arrival]
+                next_arrival += 1
+                continue
+
+        while sorted_arrival_time[next_arrival] <= time:
+            heappush(ready_queue, entries[next_arrival])
+            next_arrival += 1
+
+        position = heappop(ready_queue) % number_of_processes
+        sorted_start_time[position] = time
+        time += sorted_execution_time[position]
+
+    sorted_start_time = np.array(sorted_start_time, dtype=arrival_time.dtype)
+
+    # the processes still waiting after the last arrival run in key order
+    if len(ready_queue) > 0:
+        if fits_in_int64:
+            waiting_positions = np.sort(np.array(ready_queue)) % number_of_processes
+        else:
+            ready_queue.sort()
+            waiting_positions = [entry % number_of_processes for entry in ready_queue]
+
+        waiting_execution_time = execution_time[order[waiting_positions]]
+        sorted_start_time[waiting_positions] = (
+            time + np.cumsum(waiting_execution_time) - waiting_execution_time
+        )
+
+    start_time = np.empty_like(arrival_time)
+    start_time[order] = sorted_start_time
+
+    return start_time
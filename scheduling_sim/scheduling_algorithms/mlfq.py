@@ -0,0 +1,344 @@
+import numpy as np
+
+from scheduling_sim.process import Process
+from scheduling_sim.process_table import WAITING
+from scheduling_sim.scheduling_algorithms.ready_queue import MultilevelReadyQueue
+from scheduling_sim.scheduling_algorithms.scheduling_algorithm import (
+    SchedulingAlgorithm,
+)
+
+
+class MultilevelFeedbackQueueScheduler(SchedulingAlgorithm):
+    """Multilevel Feedback Queue Scheduler
+
+    This class represents a scheduling algorithm that keeps a queue of waiting
+    processes for each level, and always runs a process of the highest level that
+    has one, level 0 being the highest. Processes arrive at level 0 and run in
+    a circular manner within their level, for a quantum that depends on the
+    level. A process that uses its whole quantum is moved one level down and
+    waits again on the same step, so short processes finish in the high levels
+    while long ones sink. A running process is interrupted when a process of a
+    higher level starts to wait, and keeps the progress of its quantum until it
+    runs again.
+
+    With a boost interval, every process moves back to level 0 with a new
+    quantum periodically, so the processes of the lowest levels do not starve.
+    The levels are only updated when a process is pushed, popped or dispatched,
+    so a boost takes constant time, whatever the number of waiting processes.
+
+    Attributes:
+        algorithm_name (str): The name of the scheduling algorithm.
+        preemptive (bool): Whether the algorithm interrupts running processes.
+
+    Methods:
+        reset(): Resets the scheduling algorithm and processes to their initial
+        states.
+        add_process(process: Process): Adds a process to the scheduling algorithm.
+        run() -> pd.DataFrame: Executes the scheduling algorithm.
+        run_iter(batch_size: int = 1): Executes the scheduling algorithm, yielding
+        the report as it is built.
+        run_segments() -> pd.DataFrame: Executes the scheduling algorithm, reporting
+        the intervals in which each process kept its status.
+        advance(until: int) -> bool: Simulates the schedule up to the given step.
+        fork(algorithm: type = None, **params) -> SchedulingAlgorithm: Copies the
+        simulation, so it can go on under another algorithm or other parameters.
+        has_higher_level_process_waiting() -> bool: Checks if a process of a higher
+        level is waiting to execute.
+
+    Properties:
+        number_of_processes (int): The number of processes in the scheduling algorithm.
+        total_execution_time (int): The total execution time of all processes.
+        average_turnaround_time (float): The average turnaround time of all processes.
+        average_wait_time (float): The average wait time of all processes.
+        results (SchedulingResult): The outcome of the last simulation.
+        current_time (int): The next step to be simulated.
+        ready_queue_is_empty (bool): Whether or not the ready queue has no Process
+        objects.
+        is_executing_a_process (bool): Whether or not there is a process running
+        at the moment.
+        quantum_lengths (tuple[int]): The length of the quantum of each level.
+        boost_interval (int): The number of steps between boosts.
+    """
+
+    algorithm_name: str = "Multilevel Feedback Queue Scheduler"
+    preemptive: bool = True
+    _quantum_lengths: tuple[int] = (2, 4, 8)
+    _boost_interval: int = None
+
+    def __init__(
+        self,
+        processes: list[Process] = None,
+        quantum_lengths: tuple[int] = (2, 4, 8),
+        boost_interval: int = None,
+    ):
+        super().__init__(processes)
+        self.quantum_lengths = quantum_lengths
+        self.boost_interval = boost_interval
+
+    @property
+    def quantum_lengths(self) -> tuple[int]:
+        """tuple[int]: The length of the quantum of each level, from the highest
+        level to the lowest."""
+
+        return self._quantum_lengths
+
+    @quantum_lengths.setter
+    def quantum_lengths(self, value: tuple[int]):
+        """The length of the quantum of each level.
+
+        Args:
+            value (tuple[int]): The length of the quantum of each level, from the
+            highest level to the lowest.
+
+        Raises:
+            TypeError: If the value is not a sequence of integers.
+            ValueError: If there are no levels, or a quantum length is less than 1.
+        """
+
+        if type(value) not in (list, tuple) or any(
+            type(quantum_length) != int for quantum_length in value
+        ):
+            raise TypeError(
+                f"Quantum lengths should be a sequence of integers. Got {value!r} instead."
+            )
+
+        if len(value) == 0:
+            raise ValueError("Quantum lengths should have at least one level.")
+
+        if min(value) < 1:
+            raise ValueError(
+                f"Quantum lengths should be higher than 0. Got {min(value)} instead."
+            )
+
+        self._quantum_lengths = tuple(value)
+        self._invalidate_results()
+
+    @property
+    def boost_interval(self) -> int:
+        """int: The number of steps between boosts, or None if processes are never
+        boosted."""
+
+        return self._boost_interval
+
+    @boost_interval.setter
+    def boost_interval(self, value: int):
+        """The number of steps between boosts.
+
+        Args:
+            value (int): The number of steps between boosts, or None to never
+            boost processes.
+
+        Raises:
+            TypeError: If the value is not an integer or None.
+            ValueError: If the value is less than 1.
+        """
+
+        if value != None and type(value) != int:
+            raise TypeError(
+                f"Boost interval should be an integer. Got {type(value)} instead."
+            )
+
+        if value != None and value < 1:
+            raise ValueError(
+                f"Boost interval should be higher than 0. Got {value} instead."
+            )
+
+        self._boost_interval = value
+        self._invalidate_results()
+
+    def reset(self):
+        table = self._get_process_table()
+
+        # the level of each process, which only holds since the boost it was
+        # set after, and the number of boosts so far
+        self._levels = np.zeros(len(table), dtype=np.int64)
+        self._level_boosts = np.zeros(len(table), dtype=np.int64)
+        self._queue_level = memoryview(self._levels)
+        self._level_boost = memoryview(self._level_boosts)
+        self._boosts = 0
+
+        super().reset()
+
+        if self._boost_interval == None:
+            self._next_boost = None
+        else:
+            self._next_boost = self._start_time + self._boost_interval
+
+    def has_higher_level_process_waiting(self) -> bool:
+        """Checks if a process of a higher level is waiting to execute.
+
+        Returns:
+            bool: True if there is a process of a higher level than the running one
+            in the ready queue; False otherwise.
+        """
+
+        if (not self.is_executing_a_process) or self.ready_queue_is_empty:
+            return False
+
+        return self._ready_queue.top_level < self._level(self._current_running_index)
+
+    def _level(self, index: int) -> int:
+        """Returns the current level of a process.
+
+        Args:
+            index (int): The index of the process.
+
+        Returns:
+            int: The level of the process, which is 0 if it was set before the
+            last boost.
+        """
+
+        if self._level_boost[index] != self._boosts:
+            return 0
+
+        return self._queue_level[index]
+
+    def _set_level(self, index: int, level: int):
+        """Sets the level of a process.
+
+        Args:
+            index (int): The index of the process.
+            level (int): The new level of the process.
+        """
+
+        self._queue_level[index] = level
+        self._level_boost[index] = self._boosts
+
+    def _boost(self, step: int):
+        """Moves every process to level 0 with a new quantum.
+
+        The waiting processes only get their new quantum when they are dispatched
+        again.
+
+        Args:
+            step (int): The step of the boost.
+        """
+
+        self._boosts += 1
+        self._ready_queue.boost()
+
+        if self.is_executing_a_process:
+            self._set_level(self._current_running_index, 0)
+            self._quantum_progress[self._current_running_index] = 0
+
+        elapsed_time = step - self._start_time
+        self._next_boost = (
+            step + self._boost_interval - elapsed_time % self._boost_interval
+        )
+
+    def _simulate_scheduling_step(self, step: int):
+        # boosts are skipped while no process waits or runs, since they would
+        # change nothing
+        if self._next_boost != None and step >= self._next_boost:
+            self._boost(step)
+
+        super()._simulate_scheduling_step(step)
+
+        if self.is_executing_a_process:
+            self._quantum_progress[self._current_running_index] += 1
+
+    def _next_event_step(self, step: int) -> int:
+        next_step = super()._next_event_step(step)
+
+        if not self.is_executing_a_process:
+            return next_step
+
+        # the running process is moved down once its quantum progress reaches
+        # the quantum length of its level
+        index = self._current_running_index
+        quantum_length = self._quantum_lengths[self._level(index)]
+        quantum_progress = self._quantum_progress[index]
+
+        if quantum_progress <= quantum_length:
+            quantum_expiry_step = step + quantum_length - quantum_progress + 1
+            next_step = min(next_step, quantum_expiry_step)
+
+        if self._next_boost != None:
+            next_step = min(next_step, self._next_boost)
+
+        return next_step
+
+    def _skip_steps(self, steps: int):
+        super()._skip_steps(steps)
+
+        if self.is_executing_a_process:
+            self._quantum_progress[self._current_running_index] += steps
+
+    def _determine_current_running_process(self):
+        if self.is_executing_a_process:
+            index = self._current_running_index
+            level = self._level(index)
+
+            # processes forked from other algorithms may have run for longer
+            # than their quantum
+            if self._quantum_progress[index] >= self._quantum_lengths[level]:
+                self._set_level(index, min(level + 1, len(self._quantum_lengths) - 1))
+                self._quantum_progress[index] = 0
+                self._interrupt_current_running_process()
+                self._requeue_interrupted_process()
+            elif self.has_higher_level_process_waiting():
+                self._interrupt_current_running_process()
+
+        super()._determine_current_running_process()
+
+        # processes boosted while they waited start a new quantum when they are
+        # dispatched
+        if self.is_executing_a_process:
+            index = self._current_running_index
+
+            if self._level_boost[index] != self._boosts:
+                self._set_level(index, 0)
+                self._quantum_progress[index] = 0
+
+    def _requeue_interrupted_process(self):
+        """Pushes the process interrupted last back into the ready queue.
+
+        Unlike processes interrupted by a higher level one, a process moved down
+        starts to wait on the same step, so it runs again right away when no
+        other process is waiting.
+        """
+
+        index = self._interrupted_processes.pop()
+
+        self._status[index] = WAITING
+        self._enqueue_time[index] = self._time
+        self._ready_queue.push(index, self._time)
+
+    def _checkpoint_state(self) -> tuple[dict[str,], dict[str, np.ndarray]]:
+        scalars, arrays = super()._checkpoint_state()
+
+        scalars["boosts"] = self._boosts
+        scalars["next_boost"] = self._next_boost
+        arrays["queue_level"] = self._levels
+        arrays["level_boost"] = self._level_boosts
+
+        return scalars, arrays
+
+    def _restore_checkpoint_state(
+        self, scalars: dict[str,], arrays: dict[str, np.ndarray]
+    ):
+        super()._restore_checkpoint_state(scalars, arrays)
+
+        # states of other algorithms have every process at level 0
+        if "queue_level" not in arrays:
+            return
+
+        self._levels[:] = arrays["queue_level"]
+        self._level_boosts[:] = arrays["level_boost"]
+        self._boosts = scalars["boosts"]
+        self._next_boost = scalars["next_boost"]
+
+        # the ready queue is rebuilt in its own order, once the levels are known
+        self._ready_queue = self._create_ready_queue()
+
+        for index in arrays["ready_queue"].tolist():
+            self._ready_queue.push(index, self._enqueue_time[index])
+
+    def _create_ready_queue(self) -> MultilevelReadyQueue:
+        """Creates the ready queue used by the scheduling algorithm.
+
+        Returns:
+            MultilevelReadyQueue: A queue for each level.
+        """
+
+        return MultilevelReadyQueue(len(self._quantum_lengths), self._level)
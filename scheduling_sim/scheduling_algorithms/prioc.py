@@ -1,4 +1,7 @@
+import numpy as np
+
 from scheduling_sim.process import Process
+from scheduling_sim.scheduling_algorithms.ready_queue import PriorityReadyQueue
 from scheduling_sim.scheduling_algorithms.scheduling_algorithm import (
     SchedulingAlgorithm,
 )
@@ -10,36 +13,60 @@ class PriorityCooperativeScheduler(SchedulingAlgorithm):
     This class represents a scheduling algorithm that executes processes in the
     order of their priority level. Non-preemptive.
 
+    With an aging interval, a waiting process gains one priority level for every
+    aging interval it waits, including fractions of a level, so low-priority
+    processes are not starved by a stream of high-priority ones. The priority a
+    process has gained is derived from the step it started to wait, so the ready
+    queue is ordered once per push, and aging never takes a pass over the
+    waiting processes. A dispatched process runs at its own priority level.
+
     Attributes:
         algorithm_name (str): The name of the scheduling algorithm.
+        preemptive (bool): Whether the algorithm interrupts running processes.
 
     Methods:
         reset(): Resets the scheduling algorithm and processes to their initial
         states.
         add_process(process: Process): Adds a process to the scheduling algorithm.
         run() -> pd.DataFrame: Executes the scheduling algorithm.
+        run_iter(batch_size: int = 1): Executes the scheduling algorithm, yielding
+        the report as it is built.
+        run_segments() -> pd.DataFrame: Executes the scheduling algorithm, reporting
+        the intervals in which each process kept its status.
+        advance(until: int) -> bool: Simulates the schedule up to the given step.
+        fork(algorithm: type = None, **params) -> SchedulingAlgorithm: Copies the
+        simulation, so it can go on under another algorithm or other parameters.
 
     Properties:
         number_of_processes (int): The number of processes in the scheduling algorithm.
         total_execution_time (int): The total execution time of all processes.
         average_turnaround_time (float): The average turnaround time of all processes.
         average_wait_time (float): The average wait time of all processes.
+        results (SchedulingResult): The outcome of the last simulation.
+        current_time (int): The next step to be simulated.
         ready_queue_is_empty (bool): Whether or not the ready queue has no Process
         objects.
         is_executing_a_process (bool): Whether or not there is a process running
         at the moment.
         use_reverse_priority (bool): If True, higher priority levels indicate higher
         priority; otherwise, they indicate lower priority.
+        aging_interval (int): The number of steps a waiting process takes to gain
+        one priority level.
     """
 
     _use_reverse_priority: bool = True
+    _aging_interval: int = None
     algorithm_name: str = "Priority Cooperative Scheduler"
 
     def __init__(
-        self, processes: list[Process] = None, use_reverse_priority: bool = True
+        self,
+        processes: list[Process] = None,
+        use_reverse_priority: bool = True,
+        aging_interval: int = None,
     ):
         super().__init__(processes)
         self.use_reverse_priority = use_reverse_priority
+        self.aging_interval = aging_interval
 
     @property
     def use_reverse_priority(self) -> bool:
@@ -65,19 +92,81 @@ class PriorityCooperativeScheduler(SchedulingAlgorithm):
             )
 
         self._use_reverse_priority = value
+        self._invalidate_results()
+
+    @property
+    def aging_interval(self) -> int:
+        """int: The number of steps a waiting process takes to gain one priority
+        level, or None if processes do not age."""
+
+        return self._aging_interval
+
+    @aging_interval.setter
+    def aging_interval(self, value: int):
+        """The number of steps a waiting process takes to gain one priority level.
+
+        Args:
+            value (int): The number of steps a waiting process takes to gain one
+            priority level, or None to disable aging.
+
+        Raises:
+            TypeError: If the value is not an integer or None.
+            ValueError: If the value is less than 1.
+        """
+
+        if value != None and type(value) != int:
+            raise TypeError(
+                f"Aging interval should be an integer. Got {type(value)} instead."
+            )
 
-    def _refresh_ready_queue(self):
-        """Refresh the ready queue based on waiting processes.
+        if value != None and value < 1:
+            raise ValueError(
+                f"Aging interval should be higher than 0. Got {value} instead."
+            )
+
+        self._aging_interval = value
+        self._invalidate_results()
+
+    def _policy_keys(self) -> np.ndarray:
+        if self.use_reverse_priority:
+            keys = -self._table.priority_level
+        else:
+            keys = self._table.priority_level
+
+        # without preemption, processes only wait once, from their arrival
+        if self.aging_interval != None:
+            keys = keys * self.aging_interval + self._table.arrival_time
+
+        return keys
+
+    def _create_ready_queue(self) -> PriorityReadyQueue:
+        """Creates the ready queue used by the scheduling algorithm.
 
-        This method updates the ready queue by selecting processes with WAITING
-        status from the list of all processes in the scheduling algorithm. The queue
-        is ordered according to their priority level.
+        With aging, processes are ordered by their priority level scaled by the
+        aging interval, plus the step they started to wait. The difference
+        between the keys of two waiting processes is the difference between the
+        priority they have gained so far, scaled by the aging interval, so the
+        order of the queue holds while they wait.
+
+        Returns:
+            PriorityReadyQueue: A queue ordered according to the priority level.
         """
 
-        super()._refresh_ready_queue()
+        aging_interval = self.aging_interval
+
+        if aging_interval != None and self.use_reverse_priority:
+            return PriorityReadyQueue(
+                key=lambda x: self._enqueue_time[x]
+                - self._priority_level[x] * aging_interval
+            )
+
+        if aging_interval != None:
+            return PriorityReadyQueue(
+                key=lambda x: self._priority_level[x] * aging_interval
+                + self._enqueue_time[x]
+            )
+
+        if self.use_reverse_priority:
+            return PriorityReadyQueue(key=lambda x: -self._priority_level[x])
 
-        self._ready_queue = sorted(
-            self._ready_queue,
-            key=lambda x: x.priority_level,
-            reverse=self.use_reverse_priority,
-        )
+        return PriorityReadyQueue(key=lambda x: self._priority_level[x])
@@ -8,14 +8,28 @@ class PriorityPreemptiveScheduler(PriorityCooperativeScheduler):
     based on their priority levels with preemption. Higher-priority processes
     can preempt lower-priority ones if they become available.
 
+    With an aging interval, waiting processes gain priority as in
+    `PriorityCooperativeScheduler`, and the running process is preempted once a
+    waiting one has become a whole level more prioritary than it. The step in
+    which that happens is known when the process starts to wait, so it is a
+    scheduling event as any arrival.
+
     Attributes:
         algorithm_name (str): The name of the scheduling algorithm.
+        preemptive (bool): Whether the algorithm interrupts running processes.
 
     Methods:
         reset(): Resets the scheduling algorithm and processes to their initial
         states.
         add_process(process: Process): Adds a process to the scheduling algorithm.
         run() -> pd.DataFrame: Executes the scheduling algorithm.
+        run_iter(batch_size: int = 1): Executes the scheduling algorithm, yielding
+        the report as it is built.
+        run_segments() -> pd.DataFrame: Executes the scheduling algorithm, reporting
+        the intervals in which each process kept its status.
+        advance(until: int) -> bool: Simulates the schedule up to the given step.
+        fork(algorithm: type = None, **params) -> SchedulingAlgorithm: Copies the
+        simulation, so it can go on under another algorithm or other parameters.
         has_higher_priority_process_waiting() -> bool: Checks if a higher-priority
         process is waiting to execute.
 
@@ -24,15 +38,20 @@ class PriorityPreemptiveScheduler(PriorityCooperativeScheduler):
         total_execution_time (int): The total execution time of all processes.
         average_turnaround_time (float): The average turnaround time of all processes.
         average_wait_time (float): The average wait time of all processes.
+        results (SchedulingResult): The outcome of the last simulation.
+        current_time (int): The next step to be simulated.
         ready_queue_is_empty (bool): Whether or not the ready queue has no Process
         objects.
         is_executing_a_process (bool): Whether or not there is a process running
         at the moment.
         use_reverse_priority (bool): If True, higher priority levels indicate higher
         priority; otherwise, they indicate lower priority.
+        aging_interval (int): The number of steps a waiting process takes to gain
+        one priority level.
     """
 
     algorithm_name: str = "Priority Preemptive Scheduler"
+    preemptive: bool = True
 
     def has_higher_priority_process_waiting(self) -> bool:
         """Checks if a higher-priority process is waiting to execute.
@@ -45,25 +64,66 @@ class PriorityPreemptiveScheduler(PriorityCooperativeScheduler):
         if (not self.is_executing_a_process) or self.ready_queue_is_empty:
             return False
 
-        most_prioritary_waiting_process = self._ready_queue[0]
+        if self.aging_interval != None:
+            return self._time >= self._aged_preemption_step()
+
+        most_prioritary_waiting_process = self._ready_queue.peek()
 
         if self.use_reverse_priority:
             return (
-                self._current_running_process.priority_level
-                < most_prioritary_waiting_process.priority_level
+                self._priority_level[self._current_running_index]
+                < self._priority_level[most_prioritary_waiting_process]
             )
         else:
             return (
-                self._current_running_process.priority_level
-                > most_prioritary_waiting_process.priority_level
+                self._priority_level[self._current_running_index]
+                > self._priority_level[most_prioritary_waiting_process]
             )
 
+    def _aged_preemption_step(self) -> int:
+        """Determines the step in which the most prioritary waiting process becomes
+        a whole level more prioritary than the running process, with aging.
+
+        The first process of the ready queue has gained the most priority, so it
+        is the first to get ahead of the running process.
+
+        Returns:
+            int: The step of the preemption, which may already have passed.
+        """
+
+        waiting_index = self._ready_queue.peek()
+        waiting_priority_level = self._priority_level[waiting_index]
+        running_priority_level = self._priority_level[self._current_running_index]
+
+        # the levels the waiting process must gain to match the running one
+        if self.use_reverse_priority:
+            levels_behind = running_priority_level - waiting_priority_level
+        else:
+            levels_behind = waiting_priority_level - running_priority_level
+
+        return self._enqueue_time[waiting_index] + (
+            (levels_behind + 1) * self.aging_interval
+        )
+
+    def _next_event_step(self, step: int) -> int:
+        next_step = super()._next_event_step(step)
+
+        # a waiting process may get ahead of the running one between arrivals
+        if (
+            self.aging_interval != None
+            and self.is_executing_a_process
+            and (not self.ready_queue_is_empty)
+        ):
+            next_step = min(next_step, max(self._aged_preemption_step(), step + 1))
+
+        return next_step
+
     def _determine_current_running_process(self):
         if (
             self.is_executing_a_process
             and (not self.ready_queue_is_empty)
             and self.has_higher_priority_process_waiting()
         ):
-            self._current_running_process.interrupt()
+            self._interrupt_current_running_process()
 
         super()._determine_current_running_process()
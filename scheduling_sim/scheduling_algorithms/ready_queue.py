@@ -0,0 +1,167 @@
+import heapq
+from collections import deque
+from typing import Callable
+
+
+class ReadyQueue:
+    """First-in, first-out queue of waiting processes.
+
+    The queue holds the indexes of the waiting processes. Processes are expected
+    to be pushed in the order they were enqueued, ties being broken by their
+    position in the scheduler's process list.
+
+    Methods:
+        push(index: int, enqueue_time: int): Adds a process to the queue.
+        pop() -> int: Removes and returns the first process of the queue.
+        peek() -> int: Returns the first process of the queue.
+    """
+
+    def __init__(self):
+        self._queue: deque[int] = deque()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __iter__(self):
+        return iter(self._queue)
+
+    def push(self, index: int, enqueue_time: int):
+        """Adds a process to the queue.
+
+        Args:
+            index (int): The index of the process.
+            enqueue_time (int): The time when the process was enqueued.
+        """
+
+        self._queue.append(index)
+
+    def pop(self) -> int:
+        """Removes and returns the first process of the queue.
+
+        Returns:
+            int: The index of the process.
+        """
+
+        return self._queue.popleft()
+
+    def peek(self) -> int:
+        """Returns the first process of the queue without removing it.
+
+        Returns:
+            int: The index of the process.
+        """
+
+        return self._queue[0]
+
+
+class PriorityReadyQueue(ReadyQueue):
+    """Heap of waiting processes, ordered by a scheduling policy key.
+
+    Processes with the same key are kept in first-in, first-out order: by the
+    time they were enqueued and then by their position in the scheduler's process
+    list. Pushing and popping a process takes O(log N) time.
+
+    Methods:
+        push(index: int, enqueue_time: int): Adds a process to the queue.
+        pop() -> int: Removes and returns the first process of the queue.
+        peek() -> int: Returns the first process of the queue.
+    """
+
+    def __init__(self, key: Callable[[int], int]):
+        self._key = key
+        self._heap: list[tuple[int, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self):
+        return (index for _, _, index in sorted(self._heap))
+
+    def push(self, index: int, enqueue_time: int):
+        heapq.heappush(self._heap, (self._key(index), enqueue_time, index))
+
+    def pop(self) -> int:
+        return heapq.heappop(self._heap)[2]
+
+    def peek(self) -> int:
+        return self._heap[0][2]
+
+
+class MultilevelReadyQueue(ReadyQueue):
+    """First-in, first-out queues of waiting processes, one per level.
+
+    Processes are popped from the highest level that is not empty, level 0
+    being the highest. Each level is kept as a chain of queues, so a boost moves
+    every process to level 0 by chaining the queues of the lower levels after
+    it, without touching the processes. Pushing, popping and boosting take
+    constant time for a fixed number of levels.
+
+    Methods:
+        push(index: int, enqueue_time: int): Adds a process to the queue of its
+        level.
+        pop() -> int: Removes and returns the first process of the highest level.
+        peek() -> int: Returns the first process of the highest level.
+        boost(): Moves every process to level 0.
+
+    Properties:
+        top_level (int): The highest level with waiting processes.
+    """
+
+    def __init__(self, levels: int, level: Callable[[int], int]):
+        self._level = level
+        self._queues: list[deque[deque[int]]] = [deque() for _ in range(levels)]
+        self._lengths: list[int] = [0] * levels
+
+    def __len__(self) -> int:
+        return sum(self._lengths)
+
+    def __iter__(self):
+        return (index for queue in self._queues for chain in queue for index in chain)
+
+    @property
+    def top_level(self) -> int:
+        """int: The highest level with waiting processes, or None if there are
+        none."""
+
+        for level, length in enumerate(self._lengths):
+            if length > 0:
+                return level
+
+        return None
+
+    def push(self, index: int, enqueue_time: int):
+        level = self._level(index)
+        queue = self._queues[level]
+
+        if len(queue) == 0:
+            queue.append(deque())
+
+        queue[-1].append(index)
+        self._lengths[level] += 1
+
+    def pop(self) -> int:
+        level = self.top_level
+        queue = self._queues[level]
+        index = queue[0].popleft()
+
+        if len(queue[0]) == 0:
+            queue.popleft()
+
+        self._lengths[level] -= 1
+
+        return index
+
+    def peek(self) -> int:
+        return self._queues[self.top_level][0][0]
+
+    def boost(self):
+        """Moves every process to level 0, after the processes already there and
+        in the order of their levels."""
+
+        top_queue = self._queues[0]
+
+        for level in range(1, len(self._queues)):
+            top_queue.extend(self._queues[level])
+            self._queues[level] = deque()
+
+        self._lengths = [sum(self._lengths)] + [0] * (len(self._lengths) - 1)
@@ -13,18 +13,28 @@ class RoundRobinScheduler(SchedulingAlgorithm):
 
     Attributes:
         algorithm_name (str): The name of the scheduling algorithm.
+        preemptive (bool): Whether the algorithm interrupts running processes.
 
     Methods:
         reset(): Resets the scheduling algorithm and processes to their initial
         states.
         add_process(process: Process): Adds a process to the scheduling algorithm.
         run() -> pd.DataFrame: Executes the scheduling algorithm.
+        run_iter(batch_size: int = 1): Executes the scheduling algorithm, yielding
+        the report as it is built.
+        run_segments() -> pd.DataFrame: Executes the scheduling algorithm, reporting
+        the intervals in which each process kept its status.
+        advance(until: int) -> bool: Simulates the schedule up to the given step.
+        fork(algorithm: type = None, **params) -> SchedulingAlgorithm: Copies the
+        simulation, so it can go on under another algorithm or other parameters.
 
     Properties:
         number_of_processes (int): The number of processes in the scheduling algorithm.
         total_execution_time (int): The total execution time of all processes.
         average_turnaround_time (float): The average turnaround time of all processes.
         average_wait_time (float): The average wait time of all processes.
+        results (SchedulingResult): The outcome of the last simulation.
+        current_time (int): The next step to be simulated.
         ready_queue_is_empty (bool): Whether or not the ready queue has no Process
         objects.
         is_executing_a_process (bool): Whether or not there is a process running
@@ -33,6 +43,7 @@ class RoundRobinScheduler(SchedulingAlgorithm):
     """
 
     algorithm_name: str = "Round Robin Scheduler"
+    preemptive: bool = True
     _quantum_length: int = 2
 
     def __init__(self, processes: list[Process] = None, quantum_length: int = 2):
@@ -68,17 +79,39 @@ class RoundRobinScheduler(SchedulingAlgorithm):
             )
 
         self._quantum_length = value
+        self._invalidate_results()
 
     def _simulate_scheduling_step(self, step: int):
         super()._simulate_scheduling_step(step)
-        self._current_running_process.quantum_progress += 1
+        self._quantum_progress[self._current_running_index] += 1
+
+    def _next_event_step(self, step: int) -> int:
+        next_step = super()._next_event_step(step)
+
+        # the running process is interrupted once its quantum progress reaches
+        # the quantum length
+        if self.is_executing_a_process:
+            quantum_progress = self._quantum_progress[self._current_running_index]
+
+            if quantum_progress <= self.quantum_length:
+                quantum_expiry_step = step + self.quantum_length - quantum_progress + 1
+                next_step = min(next_step, quantum_expiry_step)
+
+        return next_step
+
+    def _skip_steps(self, steps: int):
+        super()._skip_steps(steps)
+
+        if self._current_running_index != None:
+            self._quantum_progress[self._current_running_index] += steps
 
     def _determine_current_running_process(self):
         if (
             self.is_executing_a_process
-            and self._current_running_process.quantum_progress == self.quantum_length
+            and self._quantum_progress[self._current_running_index]
+            == self.quantum_length
         ):
-            self._current_running_process.quantum_progress = 0
-            self._current_running_process.interrupt()
+            self._quantum_progress[self._current_running_index] = 0
+            self._interrupt_current_running_process()
 
         super()._determine_current_running_process()
@@ -1,11 +1,37 @@
-import pandas as pd
-
-from scheduling_sim.exceptions import (
-    InvalidProcessQueueError,
-    NoProcessesInQueueError,
-    NoProcessWithArrivalTimeZeroError,
+import inspect
+import sys
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from scheduling_sim.exceptions import InvalidProcessQueueError, NoProcessesInQueueError
+from scheduling_sim.execution_report import (
+    ExecutionReportBuilder,
+    SegmentReportBuilder,
+    concatenate_batches,
+    execution_report_from_batches,
 )
+from scheduling_sim.metrics import MetricsAccumulator, SchedulingResult
 from scheduling_sim.process import Process
+from scheduling_sim.process_table import (
+    INTERRUPTED,
+    RUNNING,
+    TERMINATED,
+    WAITING,
+    ProcessTable,
+)
+from scheduling_sim.profiling import PROFILED_PHASES, SimulationStats, profile_phase
+from scheduling_sim.scheduling_algorithms.closed_form import (
+    first_come_first_serve_start_times,
+    non_preemptive_start_times,
+)
+from scheduling_sim.scheduling_algorithms.ready_queue import ReadyQueue
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Next event step when no event is pending.
+_NO_EVENT: int = sys.maxsize
 
 
 class SchedulingAlgorithm:
@@ -15,8 +41,39 @@ class SchedulingAlgorithm:
     It provides basic functionality for managing processes and ensuring the validity
     of process queues.
 
+    The processes can be given as a list of `Process` objects or as a
+    `ProcessTable`. Either way, the simulation runs on the columns of a process
+    table, and the `Process` objects become views of its rows.
+
+    The simulation is event-driven: only the steps in which a process arrives,
+    concludes, is preempted or is dispatched are fully simulated. The steps in
+    between are skipped in constant time, since the only thing that changes on
+    them is the remaining execution time of the running process. This includes
+    the periods in which the processor is idle, waiting for the next arrival.
+    The schedule starts when the first process arrives and ends on the step in
+    which the last process concludes.
+
+    The result of the last simulation is kept until a process is added or a
+    parameter of the algorithm changes, so the metrics and the execution report
+    are only computed once. Changes made to the processes after they were added
+    are not detected. Non-preemptive algorithms compute their metrics in closed
+    form, without simulating the schedule at all. Other metrics, such as the
+    response time, the processor utilization and the percentiles of the wait
+    and turnaround times, are accumulated while the schedule is simulated.
+
+    When profiling is enabled, every phase of the simulation is timed and the
+    scheduling events are counted, and the stats of the last simulation can be
+    read from `stats`. The phases are only wrapped while profiling, so disabled
+    profiling costs nothing.
+
+    A simulation can also be advanced up to a given step with `advance`, and
+    then saved with `save_checkpoint` and resumed from `load_checkpoint`, even
+    in another process, or forked with `fork` to go on under other algorithms or
+    parameters. Reading `results` concludes the simulation in flight.
+
     Attributes:
         algorithm_name (str): The name of the scheduling algorithm.
+        preemptive (bool): Whether the algorithm interrupts running processes.
         number_of_processes (int): The number of processes in the scheduling algorithm.
         total_execution_time (int): The total execution time of all processes.
 
@@ -25,28 +82,51 @@ class SchedulingAlgorithm:
         states.
         add_process(process: Process): Adds a process to the scheduling algorithm.
         run() -> pd.DataFrame: Executes the scheduling algorithm.
+        run_iter(batch_size: int = 1): Executes the scheduling algorithm, yielding
+        the report as it is built.
+        run_segments() -> pd.DataFrame: Executes the scheduling algorithm, reporting
+        the intervals in which each process kept its status.
+        advance(until: int) -> bool: Simulates the schedule up to the given step.
+        fork(algorithm: type = None, **params) -> SchedulingAlgorithm: Copies the
+        simulation, so it can go on under another algorithm or other parameters.
 
     Properties:
         number_of_processes (int): The number of processes in the scheduling algorithm.
         total_execution_time (int): The total execution time of all processes.
         average_turnaround_time (float): The average turnaround time of all processes.
         average_wait_time (float): The average wait time of all processes.
+        results (SchedulingResult): The outcome of the last simulation.
+        profiling (bool): Whether the simulation is profiled.
+        stats (SimulationStats): The timers and counters of the last profiled
+        simulation.
+        current_time (int): The next step to be simulated.
         ready_queue_is_empty (bool): Whether or not the ready queue has no Process
         objects.
         is_executing_a_process (bool): Whether or not there is a process running
         at the moment.
     """
 
-    _processes: list[Process] = []
-    _ready_queue: list[Process] = []
-    _current_running_process: Process = None
+    _processes: list[Process] | ProcessTable = []
+    _table: ProcessTable = None
+    _ready_queue: ReadyQueue = None
+    _current_running_index: int = None
+    _in_flight: bool = False
+    _profiling: bool = False
+    _stats: SimulationStats = None
 
     algorithm_name: str = "Scheduling Algorithm"
+    preemptive: bool = False
 
-    def __init__(self, processes: list[Process] = None):
+    def __init__(self, processes: list[Process] | ProcessTable = None):
         self._processes: list[Process] = []
-
-        if processes != None:
+        self._table: ProcessTable = None
+        self._results: SchedulingResult = None
+        self._stats: SimulationStats = None
+
+        if isinstance(processes, ProcessTable):
+            self._processes = processes
+            self._table = processes
+        elif processes != None:
             for process in processes:
                 self.add_process(process)
 
@@ -69,27 +149,84 @@ class SchedulingAlgorithm:
         if len(self._processes) == 0:
             return 0
 
-        return sum([process.execution_time for process in self._processes])
+        return int(self._get_process_table().execution_time.sum())
 
     @property
     def average_turnaround_time(self) -> int:
         """int: The average turnaround time of all processes."""
-        self.run()
-
-        total_turnaround_time = sum(
-            [process.turnaround_time for process in self._processes]
-        )
 
-        return total_turnaround_time / len(self._processes)
+        return self.results.average_turnaround_time
 
     @property
     def average_wait_time(self) -> int:
         """int: The average wait time of all processes."""
-        self.run()
 
-        total_wait_time = sum([process.wait_time for process in self._processes])
+        return self.results.average_wait_time
+
+    @property
+    def results(self) -> SchedulingResult:
+        """SchedulingResult: The outcome of the last simulation of the schedule.
+
+        The schedule is simulated if there is no valid result yet. A simulation
+        in flight, advanced or loaded from a checkpoint, is carried on to the end.
+        """
+
+        if self._results == None:
+            if self._in_flight:
+                self._simulate()
+            elif self.preemptive:
+                self.reset()
+                self._simulate()
+            else:
+                self.reset()
+                self._conclude_in_closed_form()
+
+            self._in_flight = False
+            self._results = SchedulingResult(self._table, self._metrics)
+
+        return self._results
+
+    @property
+    def profiling(self) -> bool:
+        """bool: Whether the simulation is profiled."""
+
+        return self._profiling
+
+    @profiling.setter
+    def profiling(self, value: bool):
+        """Whether the simulation is profiled.
+
+        Changing it discards the last result, so the next simulation is run again
+        with the new setting.
+
+        Args:
+            value (bool): Whether the simulation is profiled.
+
+        Raises:
+            TypeError: If the value is not a boolean.
+        """
+
+        if type(value) != bool:
+            raise TypeError(
+                f"Profiling should be a boolean. Got {type(value)} instead."
+            )
+
+        self._profiling = value
+        self._invalidate_results()
+
+    @property
+    def stats(self) -> SimulationStats:
+        """SimulationStats: The timers and counters of the last simulation, or None
+        if it was not profiled."""
+
+        return self._stats
+
+    @property
+    def current_time(self) -> int:
+        """int: The next step to be simulated, or the step after the last one if
+        the schedule has concluded."""
 
-        return total_wait_time / len(self._processes)
+        return self._time
 
     @property
     def ready_queue_is_empty(self) -> bool:
@@ -100,18 +237,134 @@ class SchedulingAlgorithm:
     def is_executing_a_process(self) -> bool:
         """bool: Whether or not there is a process running at the moment."""
         return (
-            self._current_running_process != None
-            and self._current_running_process.is_running
+            self._current_running_index != None
+            and self._status[self._current_running_index] == RUNNING
         )
 
+    @property
+    def _current_running_process(self) -> Process:
+        """Process: The last process dispatched to run, if any."""
+
+        if self._current_running_index == None:
+            return None
+
+        return self._table[self._current_running_index]
+
     def reset(self):
         """Resets the scheduling algorithm and processes to their initial states."""
 
-        for process in self._processes:
-            process.reset()
+        table = self._get_process_table()
+
+        if type(self._processes) == list:
+            table.bind(self._processes)
+
+        table.reset()
+        self._bind_process_columns(table)
+
+        # the schedule starts with the first arrival, and its last step is only
+        # known once the last process concludes
+        self._start_time = int(table.arrival_time.min()) if len(table) > 0 else 0
+        self._time = self._start_time
+        self._horizon: int = None
+        self._pending_processes = len(table)
+
+        self._current_running_index = None
+        self._ready_queue = self._create_ready_queue()
+        self._metrics = MetricsAccumulator(self._start_time)
+
+        # indexes of the processes that started to wait on the current step
+        self._enqueued_processes: list[int] = []
+        # indexes of the processes interrupted on the previous step
+        self._interrupted_processes: list[int] = []
+
+        # indexes of all processes, ordered by arrival time
+        self._arrival_queue = memoryview(np.argsort(table.arrival_time, kind="stable"))
+        self._next_arrival = 0
+        self._in_flight = False
+
+        self._install_profiling_hooks()
+
+    def _install_profiling_hooks(self):
+        """Wraps the phases of the simulation in timers and counters, if profiling.
+
+        The wrappers are set on the instance, over the methods of the class, so
+        they are simply removed when profiling is disabled.
+        """
+
+        for name in (*PROFILED_PHASES.values(), "_interrupt_current_running_process"):
+            self.__dict__.pop(name, None)
+
+        if not self._profiling:
+            self._stats = None
+            return
+
+        stats = SimulationStats()
+        self._stats = stats
+
+        for phase, name in PROFILED_PHASES.items():
+            setattr(self, name, profile_phase(stats, phase, getattr(self, name)))
+
+        refresh_ready_queue = self._refresh_ready_queue
+        determine_current_running_process = self._determine_current_running_process
+        interrupt_current_running_process = self._interrupt_current_running_process
+
+        def counted_refresh_ready_queue():
+            refresh_ready_queue()
+            stats.max_ready_queue_length = max(
+                stats.max_ready_queue_length, len(self._ready_queue)
+            )
+
+        def counted_determine_current_running_process():
+            running_index = (
+                self._current_running_index if self.is_executing_a_process else None
+            )
+            determine_current_running_process()
+
+            if (
+                self.is_executing_a_process
+                and self._current_running_index != running_index
+            ):
+                stats.dispatches += 1
+
+        def counted_interrupt_current_running_process():
+            interrupt_current_running_process()
+            stats.preemptions += 1
+
+        self._refresh_ready_queue = counted_refresh_ready_queue
+        self._determine_current_running_process = (
+            counted_determine_current_running_process
+        )
+        self._interrupt_current_running_process = (
+            counted_interrupt_current_running_process
+        )
+
+    def _get_process_table(self) -> ProcessTable:
+        """Returns the process table the simulation runs on.
+
+        When the processes were given as a list, the table is built from them the
+        first time it is needed.
+
+        Returns:
+            ProcessTable: The process table of the scheduling algorithm.
+        """
+
+        if self._table == None:
+            self._table = ProcessTable.from_processes(self._processes)
+
+        return self._table
+
+    def _bind_process_columns(self, table: ProcessTable):
+        """Keeps memory views of the process table columns.
 
-        self._current_running_process = None
-        self._ready_queue: list[Process] = []
+        The simulation reads and writes single processes at a time, which is much
+        faster through memory views than through NumPy arrays.
+
+        Args:
+            table (ProcessTable): The process table the simulation runs on.
+        """
+
+        for column in table.columns:
+            setattr(self, f"_{column}", memoryview(getattr(table, column)))
 
     def add_process(self, process: Process):
         """Adds a process to the scheduling algorithm.
@@ -128,21 +381,476 @@ class SchedulingAlgorithm:
 
         self._processes.append(process)
 
-    def run(self) -> pd.DataFrame:
-        """Executes the scheduling algorithm."""
+        if type(self._processes) == list:
+            self._table = None
+
+        self._invalidate_results()
+
+    def run(self) -> "pd.DataFrame":
+        """Executes the scheduling algorithm.
+
+        Returns:
+            pd.DataFrame: The execution report, with the status of every process
+            at every step.
+        """
+
+        if self._results == None or self._results.execution_report is None:
+            self._invalidate_results()
+            batches = list(self.run_iter(batch_size=None))
+            self._results.execution_report = execution_report_from_batches(batches)
+
+        return self._results.execution_report.copy()
+
+    def run_iter(self, batch_size: int = 1):
+        """Executes the scheduling algorithm, yielding the report as it is built.
+
+        Each batch holds the status of every process at `batch_size` consecutive
+        steps, with the same columns as the report returned by `run`, except for
+        the last batch, which may be shorter. Batches are not kept, so memory does
+        not grow with the length of the schedule. Once the last batch is consumed,
+        the result of the schedule is kept as the result of the last simulation.
+
+        Args:
+            batch_size (int, optional): The number of steps per batch. If None, the
+            whole report is yielded as a single batch. Defaults to 1.
+
+        Raises:
+            ValueError: If the batch size is not a positive integer.
+
+        Yields:
+            dict[str, np.ndarray]: The columns of the next steps of the report.
+        """
+
+        if batch_size != None and (type(batch_size) != int or batch_size < 1):
+            raise ValueError(
+                f"Batch size should be a positive integer. Got {batch_size!r} instead."
+            )
 
         self.reset()
-        execution_report = pd.DataFrame()
+        process_names = self._table.names
+
+        # the length of a schedule is only known once it ends, so the whole
+        # report is collected in parts as long as the shortest possible schedule
+        batch_capacity = batch_size or self._minimum_number_of_steps()
+        batches = []
+        batch = None
+
+        for step in self._iterate_scheduling_steps():
+            if batch == None:
+                batch = ExecutionReportBuilder(process_names, batch_capacity)
+
+            self._report_step_status(batch, step)
+
+            if batch.is_full:
+                batches.append(batch.to_columns())
+                batch = None
+
+            if batch_size != None and len(batches) > 0:
+                yield batches.pop()
+
+        if batch != None:
+            batches.append(batch.to_columns())
+
+        if len(batches) > 0:
+            yield concatenate_batches(batches)
+
+        if self._results == None:
+            self._results = SchedulingResult(self._table, self._metrics)
+
+    def run_segments(self) -> "pd.DataFrame":
+        """Executes the scheduling algorithm, reporting the intervals in which each
+        process kept its status.
+
+        Each row is a segment of a process, from its `start` step up to, but not
+        including, its `end` step. Within a segment, the remaining execution time
+        and the quantum progress change at a constant rate between the values at
+        its first and last steps. The report only grows with the number of
+        scheduling events, and `expand_segment_report` turns it back into the
+        report returned by `run`.
+
+        Returns:
+            pd.DataFrame: The segment report, ordered by process and then by start.
+        """
+
+        if self._results == None or self._results.segment_report is None:
+            self.reset()
+            segment_report = SegmentReportBuilder(self._table.names)
+
+            for step in self._iterate_event_steps():
+                self._report_step_status(segment_report, step)
+
+            if self._results == None:
+                self._results = SchedulingResult(self._table, self._metrics)
+
+            self._results.segment_report = segment_report.to_dataframe()
+
+        return self._results.segment_report.copy()
+
+    def advance(self, until: int) -> bool:
+        """Simulates the schedule up to the given step.
+
+        The simulation in flight goes on from where it stopped, or a new one
+        starts if there is none. Steps are simulated without building a report,
+        and the simulation can be carried on by calling `advance` again, saved
+        with `save_checkpoint` or concluded by reading `results`. Reports always
+        cover whole schedules, so `run`, `run_iter` and `run_segments` start over.
+
+        Args:
+            until (int): The last step to simulate.
+
+        Raises:
+            TypeError: If the step is not an integer.
+
+        Returns:
+            bool: Whether the schedule has concluded.
+        """
+
+        if type(until) != int:
+            raise TypeError(f"Step should be an integer. Got {type(until)} instead.")
+
+        if not self._in_flight:
+            self.reset()
+            self._in_flight = True
+
+        self._simulate(until)
+
+        return self._horizon != None
+
+    def fork(self, algorithm: type = None, **params) -> "SchedulingAlgorithm":
+        """Copies the simulation, so it can go on under another algorithm or other
+        parameters.
+
+        The fork shares the arrival time, execution time and priority level
+        columns with this scheduler, and only copies the state of the simulation,
+        so it takes a fraction of the time of simulating the schedule up to the
+        current step again. Both simulations go on independently afterwards. A
+        scheduler without a simulation in flight is forked at the start of its
+        schedule, or at its end if it already has a result.
+
+        Waiting processes are queued again in the order they started to wait, as
+        the ready queue of the new algorithm would hold them. A fork to Round Robin
+        or to the multilevel feedback queue carries on the quantum progress of the
+        running process, which only they keep, and processes forked from other
+        algorithms start the multilevel feedback queue at its highest level.
+
+        Args:
+            algorithm (type, optional): The scheduling algorithm class of the fork.
+            Defaults to the class of this scheduler.
+            **params: The parameters of the fork. Parameters of this scheduler are
+            kept if the fork has the same algorithm.
+
+        Raises:
+            TypeError: If the algorithm is not a scheduling algorithm class.
+
+        Returns:
+            SchedulingAlgorithm: A scheduler with a simulation in flight from the
+            current step.
+        """
+
+        if algorithm == None:
+            algorithm = type(self)
+            params = {**self._parameters(), **params}
+
+        if not (
+            isinstance(algorithm, type) and issubclass(algorithm, SchedulingAlgorithm)
+        ):
+            raise TypeError(
+                f"Algorithm should be a scheduling algorithm class. Got {algorithm!r} instead."
+            )
 
-        for step in range(self.total_execution_time + 1):
+        scalars, arrays = self._checkpoint_state()
+
+        forked = algorithm(self._table.copy(share_attributes=True), **params)
+        forked.profiling = self.profiling
+        forked._restore_checkpoint_state(scalars, arrays)
+
+        return forked
+
+    def _report_step_status(self, report, step: int):
+        """Adds the status of the processes at the given step to a report.
+
+        Args:
+            report (ExecutionReportBuilder | SegmentReportBuilder): The report
+            being built.
+            step (int): The current step.
+        """
+
+        report.add_step(step, self._table)
+
+    def _minimum_number_of_steps(self) -> int:
+        """Computes the number of steps of the shortest possible schedule.
+
+        The processor cannot be busier than running a process whenever one is
+        waiting, as First Come First Serve does.
+
+        Returns:
+            int: The number of steps from the first arrival to the conclusion of
+            the last process, if the processor is never idle while a process waits.
+        """
+
+        table = self._table
+        start_time = first_come_first_serve_start_times(
+            table.arrival_time, table.execution_time, np.asarray(self._arrival_queue)
+        )
+        completion_time = int((start_time + table.execution_time).max())
+
+        return completion_time - self._start_time + 1
+
+    def _conclude_schedule(self, step: int):
+        """Ends the schedule on the step in which the last process concludes.
+
+        Args:
+            step (int): The last step of the schedule.
+        """
+
+        self._horizon = step
+
+        if self._stats != None:
+            self._stats.ticks = step - self._start_time + 1
+
+    def _invalidate_results(self):
+        """Discards the result of the last simulation."""
+
+        self._results = None
+        self._in_flight = False
+
+    def _simulate(self, until: int = None):
+        """Executes the scheduling algorithm without building a report.
+
+        Only the steps with scheduling events are simulated; the quiet steps
+        between them are skipped all at once.
+
+        Args:
+            until (int, optional): The last step to simulate. Defaults to the end
+            of the schedule.
+        """
+
+        last_step = _NO_EVENT if until == None else until
+
+        while self._horizon == None and self._time <= last_step:
+            step = self._time
             self._simulate_scheduling_step(step)
-            step_report = self._report_step_status(step)
 
-            execution_report = pd.concat(
-                [execution_report, step_report], ignore_index=True
+            if self._horizon != None:
+                break
+
+            # a quiet step can always be simulated as any other, so the
+            # simulation may stop on it
+            next_step = min(self._next_event_step(step), last_step + 1)
+            self._skip_steps(next_step - step - 1)
+            self._time = next_step
+
+        if self._horizon != None:
+            self._time = self._horizon + 1
+
+    def _conclude_in_closed_form(self):
+        """Computes the final state of a non-preemptive schedule without simulating it.
+
+        Without preemption, each process runs to completion as soon as the
+        processor is free and it is the first of the ready queue, so the start
+        time of every process can be computed in one pass over the processes in
+        arrival order.
+        """
+
+        table = self._table
+        arrival_order = np.asarray(self._arrival_queue)
+        policy_keys = self._policy_keys()
+
+        if policy_keys is None:
+            start_time = first_come_first_serve_start_times(
+                table.arrival_time, table.execution_time, arrival_order
+            )
+        else:
+            start_time = non_preemptive_start_times(
+                table.arrival_time, table.execution_time, policy_keys, arrival_order
             )
 
-        return execution_report
+        conclusion_time = start_time + table.execution_time
+
+        table.status[:] = TERMINATED
+        table.remaining_execution_time[:] = 0
+        table.conclusion_time[:] = conclusion_time
+
+        # processes run one after the other, in order of start time, so the
+        # processor is idle between a conclusion and the next start
+        order = np.argsort(start_time, kind="stable")
+        idle_time = start_time[order] - np.concatenate(
+            ([self._start_time], conclusion_time[order[:-1]])
+        )
+
+        self._metrics.idle_time = int(idle_time.sum())
+        self._metrics.context_switches = len(order) - 1
+        self._metrics.response_time_sum = int((start_time - table.arrival_time).sum())
+        self._metrics.responded_processes = len(order)
+        self._metrics.record_conclusions(
+            conclusion_time, table.arrival_time, table.execution_time
+        )
+
+        self._current_running_index = int(order[-1])
+        self._pending_processes = 0
+        self._conclude_schedule(int(conclusion_time[order[-1]]))
+        self._time = self._horizon + 1
+
+    def _parameters(self) -> dict[str,]:
+        """Returns the parameters the scheduling algorithm was built with.
+
+        Returns:
+            dict[str,]: The current value of each keyword argument of the
+            constructor, other than the processes.
+        """
+
+        accepted = inspect.signature(type(self).__init__).parameters
+
+        return {
+            name: getattr(self, name)
+            for name in accepted
+            if name not in ("self", "processes")
+        }
+
+    def _checkpoint_state(self) -> tuple[dict[str,], dict[str, np.ndarray]]:
+        """Captures the state of the simulation between two steps.
+
+        A scheduler without a simulation in flight is captured at the start of
+        its schedule, or at its end if it already has a result.
+
+        Returns:
+            tuple[dict[str,], dict[str, np.ndarray]]: The scalars of the
+            simulation, as plain numbers, lists and dicts, and its arrays: the
+            process table columns, the ready queue in pop order and the processes
+            interrupted on the last step.
+        """
+
+        if not self._in_flight and self._results == None:
+            self.reset()
+
+        table = self._table
+        # processes are pushed into the ready queue on the step they start to
+        # wait, so no process is left to be enqueued between steps
+        scalars = {
+            "start_time": self._start_time,
+            "time": self._time,
+            "horizon": self._horizon,
+            "pending_processes": self._pending_processes,
+            "current_running_index": self._current_running_index,
+            "next_arrival": self._next_arrival,
+            "metrics": self._metrics.to_dict(),
+        }
+        arrays = {column: getattr(table, column) for column in table.columns}
+        arrays["ready_queue"] = np.fromiter(self._ready_queue, dtype=np.int64)
+        arrays["interrupted_processes"] = np.array(
+            self._interrupted_processes, dtype=np.int64
+        )
+
+        return scalars, arrays
+
+    def _restore_checkpoint_state(
+        self, scalars: dict[str,], arrays: dict[str, np.ndarray]
+    ):
+        """Restores the state captured by `_checkpoint_state`.
+
+        The scheduler should have been built with the same processes, but it may
+        run another algorithm or have other parameters. The restored simulation is
+        in flight, so it can be advanced or concluded.
+
+        Args:
+            scalars (dict[str,]): The scalars of the simulation.
+            arrays (dict[str, np.ndarray]): The arrays of the simulation.
+        """
+
+        self.reset()
+        table = self._table
+
+        for column in table.state_columns:
+            getattr(table, column)[:] = arrays[column]
+
+        self._start_time = scalars["start_time"]
+        self._time = scalars["time"]
+        self._horizon = scalars["horizon"]
+        self._pending_processes = scalars["pending_processes"]
+        self._current_running_index = scalars["current_running_index"]
+        self._next_arrival = scalars["next_arrival"]
+        self._metrics = MetricsAccumulator.from_dict(scalars["metrics"])
+
+        # processes are pushed in the order they started to wait, as they were
+        # pushed into the captured queue
+        waiting_processes = sorted(
+            arrays["ready_queue"].tolist(),
+            key=lambda index: (self._enqueue_time[index], index),
+        )
+
+        for index in waiting_processes:
+            self._ready_queue.push(index, self._enqueue_time[index])
+
+        self._interrupted_processes = arrays["interrupted_processes"].tolist()
+        self._in_flight = True
+
+    def _policy_keys(self) -> np.ndarray:
+        """Returns the key that orders the ready queue of a non-preemptive schedule.
+
+        Returns:
+            np.ndarray: The policy key of each process, or None if processes run in
+            order of arrival.
+        """
+
+        return None
+
+    def _iterate_scheduling_steps(self):
+        """Executes the scheduling algorithm, stopping at every step.
+
+        The quiet steps between scheduling events are skipped one at a time, so
+        the processes reflect the state of each step when it is yielded.
+
+        Yields:
+            int: The step that has just been executed.
+        """
+
+        while self._horizon == None:
+            step = self._time
+            self._simulate_scheduling_step(step)
+            yield step
+
+            if self._horizon != None:
+                break
+
+            next_step = self._next_event_step(step)
+
+            for quiet_step in range(step + 1, next_step):
+                self._skip_steps(1)
+                self._time = quiet_step
+                yield quiet_step
+
+            self._time = next_step
+
+        self._time = self._horizon + 1
+
+    def _iterate_event_steps(self):
+        """Executes the scheduling algorithm, stopping at the steps with scheduling
+        events and at the last step before each of them.
+
+        The processes only change at a constant rate between these steps.
+
+        Yields:
+            int: The step that has just been executed.
+        """
+
+        while self._horizon == None:
+            step = self._time
+            self._simulate_scheduling_step(step)
+            yield step
+
+            if self._horizon != None:
+                break
+
+            next_step = self._next_event_step(step)
+
+            if next_step - step > 1:
+                self._skip_steps(next_step - step - 1)
+                self._time = next_step - 1
+                yield next_step - 1
+
+            self._time = next_step
+
+        self._time = self._horizon + 1
 
     def _simulate_scheduling_step(self, step: int):
         """Executes a step of the schedule.
@@ -155,32 +863,56 @@ class SchedulingAlgorithm:
         self._refresh_ready_queue()
         self._determine_current_running_process()
 
-    def _report_step_status(self, step: int) -> pd.DataFrame:
-        """Reports the status of processes at the current step.
+        if self._pending_processes == 0:
+            self._conclude_schedule(step)
+
+    def _next_event_step(self, step: int) -> int:
+        """Determines the next step in which a scheduling event may happen.
+
+        A scheduling event is an arrival, a re-enqueue of an interrupted process
+        or the conclusion of the running process. Nothing but the remaining
+        execution time of the running process changes before that step. While the
+        processor is idle, the next event is the next arrival, so idle periods are
+        skipped at once.
 
         Args:
-            step (int): The current step.
+            step (int): The step that has just been executed.
 
         Returns:
-            pd.DataFrame: A DataFrame containing the step's process status report.
+            int: The next step that must be fully simulated.
         """
 
-        step_report = pd.DataFrame()
-
-        for process in self._processes:
-            process_report = pd.DataFrame(
-                {
-                    "time": [step],
-                    "process_name": [process.name],
-                    "process_status": [process.status.value],
-                    "remaining_execution_time": [process.remaining_execution_time],
-                    "quantum_progress": [process.quantum_progress],
-                }
-            )
+        next_step = _NO_EVENT
+
+        if self._next_arrival < len(self._arrival_queue):
+            next_arrival = self._arrival_queue[self._next_arrival]
+            next_step = min(next_step, self._arrival_time[next_arrival])
+
+        if len(self._interrupted_processes) > 0:
+            next_step = min(next_step, step + 1)
 
-            step_report = pd.concat([step_report, process_report], ignore_index=True)
+        if self.is_executing_a_process:
+            remaining_execution_time = self._remaining_execution_time[
+                self._current_running_index
+            ]
+            next_step = min(next_step, step + remaining_execution_time)
+
+        # some process is always pending until the schedule ends, so this only
+        # guards against policies that leave the processor idle while one waits
+        if next_step == _NO_EVENT:
+            return step + 1
+
+        return next_step
 
-        return step_report
+    def _skip_steps(self, steps: int):
+        """Advances the schedule through steps without scheduling events.
+
+        Args:
+            steps (int): The number of steps to skip.
+        """
+
+        if self.is_executing_a_process:
+            self._remaining_execution_time[self._current_running_index] -= steps
 
     def _assert_queue_validity(self):
         """Validates the integrity of process queues.
@@ -189,30 +921,21 @@ class SchedulingAlgorithm:
             InvalidProcessQueueError: If the process queue is not a list of Process
             objects.
             NoProcessesInQueueError: If the process queue is empty.
-            NoProcessWithArrivalTimeZeroError: If none of the processes have an
-            arrival time of zero.
         """
 
-        # if the process queue is not a list of Process objects
-        if type(self._processes) != list:
+        # if the process queue is not a list of Process objects or a process table
+        if type(self._processes) not in (list, ProcessTable):
             raise InvalidProcessQueueError()
 
         # if the process queue is empty
         if len(self._processes) == 0:
             raise NoProcessesInQueueError()
 
-        some_process_arrives_at_zero = False
-        for process in self._processes:
-            # if any object in the process queue is not a Process
-            if type(process) != Process:
-                raise InvalidProcessQueueError()
-
-            if process.arrival_time == 0:
-                some_process_arrives_at_zero = True
-
-        # if no process have an arrival time of zero
-        if not some_process_arrives_at_zero:
-            raise NoProcessWithArrivalTimeZeroError()
+        # if any object in the process queue is not a Process
+        if type(self._processes) == list:
+            for process in self._processes:
+                if type(process) != Process:
+                    raise InvalidProcessQueueError()
 
     def _update_processes_statuses(self, time: int):
         """Updates the statuses of processes based on the current time.
@@ -228,22 +951,39 @@ class SchedulingAlgorithm:
 
         # if there is a Process object currently running
         if self.is_executing_a_process:
-            self._current_running_process.remaining_execution_time -= 1
+            self._remaining_execution_time[self._current_running_index] -= 1
 
-        for process in self._processes:
-            # if Process has been interrupted or is ready and arrives, it starts
-            # to wait
-            if process.was_interrupted or (
-                process.is_ready and process.arrival_time == time
-            ):
-                process.wait()
-                process.enqueue_time = time
+        # if Process has been interrupted or is ready and arrives, it starts to
+        # wait
+        enqueued_processes = self._interrupted_processes
+        self._interrupted_processes = []
+
+        while self._next_arrival < len(self._arrival_queue):
+            index = self._arrival_queue[self._next_arrival]
+
+            if self._arrival_time[index] != time:
+                break
+
+            enqueued_processes.append(index)
+            self._next_arrival += 1
+
+        self._enqueued_processes = sorted(enqueued_processes)
+
+        for index in self._enqueued_processes:
+            self._status[index] = WAITING
+            self._enqueue_time[index] = time
+
+        # if the current running Process has no remaining execution time, it
+        # terminates
+        index = self._current_running_index
 
-            # if the current running Process has no remaining execution time, it
-            # terminates
-            if process.is_running and process.remaining_execution_time == 0:
-                process.conclude()
-                process.conclusion_time = time
+        if self.is_executing_a_process and self._remaining_execution_time[index] == 0:
+            self._status[index] = TERMINATED
+            self._conclusion_time[index] = time
+            self._pending_processes -= 1
+            self._metrics.record_conclusion(
+                time, self._arrival_time[index], self._execution_time[index]
+            )
 
     def _determine_current_running_process(self):
         """Determines the currently running process from the ready queue.
@@ -252,19 +992,56 @@ class SchedulingAlgorithm:
         selects the next process to run from the ready queue (if there are any).
         """
 
-        if (not self.is_executing_a_process) and (not self.ready_queue_is_empty):
-            self._current_running_process = self._ready_queue.pop(0)
-            self._current_running_process.run()
+        if self.is_executing_a_process:
+            return
+
+        if self.ready_queue_is_empty:
+            self._metrics.record_idle(self._time)
+            return
+
+        last_running_index = self._current_running_index
+        index = self._ready_queue.pop()
+
+        self._current_running_index = index
+        self._status[index] = RUNNING
+
+        # a process that has not run yet still has all of its execution time
+        first_dispatch = (
+            self._remaining_execution_time[index] == self._execution_time[index]
+        )
+        self._metrics.record_dispatch(
+            self._time,
+            self._time - self._arrival_time[index] if first_dispatch else None,
+            last_running_index != None and last_running_index != index,
+        )
+
+    def _interrupt_current_running_process(self):
+        """Interrupts the current running process.
+
+        The interrupted process starts to wait again on the next step.
+        """
+
+        self._status[self._current_running_index] = INTERRUPTED
+        self._interrupted_processes.append(self._current_running_index)
 
     def _refresh_ready_queue(self):
         """Refresh the ready queue based on waiting processes.
 
-        This method updates the ready queue by selecting processes with WAITING
-        status from the list of all processes in the scheduling algorithm.
+        This method pushes the processes that started to wait on the current step
+        into the ready queue, which keeps itself ordered.
         """
 
-        self._ready_queue: list[Process] = [
-            process for process in self._processes if process.is_waiting
-        ]
+        for index in self._enqueued_processes:
+            self._ready_queue.push(index, self._enqueue_time[index])
+
+        self._enqueued_processes = []
+
+    def _create_ready_queue(self) -> ReadyQueue:
+        """Creates the ready queue used by the scheduling algorithm.
+
+        Returns:
+            ReadyQueue: A queue that orders processes by the time they were
+            enqueued.
+        """
 
-        self._ready_queue = sorted(self._ready_queue, key=lambda x: x.enqueue_time)
+        return ReadyQueue()
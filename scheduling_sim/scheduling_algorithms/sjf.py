@@ -1,3 +1,6 @@
+import numpy as np
+
+from scheduling_sim.scheduling_algorithms.ready_queue import PriorityReadyQueue
 from scheduling_sim.scheduling_algorithms.scheduling_algorithm import (
     SchedulingAlgorithm,
 )
@@ -12,18 +15,28 @@ class ShortestJobFirstScheduler(SchedulingAlgorithm):
 
     Attributes:
         algorithm_name (str): The name of the scheduling algorithm.
+        preemptive (bool): Whether the algorithm interrupts running processes.
 
     Methods:
         reset(): Resets the scheduling algorithm and processes to their initial
         states.
         add_process(process: Process): Adds a process to the scheduling algorithm.
         run() -> pd.DataFrame: Executes the scheduling algorithm.
+        run_iter(batch_size: int = 1): Executes the scheduling algorithm, yielding
+        the report as it is built.
+        run_segments() -> pd.DataFrame: Executes the scheduling algorithm, reporting
+        the intervals in which each process kept its status.
+        advance(until: int) -> bool: Simulates the schedule up to the given step.
+        fork(algorithm: type = None, **params) -> SchedulingAlgorithm: Copies the
+        simulation, so it can go on under another algorithm or other parameters.
 
     Properties:
         number_of_processes (int): The number of processes in the scheduling algorithm.
         total_execution_time (int): The total execution time of all processes.
         average_turnaround_time (float): The average turnaround time of all processes.
         average_wait_time (float): The average wait time of all processes.
+        results (SchedulingResult): The outcome of the last simulation.
+        current_time (int): The next step to be simulated.
         ready_queue_is_empty (bool): Whether or not the ready queue has no Process
         objects.
         is_executing_a_process (bool): Whether or not there is a process running
@@ -32,16 +45,14 @@ class ShortestJobFirstScheduler(SchedulingAlgorithm):
 
     algorithm_name: str = "Shortest Job First Scheduler"
 
-    def _refresh_ready_queue(self):
-        """Refresh the ready queue based on waiting processes.
+    def _policy_keys(self) -> np.ndarray:
+        return self._table.execution_time
 
-        This method updates the ready queue by selecting processes with WAITING
-        status from the list of all processes in the scheduling algorithm. The queue
-        is ordered according to the remaining time.
-        """
+    def _create_ready_queue(self) -> PriorityReadyQueue:
+        """Creates the ready queue used by the scheduling algorithm.
 
-        super()._refresh_ready_queue()
+        Returns:
+            PriorityReadyQueue: A queue ordered according to the remaining time.
+        """
 
-        self._ready_queue = sorted(
-            self._ready_queue, key=lambda x: x.remaining_execution_time
-        )
+        return PriorityReadyQueue(key=lambda x: self._remaining_execution_time[x])
@@ -11,12 +11,20 @@ class ShortestRemainingTimeFirstScheduler(ShortestJobFirstScheduler):
 
     Attributes:
         algorithm_name (str): The name of the scheduling algorithm.
+        preemptive (bool): Whether the algorithm interrupts running processes.
 
     Methods:
         reset(): Resets the scheduling algorithm and processes to their initial
         states.
         add_process(process: Process): Adds a process to the scheduling algorithm.
         run() -> pd.DataFrame: Executes the scheduling algorithm.
+        run_iter(batch_size: int = 1): Executes the scheduling algorithm, yielding
+        the report as it is built.
+        run_segments() -> pd.DataFrame: Executes the scheduling algorithm, reporting
+        the intervals in which each process kept its status.
+        advance(until: int) -> bool: Simulates the schedule up to the given step.
+        fork(algorithm: type = None, **params) -> SchedulingAlgorithm: Copies the
+        simulation, so it can go on under another algorithm or other parameters.
         has_shorter_process_waiting() -> bool: Checks if a process with shorter
         remaining execution time is waiting.
 
@@ -25,6 +33,8 @@ class ShortestRemainingTimeFirstScheduler(ShortestJobFirstScheduler):
         total_execution_time (int): The total execution time of all processes.
         average_turnaround_time (float): The average turnaround time of all processes.
         average_wait_time (float): The average wait time of all processes.
+        results (SchedulingResult): The outcome of the last simulation.
+        current_time (int): The next step to be simulated.
         ready_queue_is_empty (bool): Whether or not the ready queue has no Process
         objects.
         is_executing_a_process (bool): Whether or not there is a process running
@@ -32,6 +42,7 @@ class ShortestRemainingTimeFirstScheduler(ShortestJobFirstScheduler):
     """
 
     algorithm_name: str = "Shortest Remaining Time First"
+    preemptive: bool = True
 
     def has_shorter_process_waiting(self) -> bool:
         """Checks if a process with shorter remaining execution time is waiting.
@@ -44,11 +55,11 @@ class ShortestRemainingTimeFirstScheduler(ShortestJobFirstScheduler):
         if (not self.is_executing_a_process) or self.ready_queue_is_empty:
             return False
 
-        shortest_waiting_process = self._ready_queue[0]
+        shortest_waiting_process = self._ready_queue.peek()
 
         return (
-            self._current_running_process.remaining_execution_time
-            > shortest_waiting_process.remaining_execution_time
+            self._remaining_execution_time[self._current_running_index]
+            > self._remaining_execution_time[shortest_waiting_process]
         )
 
     def _determine_current_running_process(self):
@@ -57,6 +68,6 @@ class ShortestRemainingTimeFirstScheduler(ShortestJobFirstScheduler):
             and (not self.ready_queue_is_empty)
             and self.has_shorter_process_waiting()
         ):
-            self._current_running_process.interrupt()
+            self._interrupt_current_running_process()
 
         super()._determine_current_running_process()
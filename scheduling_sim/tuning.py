@@ -0,0 +1,316 @@
+import math
+
+import numpy as np
+
+from scheduling_sim.metrics import PERCENTILES
+from scheduling_sim.process_table import RUNNING, TERMINATED, ProcessTable
+from scheduling_sim.scheduling_algorithms import RoundRobinScheduler
+
+# Objectives a quantum length can be tuned against. Percentiles are computed
+# exactly, from the times of every process.
+TUNING_OBJECTIVES: tuple[str] = (
+    "average_wait_time",
+    "average_turnaround_time",
+    "average_response_time",
+    *(f"wait_time_p{percentile}" for percentile in PERCENTILES),
+    *(f"turnaround_time_p{percentile}" for percentile in PERCENTILES),
+)
+
+# Times the cost of a candidate is checked against the best cost while it is
+# simulated. Each check takes a pass over the processes.
+COST_CHECKS: int = 32
+
+
+class QuantumTuningResult:
+    """The outcome of a quantum length tuning.
+
+    Attributes:
+        objective (str): The objective the quantum length was tuned against.
+        quantum_length (int): The best quantum length found.
+        cost (float): The cost of the best quantum length.
+        costs (dict[int, float]): The cost of each quantum length simulated to
+        the end of its schedule.
+        pruned (dict[int, float]): The lower bound of the cost of each quantum
+        length whose simulation was stopped early, when it was stopped.
+    """
+
+    def __init__(
+        self,
+        objective: str,
+        quantum_length: int,
+        costs: dict[int, float],
+        pruned: dict[int, float],
+    ):
+        self.objective: str = objective
+        self.quantum_length: int = quantum_length
+        self.cost: float = costs[quantum_length]
+        self.costs: dict[int, float] = costs
+        self.pruned: dict[int, float] = pruned
+
+    def __repr__(self):
+        return (
+            f"QuantumTuningResult(quantum_length={self.quantum_length},"
+            f" cost={self.cost}, evaluated={len(self.costs) + len(self.pruned)})"
+        )
+
+
+def tune_quantum_length(
+    workload,
+    objective: str = "average_wait_time",
+    context_switch_cost: float = 0.0,
+    min_quantum_length: int = 1,
+    max_quantum_length: int = None,
+) -> QuantumTuningResult:
+    """Searches the Round Robin quantum length with the lowest cost for a workload.
+
+    The cost of a quantum length is the objective plus the context switch cost
+    times the number of context switches per process. Quantum lengths are first
+    tried on a geometric grid, longest first, since they have the fewest
+    preemptions to simulate. The search is then refined between the neighbours
+    of the best one. Every candidate is simulated in stages, and stopped as soon
+    as a lower bound of its cost exceeds the best cost found so far, so poor
+    quantum lengths are only simulated for part of their schedule.
+
+    The result is a local optimum: when the cost has several local minima, the
+    best quantum length may lie away from the best point of the grid and be
+    missed. Use `RoundRobinScheduler` directly on every quantum length when the
+    global optimum is needed.
+
+    Quantum lengths longer than every execution time give the same schedule, so
+    the search never goes beyond the longest execution time.
+
+    Args:
+        workload (list[Process] | ProcessTable): The processes to schedule.
+        objective (str, optional): One of the `TUNING_OBJECTIVES`. Defaults to
+        "average_wait_time".
+        context_switch_cost (float, optional): The cost of each context switch,
+        spread over the processes. Defaults to 0.
+        min_quantum_length (int, optional): The shortest quantum length to try.
+        Defaults to 1.
+        max_quantum_length (int, optional): The longest quantum length to try.
+        Defaults to the longest execution time.
+
+    Raises:
+        TypeError: If a quantum length bound is not an integer.
+        ValueError: If the objective is unknown, the context switch cost is
+        negative or the quantum length bounds are not a valid range.
+
+    Returns:
+        QuantumTuningResult: The best quantum length and the cost of every
+        candidate.
+    """
+
+    if objective not in TUNING_OBJECTIVES:
+        raise ValueError(
+            f"Objective should be one of {TUNING_OBJECTIVES}. Got {objective!r} instead."
+        )
+
+    if context_switch_cost < 0:
+        raise ValueError(
+            f"Context switch cost should not be negative. Got {context_switch_cost} instead."
+        )
+
+    if isinstance(workload, ProcessTable):
+        table = workload.copy()
+    else:
+        table = ProcessTable.from_processes(list(workload))
+
+    longest_execution_time = int(table.execution_time.max(initial=1))
+
+    if max_quantum_length == None:
+        max_quantum_length = max(longest_execution_time, min_quantum_length)
+
+    for bound in (min_quantum_length, max_quantum_length):
+        if type(bound) != int:
+            raise TypeError(
+                f"Quantum length should be an integer. Got {type(bound)} instead."
+            )
+
+    if not 1 <= min_quantum_length <= max_quantum_length:
+        raise ValueError(
+            "Quantum length bounds should be a range of positive integers. Got"
+            f" {min_quantum_length} to {max_quantum_length} instead."
+        )
+
+    # quantum lengths longer than every execution time give the same schedule
+    max_quantum_length = max(
+        min(max_quantum_length, longest_execution_time), min_quantum_length
+    )
+
+    costs = {}
+    pruned = {}
+    best = None
+
+    def evaluate(quantum_length: int):
+        nonlocal best
+
+        if quantum_length in costs or quantum_length in pruned:
+            return
+
+        best_cost = math.inf if best == None else costs[best]
+        cost, concluded = _candidate_cost(
+            table, quantum_length, objective, context_switch_cost, best_cost
+        )
+
+        if not concluded:
+            pruned[quantum_length] = cost
+            return
+
+        costs[quantum_length] = cost
+
+        if cost < best_cost or (cost == best_cost and quantum_length < best):
+            best = quantum_length
+
+    for quantum_length in reversed(
+        _geometric_grid(min_quantum_length, max_quantum_length)
+    ):
+        evaluate(quantum_length)
+
+    # narrows the bracket around the best quantum length until its neighbours
+    # have been evaluated
+    while True:
+        evaluated = sorted([*costs, *pruned])
+        position = evaluated.index(best)
+        lower = evaluated[position - 1] if position > 0 else best
+        upper = evaluated[position + 1] if position + 1 < len(evaluated) else best
+        candidates = {(lower + best) // 2, (best + upper + 1) // 2} - {lower, best}
+        candidates -= {upper}
+
+        if len(candidates) == 0:
+            break
+
+        for quantum_length in sorted(candidates):
+            evaluate(quantum_length)
+
+    return QuantumTuningResult(objective, best, costs, pruned)
+
+
+def _geometric_grid(lowest: int, highest: int) -> list[int]:
+    """Builds a grid of integers that grow geometrically.
+
+    Args:
+        lowest (int): The first integer of the grid.
+        highest (int): The last integer of the grid.
+
+    Returns:
+        list[int]: The distinct integers of the grid, doubling from the lowest
+        one, and the highest one.
+    """
+
+    grid = []
+    value = lowest
+
+    while value < highest:
+        grid.append(value)
+        value *= 2
+
+    grid.append(highest)
+
+    return grid
+
+
+def _candidate_cost(
+    table: ProcessTable,
+    quantum_length: int,
+    objective: str,
+    context_switch_cost: float,
+    best_cost: float,
+) -> tuple[float, bool]:
+    """Simulates a quantum length until its cost is known or cannot beat the best
+    cost.
+
+    Args:
+        table (ProcessTable): The processes of the workload.
+        quantum_length (int): The quantum length.
+        objective (str): One of the `TUNING_OBJECTIVES`.
+        context_switch_cost (float): The cost of each context switch, spread over
+        the processes.
+        best_cost (float): The best cost found so far.
+
+    Returns:
+        tuple[float, bool]: The cost of the quantum length, or a lower bound of
+        it, and whether the schedule was simulated to the end.
+    """
+
+    scheduler = RoundRobinScheduler(
+        table.copy(share_attributes=True), quantum_length=quantum_length
+    )
+    interval = -(-scheduler._minimum_number_of_steps() // COST_CHECKS)
+
+    while not scheduler.advance(scheduler.current_time + interval - 1):
+        lower_bound = _cost_lower_bound(scheduler, objective, context_switch_cost)
+
+        # candidates that could tie with the best cost are kept, since ties
+        # prefer the shorter quantum length
+        if lower_bound > best_cost:
+            return lower_bound, False
+
+    return _cost_lower_bound(scheduler, objective, context_switch_cost), True
+
+
+def _cost_lower_bound(
+    scheduler: RoundRobinScheduler, objective: str, context_switch_cost: float
+) -> float:
+    """Computes a lower bound of the cost of a simulation in flight.
+
+    A process that has not concluded before the current step concludes at the
+    earliest once its remaining execution time has run, and a process that has
+    not been dispatched yet is dispatched at the earliest on the current step.
+    Every objective grows with the times of the processes, so the objective of
+    these earliest times bounds the final one. Once the schedule has concluded,
+    the bound is the cost itself.
+
+    Args:
+        scheduler (RoundRobinScheduler): The scheduler.
+        objective (str): One of the `TUNING_OBJECTIVES`.
+        context_switch_cost (float): The cost of each context switch, spread over
+        the processes.
+
+    Returns:
+        float: The lower bound of the cost.
+    """
+
+    table = scheduler._table
+    metrics = scheduler._metrics
+    time = scheduler.current_time
+
+    terminated = table.status == TERMINATED
+    pending = (table.arrival_time < time) & ~terminated
+    earliest_conclusion_time = np.maximum(
+        time + table.remaining_execution_time - 1,
+        table.arrival_time + table.execution_time,
+    )
+
+    conclusion_time = np.where(
+        terminated,
+        table.conclusion_time,
+        np.where(
+            pending,
+            earliest_conclusion_time,
+            table.arrival_time + table.execution_time,
+        ),
+    )
+
+    if objective == "average_response_time":
+        undispatched = (
+            pending
+            & (table.status != RUNNING)
+            & (table.remaining_execution_time == table.execution_time)
+        )
+        response_time_sum = metrics.response_time_sum + int(
+            (time - table.arrival_time[undispatched]).sum()
+        )
+        value = response_time_sum / len(table)
+    else:
+        times = conclusion_time - table.arrival_time
+
+        if objective.startswith("wait_time") or objective == "average_wait_time":
+            times = times - table.execution_time
+
+        if objective.startswith("average"):
+            value = int(times.sum()) / len(table)
+        else:
+            percentile = int(objective.rpartition("_p")[2])
+            value = float(np.quantile(times, percentile / 100))
+
+    return value + context_switch_cost * metrics.context_switches / len(table)
@@ -7,9 +7,12 @@ import pandas as pd
 import PySimpleGUI as sg
 from matplotlib import pyplot as plt
 
-from scheduling_sim.process import Process
+from scheduling_sim.batch import compare_algorithms
+from scheduling_sim.gantt import gantt_intervals, plot_gantt_chart
+from scheduling_sim.process_table import ProcessTable
 from scheduling_sim.scheduling_algorithms import (
     FirstComeFirstServeScheduler,
+    MultilevelFeedbackQueueScheduler,
     PriorityCooperativeScheduler,
     PriorityPreemptiveScheduler,
     RoundRobinScheduler,
@@ -17,7 +20,7 @@ from scheduling_sim.scheduling_algorithms import (
     ShortestJobFirstScheduler,
     ShortestRemainingTimeFirstScheduler,
 )
-from scheduling_sim.utils import fade_color
+from scheduling_sim.workload import read_workload
 
 
 class SchedulingSimulatorAPP:
@@ -28,6 +31,7 @@ class SchedulingSimulatorAPP:
         "Round Robin": RoundRobinScheduler,
         "Shortest Remaining Time First": ShortestRemainingTimeFirstScheduler,
         "Priority (Preemptive)": PriorityPreemptiveScheduler,
+        "Multilevel Feedback Queue": MultilevelFeedbackQueueScheduler,
     }
 
     def __init__(self):
@@ -96,7 +100,11 @@ class SchedulingSimulatorAPP:
                     expand_x=True,
                     default_text=self._input_path,
                 ),
-                sg.FileBrowse(file_types=(("Excel Files", "*.xlsx"),)),
+                sg.FileBrowse(
+                    file_types=(
+                        ("Workload Files", "*.xlsx *.csv *.parquet *.arrow *.feather"),
+                    )
+                ),
             ],
             [
                 sg.Text("Output folder:"),
@@ -183,41 +191,15 @@ class SchedulingSimulatorAPP:
 
         return scheduler
 
-    def _read_processes_table(self) -> list[Process]:
-        processes_df = pd.read_excel(self._input_path)
-        processes = []
-
-        for process in processes_df.to_dict(orient="records"):
-            processes.append(
-                Process(
-                    name=process["Process Name"],
-                    arrival_time=process["Arrival Time"],
-                    execution_time=process["Execution Time"],
-                    priority_level=process["Priority Level"],
-                )
-            )
-
-        return processes
+    def _read_processes_table(self) -> ProcessTable:
+        return read_workload(self._input_path)
 
     def _determine_best_wait_time(self) -> str:
-        algorithm_times = []
         processes = self._read_processes_table()
+        ranking = compare_algorithms(processes, self.algorithms)
+        best_wait_time_algorithm = ranking.to_dict(orient="records")[0]
 
-        for algorithm_name, scheduler_type in self.algorithms.items():
-            scheduler = scheduler_type(processes)
-
-            algorithm_times.append(
-                {
-                    "algorithm_name": algorithm_name,
-                    "wait_time": scheduler.average_wait_time,
-                }
-            )
-
-        best_wait_time_algorithm = sorted(
-            algorithm_times, key=lambda algorithm: algorithm["wait_time"]
-        )[0]
-
-        return f"{best_wait_time_algorithm['algorithm_name']} ({best_wait_time_algorithm['wait_time']})"
+        return f"{best_wait_time_algorithm['algorithm']} ({best_wait_time_algorithm['average_wait_time']})"
 
     def _export_execution_report(self):
         file_path = os.path.join(self._output_path, "execution_report.xlsx")
@@ -225,38 +207,14 @@ class SchedulingSimulatorAPP:
 
         execution_report = scheduler.run()
         execution_report.to_excel(file_path, index=False)
-        self._plot_execution_report(execution_report)
+        self._plot_execution_report(scheduler.run_segments())
 
-    def _plot_execution_report(self, execution_report: pd.DataFrame):
-        execution_report = execution_report.loc[
-            ~execution_report["process_status"].isin(("Ready", "Terminated"))
-        ]
-
-        processes = execution_report["process_name"].unique().tolist()
-        process_colors = self._assign_process_colors(processes)
+    def _plot_execution_report(self, segment_report: pd.DataFrame):
+        intervals = gantt_intervals(segment_report)
+        process_colors = self._assign_process_colors(list(intervals))
 
         fig, ax = plt.subplots(figsize=(10, 4))
-
-        for row in execution_report.to_dict(orient="records"):
-            process = row["process_name"]
-            color = process_colors[process]
-
-            if row["process_status"] == "Running":
-                bar_color = color
-                edge_color = "black"
-
-            else:
-                bar_color = fade_color(color)
-                edge_color = None
-
-            ax.barh(
-                process,
-                width=1,
-                height=0.5,
-                left=row["time"],
-                color=bar_color,
-                edgecolor=edge_color,
-            )
+        plot_gantt_chart(ax, intervals, process_colors)
 
         ax.set_xlabel("Time")
         ax.set_ylabel("Process")
@@ -265,6 +223,7 @@ class SchedulingSimulatorAPP:
 
         fig_path = os.path.join(self._output_path, "schedule.png")
         plt.savefig(fig_path)
+        plt.close(fig)
 
     def _assign_process_colors(self, processes: list[str]) -> dict[str, str]:
         palette = ["#316AD0", "#E4E32B", "#9650CB", "#4BDA3D", "#E0323C"]
@@ -0,0 +1,133 @@
+import os
+from collections import OrderedDict
+
+from scheduling_sim.process_table import ProcessTable
+
+# Columns of a workload file and the process attributes they hold.
+WORKLOAD_COLUMNS: dict[str, str] = {
+    "Process Name": "names",
+    "Arrival Time": "arrival_time",
+    "Execution Time": "execution_time",
+    "Priority Level": "priority_level",
+}
+
+# Readers of each supported file format, by file extension. Parquet and Arrow
+# files need pyarrow, and Excel files need openpyxl.
+WORKLOAD_FORMATS: dict[str, str] = {
+    ".csv": "read_csv",
+    ".xlsx": "read_excel",
+    ".parquet": "read_parquet",
+    ".arrow": "read_feather",
+    ".feather": "read_feather",
+}
+
+# The most workloads kept in the cache.
+CACHE_SIZE: int = 32
+
+# Parsed workloads by absolute path, with the modification time and size of the
+# file when it was parsed. Least recently used workloads come first.
+_workload_cache: OrderedDict[str, tuple[int, int, ProcessTable]] = OrderedDict()
+
+
+def read_workload(path: str, use_cache: bool = True) -> ProcessTable:
+    """Reads a workload file into a process table.
+
+    The file has one row per process and the columns in `WORKLOAD_COLUMNS`, as
+    the input files of the user interface. The process name and priority level
+    columns are optional. Columns are validated all at once, when the process
+    table is built.
+
+    Parsed workloads are cached until their file is modified, so reading the
+    same file again only copies its processes into a new table.
+
+    Args:
+        path (str): The path of a file in one of the `WORKLOAD_FORMATS`.
+        use_cache (bool, optional): Whether to use and update the cache. Defaults
+        to True.
+
+    Raises:
+        ValueError: If the file format is not supported, a required column is
+        missing or a process name is missing or empty.
+
+    Returns:
+        ProcessTable: The processes of the workload.
+    """
+
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    cached = _workload_cache.get(path) if use_cache else None
+
+    if cached != None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _workload_cache.move_to_end(path)
+        return cached[2].copy()
+
+    table = _parse_workload(path)
+
+    if use_cache:
+        _workload_cache[path] = (stat.st_mtime_ns, stat.st_size, table)
+        _workload_cache.move_to_end(path)
+
+        while len(_workload_cache) > CACHE_SIZE:
+            _workload_cache.popitem(last=False)
+
+    return table.copy()
+
+
+def clear_workload_cache():
+    """Discards every cached workload."""
+
+    _workload_cache.clear()
+
+
+def _parse_workload(path: str) -> ProcessTable:
+    """Parses a workload file into a process table.
+
+    Args:
+        path (str): The absolute path of the file.
+
+    Raises:
+        ValueError: If the file format is not supported, a required column is
+        missing or a process name is missing or empty.
+
+    Returns:
+        ProcessTable: The processes of the workload.
+    """
+
+    import pandas as pd
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension not in WORKLOAD_FORMATS:
+        raise ValueError(
+            f"unsupported workload file format. Expected one of {', '.join(WORKLOAD_FORMATS)}, got {extension or path!r} instead."
+        )
+
+    reader = getattr(pd, WORKLOAD_FORMATS[extension])
+
+    if extension in (".csv", ".xlsx"):
+        # text and spreadsheet readers can skip the other columns while parsing
+        workload = reader(path, usecols=lambda column: column in WORKLOAD_COLUMNS)
+    else:
+        workload = reader(path)
+
+    missing = [
+        column
+        for column in ("Arrival Time", "Execution Time")
+        if column not in workload.columns
+    ]
+
+    if missing:
+        raise ValueError(f"workload file {path!r} is missing columns {missing}.")
+
+    columns = {
+        attribute: workload[column].to_numpy()
+        for column, attribute in WORKLOAD_COLUMNS.items()
+        if column in workload.columns
+    }
+
+    if "names" in columns:
+        # every kind of missing value is read as None, which is not a name
+        names = workload["Process Name"].astype(object)
+        columns["names"] = names.where(names.notna(), None).tolist()
+
+    return ProcessTable(**columns)
@@ -1,4 +1,5 @@
 from .fcfs import TestFirstComeFirstServeScheduler
+from .mlfq import TestMultilevelFeedbackQueueScheduler
 from .prioc import TestPriorityCooperativeScheduler
 from .priop import TestPriorityPreemptiveScheduler
 from .rr import TestRoundRobinScheduler
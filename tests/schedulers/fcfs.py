@@ -21,16 +21,26 @@ class TestFirstComeFirstServeScheduler(TestSchedulingAlgorithm):
         case_1(self) -> Scheduler: Defines the first test case scenario and returns a scheduler.
         case_2(self) -> Scheduler: Defines the second test case scenario and returns a scheduler.
         case_3(self) -> Scheduler: Defines the third test case scenario and returns a scheduler.
+        case_4(self) -> Scheduler: Defines the fourth test case scenario and returns a scheduler.
         get_scheduler(self, case_id: int) -> Scheduler: Returns a scheduler based on the
         selected case.
         test_average_wait_time(self, case_id: int): Test for average wait time.
         test_average_turnaround_time(self, case_id: int): Test for average turnaround time.
         test_total_execution_time(self, case_id: int): Test for total execution time.
+        test_execution_report(self, case_id: int): Test for the execution report layout.
+        test_results_invalidation(self, case_id: int): Test for the invalidation of
+        cached results.
+        test_process_table(self, case_id: int): Test for schedules run on a process
+        table.
+        test_run_iter(self, case_id: int): Test for the streamed execution report.
+        test_segment_report(self, case_id: int): Test for the segment report.
+        test_sparse_arrivals(self, case_id: int): Test for schedules that start late
+        and have idle gaps.
     """
 
     Scheduler = FirstComeFirstServeScheduler
 
     # results
-    average_wait_times = [5.2, 6, 5.2]
-    average_turnaround_times = [8.0, 9.4, 8.4]
-    total_execution_times = [14, 17, 16]
+    average_wait_times = [5.2, 6, 5.2, 1870.0]
+    average_turnaround_times = [8.0, 9.4, 8.4, 2800.0]
+    total_execution_times = [14, 17, 16, 4650]
@@ -0,0 +1,198 @@
+import pytest
+
+from scheduling_sim import MultilevelFeedbackQueueScheduler, Process, ProcessTable
+from scheduling_sim.execution_report import expand_segment_report
+
+from .scheduling_algorithm import TestSchedulingAlgorithm
+
+
+class TestMultilevelFeedbackQueueScheduler(TestSchedulingAlgorithm):
+    """Test class for Multilevel Feedback Queue Scheduler (MLFQ).
+
+    This test class inherits from `TestSchedulingAlgorithm` and specializes in testing
+    the Multilevel Feedback Queue scheduling algorithm. It includes specific expected
+    results for Multilevel Feedback Queue scenarios.
+
+    Attributes:
+        Scheduler (type): The class to be tested (MultilevelFeedbackQueueScheduler).
+        average_wait_times (list): A list of expected average wait times for test cases.
+        average_turnaround_times (list): A list of expected average turnaround times
+        for test cases.
+        total_execution_times (list): A list of expected total execution times for test
+        cases.
+
+    Methods:
+        case_1(self) -> Scheduler: Defines the first test case scenario and returns a scheduler.
+        case_2(self) -> Scheduler: Defines the second test case scenario and returns a scheduler.
+        case_3(self) -> Scheduler: Defines the third test case scenario and returns a scheduler.
+        case_4(self) -> Scheduler: Defines the fourth test case scenario and returns a scheduler.
+        get_scheduler(self, case_id: int) -> Scheduler: Returns a scheduler based on the
+        selected case.
+        test_average_wait_time(self, case_id: int): Test for average wait time.
+        test_average_turnaround_time(self, case_id: int): Test for average turnaround time.
+        test_total_execution_time(self, case_id: int): Test for total execution time.
+        test_execution_report(self, case_id: int): Test for the execution report layout.
+        test_results_invalidation(self, case_id: int): Test for the invalidation of
+        cached results.
+        test_process_table(self, case_id: int): Test for schedules run on a process
+        table.
+        test_run_iter(self, case_id: int): Test for the streamed execution report.
+        test_segment_report(self, case_id: int): Test for the segment report.
+        test_sparse_arrivals(self, case_id: int): Test for schedules that start late
+        and have idle gaps.
+        starving_processes(self) -> list[Process]: Builds a workload in which short
+        processes keep a long one at the lowest level.
+        test_demotion(self): Test for the demotion of processes that use their whole
+        quantum.
+        test_segment_report(self, case_id: int): Test for the segment report, also
+        when processes start a new quantum without leaving the processor.
+        test_single_process(self): Test for a process that runs alone through
+        every level.
+        test_boost(self): Test for the periodic boost of processes to the highest
+        level.
+        test_parameters_invalidation(self): Test for the invalidation of cached
+        results when the parameters change.
+        test_invalid_parameters(self): Test for the validation of the parameters.
+    """
+
+    Scheduler = MultilevelFeedbackQueueScheduler
+
+    # results
+    average_wait_times = [4.6, 7.6, 6.2, 1400.4]
+    average_turnaround_times = [7.4, 11.0, 9.4, 2330.4]
+    total_execution_times = [14, 17, 16, 4650]
+
+    def starving_processes(self) -> list[Process]:
+        """Builds a workload in which short processes keep a long one at the lowest
+        level.
+
+        Returns:
+            list[Process]: The processes of the workload.
+        """
+
+        processes = [Process("PL", arrival_time=0, execution_time=6)]
+
+        for step in range(1, 21):
+            processes.append(Process(f"P{step}", arrival_time=step, execution_time=1))
+
+        return processes
+
+    def test_demotion(self):
+        """Test that processes that use their whole quantum are moved one level down,
+        down to the lowest level."""
+
+        scheduler = self.Scheduler(
+            [
+                Process("P1", arrival_time=0, execution_time=20),
+                Process("P2", arrival_time=0, execution_time=1),
+            ],
+            quantum_lengths=(1, 2, 4),
+        )
+        scheduler.advance(3)
+
+        assert scheduler._level(0) == 1, "process was not moved down"
+        assert scheduler._table.conclusion_time[1] == 2, "short process waited"
+
+        scheduler.results
+
+        assert scheduler._level(0) == 2, "process went below the lowest level"
+
+    @TestSchedulingAlgorithm.parametrize_test
+    def test_segment_report(self, case_id: int):
+        """Test that the segment report expands back to the execution report, also
+        when running processes start a new quantum on the step they are moved down
+        or boosted.
+
+        Args:
+            case_id (int): The index of the test case.
+        """
+
+        super().test_segment_report(case_id)
+
+        for scheduler in (
+            self.Scheduler(ProcessTable([10, 15], [9, 2])),
+            self.Scheduler(ProcessTable([7, 3], [8, 3]), boost_interval=7),
+        ):
+            segment_report = scheduler.run_segments()
+
+            assert expand_segment_report(segment_report).equals(
+                scheduler.run()
+            ), "segment report does not expand to the execution report"
+
+    def test_single_process(self):
+        """Test that a process moved down keeps running when no other process
+        waits, so it is never left idle."""
+
+        scheduler = self.Scheduler(
+            [Process("P1", arrival_time=0, execution_time=10)],
+            quantum_lengths=(2, 4),
+        )
+        conclusion_time = scheduler.results.conclusion_times[0]
+
+        assert (
+            conclusion_time == 10
+        ), f"incorrect conclusion time. Expected 10, got {conclusion_time}"
+        assert scheduler.results.context_switches == 0, "process was switched out"
+
+    def test_boost(self):
+        """Test that boosts stop short processes from starving a long one."""
+
+        starved = self.Scheduler(self.starving_processes(), quantum_lengths=(4, 8))
+        boosted = self.Scheduler(
+            self.starving_processes(), quantum_lengths=(4, 8), boost_interval=5
+        )
+
+        starved_conclusion_time = starved.results.conclusion_times[0]
+        boosted_conclusion_time = boosted.results.conclusion_times[0]
+
+        assert (
+            starved_conclusion_time == 26
+        ), f"incorrect conclusion time. Expected 26, got {starved_conclusion_time}"
+        assert (
+            boosted_conclusion_time == 10
+        ), f"incorrect conclusion time. Expected 10, got {boosted_conclusion_time}"
+
+    def test_parameters_invalidation(self):
+        """Test that cached results are discarded when the parameters change."""
+
+        scheduler = self.case_4()
+        results = scheduler.results
+
+        scheduler.quantum_lengths = [50, 100]
+
+        assert scheduler.results is not results, "results were not invalidated"
+        assert scheduler.quantum_lengths == (50, 100), "quantum lengths were not kept"
+
+        results = scheduler.results
+        scheduler.boost_interval = 200
+        expected_avg_wait_time = self.Scheduler(
+            scheduler._processes, quantum_lengths=(50, 100), boost_interval=200
+        ).average_wait_time
+
+        assert scheduler.results is not results, "results were not invalidated"
+        assert (
+            scheduler.average_wait_time == expected_avg_wait_time
+        ), f"incorrect average wait time. Expected {expected_avg_wait_time}, got {scheduler.average_wait_time}"
+
+    def test_invalid_parameters(self):
+        """Test that the quantum lengths and the boost interval are validated."""
+
+        scheduler = self.case_1()
+
+        with pytest.raises(TypeError):
+            scheduler.quantum_lengths = 2
+
+        with pytest.raises(TypeError):
+            scheduler.quantum_lengths = (2, 4.0)
+
+        with pytest.raises(ValueError):
+            scheduler.quantum_lengths = ()
+
+        with pytest.raises(ValueError):
+            scheduler.quantum_lengths = (2, 0)
+
+        with pytest.raises(TypeError):
+            scheduler.boost_interval = 1.5
+
+        with pytest.raises(ValueError):
+            scheduler.boost_interval = 0
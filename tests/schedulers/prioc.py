@@ -1,4 +1,6 @@
-from scheduling_sim import PriorityCooperativeScheduler
+import pytest
+
+from scheduling_sim import PriorityCooperativeScheduler, Process
 
 from .scheduling_algorithm import TestSchedulingAlgorithm
 
@@ -22,16 +24,121 @@ class TestPriorityCooperativeScheduler(TestSchedulingAlgorithm):
         case_1(self) -> Scheduler: Defines the first test case scenario and returns a scheduler.
         case_2(self) -> Scheduler: Defines the second test case scenario and returns a scheduler.
         case_3(self) -> Scheduler: Defines the third test case scenario and returns a scheduler.
+        case_4(self) -> Scheduler: Defines the fourth test case scenario and returns a scheduler.
         get_scheduler(self, case_id: int) -> Scheduler: Returns a scheduler based on the
         selected case.
         test_average_wait_time(self, case_id: int): Test for average wait time.
         test_average_turnaround_time(self, case_id: int): Test for average turnaround time.
         test_total_execution_time(self, case_id: int): Test for total execution time.
+        test_execution_report(self, case_id: int): Test for the execution report layout.
+        test_results_invalidation(self, case_id: int): Test for the invalidation of
+        cached results.
+        test_process_table(self, case_id: int): Test for schedules run on a process
+        table.
+        test_run_iter(self, case_id: int): Test for the streamed execution report.
+        test_segment_report(self, case_id: int): Test for the segment report.
+        test_sparse_arrivals(self, case_id: int): Test for schedules that start late
+        and have idle gaps.
+        test_reverse_priority_invalidation(self): Test for the invalidation of cached
+        results when the priority order changes.
+        starving_processes(self) -> list[Process]: Builds a workload in which
+        high-priority processes keep a low-priority one waiting.
+        test_aging(self): Test for the aging of waiting processes.
+        test_aging_interval_invalidation(self): Test for the invalidation of cached
+        results when the aging interval changes.
+        test_invalid_aging_interval(self): Test for the validation of the aging
+        interval.
     """
 
     Scheduler = PriorityCooperativeScheduler
 
     # results
-    average_wait_times = [3.8, 4.6, 5.2]
-    average_turnaround_times = [6.6, 8.0, 8.4]
-    total_execution_times = [14, 17, 16]
+    average_wait_times = [3.8, 4.6, 5.2, 710.0]
+    average_turnaround_times = [6.6, 8.0, 8.4, 1640.0]
+    total_execution_times = [14, 17, 16, 4650]
+
+    def test_reverse_priority_invalidation(self):
+        """Test that cached results are discarded when the priority order changes."""
+
+        scheduler = self.case_1()
+        results = scheduler.results
+
+        scheduler.use_reverse_priority = False
+        expected_avg_wait_time = self.Scheduler(
+            scheduler._processes, use_reverse_priority=False
+        ).average_wait_time
+
+        assert scheduler.results is not results, "results were not invalidated"
+        assert (
+            scheduler.average_wait_time == expected_avg_wait_time
+        ), f"incorrect average wait time. Expected {expected_avg_wait_time}, got {scheduler.average_wait_time}"
+
+    def starving_processes(self) -> list[Process]:
+        """Builds a workload in which high-priority processes keep a low-priority
+        one waiting.
+
+        Returns:
+            list[Process]: The processes of the workload.
+        """
+
+        processes = [Process("PL", arrival_time=1, execution_time=3, priority_level=1)]
+
+        for step in range(0, 40, 2):
+            processes.append(
+                Process(
+                    f"P{step}", arrival_time=step, execution_time=2, priority_level=5
+                )
+            )
+
+        return processes
+
+    def test_aging(self):
+        """Test that aging runs a low-priority process before the high-priority
+        processes stop arriving, both in closed form and step by step."""
+
+        starved = self.Scheduler(self.starving_processes())
+        aged = self.Scheduler(self.starving_processes(), aging_interval=4)
+
+        starved_conclusion_time = starved.results.conclusion_times[0]
+        aged_conclusion_time = aged.results.conclusion_times[0]
+
+        assert (
+            starved_conclusion_time == 43
+        ), f"incorrect conclusion time. Expected 43, got {starved_conclusion_time}"
+        assert (
+            aged_conclusion_time == 21
+        ), f"incorrect conclusion time. Expected 21, got {aged_conclusion_time}"
+
+        scheduler = self.Scheduler(self.starving_processes(), aging_interval=4)
+        scheduler.run()
+
+        assert (
+            scheduler._table.conclusion_time == aged.results.conclusion_times
+        ).all(), "the simulated schedule differs from the closed form"
+
+    def test_aging_interval_invalidation(self):
+        """Test that cached results are discarded when the aging interval changes."""
+
+        scheduler = self.case_4()
+        results = scheduler.results
+
+        scheduler.aging_interval = 100
+        expected_avg_wait_time = self.Scheduler(
+            scheduler._processes, aging_interval=100
+        ).average_wait_time
+
+        assert scheduler.results is not results, "results were not invalidated"
+        assert (
+            scheduler.average_wait_time == expected_avg_wait_time
+        ), f"incorrect average wait time. Expected {expected_avg_wait_time}, got {scheduler.average_wait_time}"
+
+    def test_invalid_aging_interval(self):
+        """Test that the aging interval is validated."""
+
+        scheduler = self.case_1()
+
+        with pytest.raises(TypeError):
+            scheduler.aging_interval = 1.5
+
+        with pytest.raises(ValueError):
+            scheduler.aging_interval = 0
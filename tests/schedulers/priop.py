@@ -1,4 +1,5 @@
-from scheduling_sim import PriorityPreemptiveScheduler
+from scheduling_sim import PriorityPreemptiveScheduler, Process
+from scheduling_sim.process_table import INTERRUPTED, RUNNING
 
 from .scheduling_algorithm import TestSchedulingAlgorithm
 
@@ -22,16 +23,74 @@ class TestPriorityPreemptiveScheduler(TestSchedulingAlgorithm):
         case_1(self) -> Scheduler: Defines the first test case scenario and returns a scheduler.
         case_2(self) -> Scheduler: Defines the second test case scenario and returns a scheduler.
         case_3(self) -> Scheduler: Defines the third test case scenario and returns a scheduler.
+        case_4(self) -> Scheduler: Defines the fourth test case scenario and returns a scheduler.
         get_scheduler(self, case_id: int) -> Scheduler: Returns a scheduler based on the
         selected case.
         test_average_wait_time(self, case_id: int): Test for average wait time.
         test_average_turnaround_time(self, case_id: int): Test for average turnaround time.
         test_total_execution_time(self, case_id: int): Test for total execution time.
+        test_execution_report(self, case_id: int): Test for the execution report layout.
+        test_results_invalidation(self, case_id: int): Test for the invalidation of
+        cached results.
+        test_process_table(self, case_id: int): Test for schedules run on a process
+        table.
+        test_run_iter(self, case_id: int): Test for the streamed execution report.
+        test_segment_report(self, case_id: int): Test for the segment report.
+        test_sparse_arrivals(self, case_id: int): Test for schedules that start late
+        and have idle gaps.
+        starving_processes(self) -> list[Process]: Builds a workload in which
+        high-priority processes keep a low-priority one waiting.
+        test_aging(self): Test for the aging of waiting processes.
     """
 
     Scheduler = PriorityPreemptiveScheduler
 
     # results
-    average_wait_times = [2.8, 5.2, 5.4]
-    average_turnaround_times = [5.6, 8.6, 8.6]
-    total_execution_times = [14, 17, 16]
+    average_wait_times = [2.8, 5.2, 5.4, 650.0]
+    average_turnaround_times = [5.6, 8.6, 8.6, 1580.0]
+    total_execution_times = [14, 17, 16, 4650]
+
+    def starving_processes(self) -> list[Process]:
+        """Builds a workload in which high-priority processes keep a low-priority
+        one waiting.
+
+        Returns:
+            list[Process]: The processes of the workload.
+        """
+
+        processes = [Process("PL", arrival_time=1, execution_time=3, priority_level=1)]
+
+        for step in range(0, 40, 2):
+            processes.append(
+                Process(
+                    f"P{step}", arrival_time=step, execution_time=2, priority_level=5
+                )
+            )
+
+        return processes
+
+    def test_aging(self):
+        """Test that an aged process runs before the high-priority processes stop
+        arriving, and is preempted once a waiting one is a whole level more
+        prioritary than it."""
+
+        starved = self.Scheduler(self.starving_processes())
+        aged = self.Scheduler(self.starving_processes(), aging_interval=2)
+        aged.advance(10)
+
+        assert aged._table.status[0] == RUNNING, "aged process did not run"
+
+        aged.advance(11)
+
+        assert aged._table.status[0] == INTERRUPTED, "aged process was not preempted"
+        assert aged._table.remaining_execution_time[0] == 2, "incorrect progress"
+
+        starved_conclusion_time = starved.results.conclusion_times[0]
+        aged_conclusion_time = aged.results.conclusion_times[0]
+
+        assert (
+            starved_conclusion_time == 43
+        ), f"incorrect conclusion time. Expected 43, got {starved_conclusion_time}"
+        assert (
+            aged_conclusion_time == 34
+        ), f"incorrect conclusion time. Expected 34, got {aged_conclusion_time}"
@@ -22,16 +22,44 @@ class TestRoundRobinScheduler(TestSchedulingAlgorithm):
         case_1(self) -> Scheduler: Defines the first test case scenario and returns a scheduler.
         case_2(self) -> Scheduler: Defines the second test case scenario and returns a scheduler.
         case_3(self) -> Scheduler: Defines the third test case scenario and returns a scheduler.
+        case_4(self) -> Scheduler: Defines the fourth test case scenario and returns a scheduler.
         get_scheduler(self, case_id: int) -> Scheduler: Returns a scheduler based on the
         selected case.
         test_average_wait_time(self, case_id: int): Test for average wait time.
         test_average_turnaround_time(self, case_id: int): Test for average turnaround time.
         test_total_execution_time(self, case_id: int): Test for total execution time.
+        test_execution_report(self, case_id: int): Test for the execution report layout.
+        test_results_invalidation(self, case_id: int): Test for the invalidation of
+        cached results.
+        test_process_table(self, case_id: int): Test for schedules run on a process
+        table.
+        test_run_iter(self, case_id: int): Test for the streamed execution report.
+        test_segment_report(self, case_id: int): Test for the segment report.
+        test_sparse_arrivals(self, case_id: int): Test for schedules that start late
+        and have idle gaps.
+        test_quantum_length_invalidation(self): Test for the invalidation of cached
+        results when the quantum length changes.
     """
 
     Scheduler = RoundRobinScheduler
 
     # results
-    average_wait_times = [5.6, 8.2, 6.8]
-    average_turnaround_times = [8.4, 11.6, 10]
-    total_execution_times = [14, 17, 16]
+    average_wait_times = [5.6, 8.2, 6.8, 1702]
+    average_turnaround_times = [8.4, 11.6, 10, 2632]
+    total_execution_times = [14, 17, 16, 4650]
+
+    def test_quantum_length_invalidation(self):
+        """Test that cached results are discarded when the quantum length changes."""
+
+        scheduler = self.case_1()
+        results = scheduler.results
+
+        scheduler.quantum_length = 3
+        expected_avg_wait_time = self.Scheduler(
+            scheduler._processes, quantum_length=3
+        ).average_wait_time
+
+        assert scheduler.results is not results, "results were not invalidated"
+        assert (
+            scheduler.average_wait_time == expected_avg_wait_time
+        ), f"incorrect average wait time. Expected {expected_avg_wait_time}, got {scheduler.average_wait_time}"
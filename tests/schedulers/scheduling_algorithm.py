@@ -1,6 +1,44 @@
+import numpy as np
 import pytest
 
-from scheduling_sim import Process, SchedulingAlgorithm
+from scheduling_sim import Process, ProcessTable, SchedulingAlgorithm
+from scheduling_sim.execution_report import expand_segment_report
+
+
+def random_table(
+    seed: int,
+    sizes: tuple[int, int] = (1, 40),
+    arrival_times: tuple[int, int] = (5, 120),
+    execution_times: tuple[int, int] = (1, 12),
+    priority_levels: tuple[int, int] = (1, 5),
+) -> ProcessTable:
+    """Builds a random workload with idle gaps and ties.
+
+    Each range includes its lower bound and excludes its upper bound.
+
+    Args:
+        seed (int): The seed of the random generator.
+        sizes (tuple[int, int], optional): The range of the number of processes.
+        Defaults to (1, 40).
+        arrival_times (tuple[int, int], optional): The range of the arrival times.
+        Defaults to (5, 120).
+        execution_times (tuple[int, int], optional): The range of the execution
+        times. Defaults to (1, 12).
+        priority_levels (tuple[int, int], optional): The range of the priority
+        levels, or None to keep the default priority level. Defaults to (1, 5).
+
+    Returns:
+        ProcessTable: The random workload.
+    """
+
+    rng = np.random.default_rng(seed)
+    size = int(rng.integers(*sizes))
+    columns = [rng.integers(*arrival_times, size), rng.integers(*execution_times, size)]
+
+    if priority_levels != None:
+        columns.append(rng.integers(*priority_levels, size))
+
+    return ProcessTable(*columns)
 
 
 class TestSchedulingAlgorithm:
@@ -23,14 +61,24 @@ class TestSchedulingAlgorithm:
         case_1(self) -> Scheduler: Defines the first test case scenario and returns a scheduler.
         case_2(self) -> Scheduler: Defines the second test case scenario and returns a scheduler.
         case_3(self) -> Scheduler: Defines the third test case scenario and returns a scheduler.
+        case_4(self) -> Scheduler: Defines the fourth test case scenario and returns a scheduler.
         get_scheduler(self, case_id: int) -> Scheduler: Returns a scheduler based on the
         selected case.
         test_average_wait_time(self, case_id: int): Test for average wait time.
         test_average_turnaround_time(self, case_id: int): Test for average turnaround time.
         test_total_execution_time(self, case_id: int): Test for total execution time.
+        test_execution_report(self, case_id: int): Test for the execution report layout.
+        test_results_invalidation(self, case_id: int): Test for the invalidation of
+        cached results.
+        test_process_table(self, case_id: int): Test for schedules run on a process
+        table.
+        test_run_iter(self, case_id: int): Test for the streamed execution report.
+        test_segment_report(self, case_id: int): Test for the segment report.
+        test_sparse_arrivals(self, case_id: int): Test for schedules that start late
+        and have idle gaps.
     """
 
-    n_of_test_cases = 3
+    n_of_test_cases = 4
     test_cases = list(range(n_of_test_cases))
     test_cases_ids = [f"Case {i + 1}" for i in test_cases]
 
@@ -94,6 +142,26 @@ class TestSchedulingAlgorithm:
 
         return self.Scheduler(processes)
 
+    def case_4(self) -> Scheduler:
+        """Defines the fourth test case scenario and returns a scheduler.
+
+        The processes have long execution times, so most steps of the schedule
+        have no scheduling events.
+
+        Returns:
+            Scheduler: A scheduler instance for the fourth test case.
+        """
+
+        processes = [
+            Process("P1", arrival_time=0, execution_time=1000, priority_level=2),
+            Process("P2", arrival_time=0, execution_time=400, priority_level=3),
+            Process("P3", arrival_time=100, execution_time=2500, priority_level=1),
+            Process("P4", arrival_time=300, execution_time=50, priority_level=4),
+            Process("P5", arrival_time=500, execution_time=700, priority_level=5),
+        ]
+
+        return self.Scheduler(processes)
+
     def get_scheduler(self, case_id: int) -> Scheduler:
         """Returns a scheduler instance based on the selected test case.
 
@@ -104,7 +172,7 @@ class TestSchedulingAlgorithm:
             Scheduler: A scheduler instance corresponding to the selected test case.
         """
 
-        cases = [self.case_1, self.case_2, self.case_3]
+        cases = [self.case_1, self.case_2, self.case_3, self.case_4]
 
         return cases[case_id]()
 
@@ -156,3 +224,180 @@ class TestSchedulingAlgorithm:
         assert (
             scheduler.total_execution_time == expected_total_execution_time
         ), f"incorrect total execution time. Expected {expected_total_execution_time}, got {scheduler.total_execution_time}"
+
+    @parametrize_test
+    def test_execution_report(self, case_id: int):
+        """Test the layout of the execution report for a specific test case.
+
+        Args:
+            case_id (int): The index of the test case.
+        """
+
+        scheduler = self.get_scheduler(case_id)
+        execution_report = scheduler.run()
+
+        expected_columns = [
+            "time",
+            "process_name",
+            "process_status",
+            "remaining_execution_time",
+            "quantum_progress",
+        ]
+        expected_rows = scheduler.number_of_processes * (
+            int(scheduler.results.conclusion_times.max()) + 1
+        )
+
+        assert (
+            list(execution_report.columns) == expected_columns
+        ), f"incorrect report columns. Expected {expected_columns}, got {list(execution_report.columns)}"
+        assert (
+            len(execution_report) == expected_rows
+        ), f"incorrect number of report rows. Expected {expected_rows}, got {len(execution_report)}"
+
+    @parametrize_test
+    def test_results_invalidation(self, case_id: int):
+        """Test that cached results are discarded when a process is added.
+
+        Args:
+            case_id (int): The index of the test case.
+        """
+
+        scheduler = self.get_scheduler(case_id)
+        results = scheduler.results
+
+        assert scheduler.results is results, "results were not cached"
+
+        scheduler.add_process(Process("P6", arrival_time=0, execution_time=3))
+        expected_avg_wait_time = self.Scheduler(scheduler._processes).average_wait_time
+
+        assert scheduler.results is not results, "results were not invalidated"
+        assert (
+            scheduler.average_wait_time == expected_avg_wait_time
+        ), f"incorrect average wait time. Expected {expected_avg_wait_time}, got {scheduler.average_wait_time}"
+
+    @parametrize_test
+    def test_process_table(self, case_id: int):
+        """Test that a schedule run on a process table has the same results.
+
+        Args:
+            case_id (int): The index of the test case.
+        """
+
+        scheduler = self.get_scheduler(case_id)
+        table = ProcessTable.from_processes(scheduler._processes)
+        table_scheduler = self.Scheduler(table)
+
+        expected_avg_wait_time = self.average_wait_times[case_id]
+
+        assert (
+            table_scheduler.average_wait_time == expected_avg_wait_time
+        ), f"incorrect average wait time. Expected {expected_avg_wait_time}, got {table_scheduler.average_wait_time}"
+
+        expected_conclusion_times = scheduler.results.conclusion_times.tolist()
+        conclusion_times = [process.conclusion_time for process in table]
+
+        assert (
+            conclusion_times == expected_conclusion_times
+        ), f"incorrect conclusion times. Expected {expected_conclusion_times}, got {conclusion_times}"
+
+    @parametrize_test
+    def test_run_iter(self, case_id: int):
+        """Test that the streamed execution report matches the collected one.
+
+        Args:
+            case_id (int): The index of the test case.
+        """
+
+        scheduler = self.get_scheduler(case_id)
+        batches = list(scheduler.run_iter(batch_size=7))
+        execution_report = scheduler.run()
+
+        assert all(
+            len(batch["time"]) <= 7 * scheduler.number_of_processes for batch in batches
+        ), "batches are larger than the batch size"
+
+        for column in execution_report.columns:
+            streamed = [value for batch in batches for value in batch[column]]
+
+            assert (
+                streamed == execution_report[column].tolist()
+            ), f"incorrect streamed column {column}"
+
+        scheduler = self.get_scheduler(case_id)
+        next(scheduler.run_iter())
+
+        assert scheduler._results == None, "unfinished schedule was cached"
+
+    @parametrize_test
+    def test_segment_report(self, case_id: int):
+        """Test that the segment report expands back to the execution report.
+
+        Args:
+            case_id (int): The index of the test case.
+        """
+
+        scheduler = self.get_scheduler(case_id)
+        segment_report = scheduler.run_segments()
+        execution_report = scheduler.run()
+
+        assert expand_segment_report(segment_report).equals(
+            execution_report
+        ), "segment report does not expand to the execution report"
+
+        expected_avg_wait_time = self.average_wait_times[case_id]
+
+        assert (
+            scheduler.average_wait_time == expected_avg_wait_time
+        ), f"incorrect average wait time. Expected {expected_avg_wait_time}, got {scheduler.average_wait_time}"
+
+    @parametrize_test
+    def test_sparse_arrivals(self, case_id: int):
+        """Test that schedules may start late and have idle gaps.
+
+        The processes of the case arrive much later, and another one arrives long
+        after they conclude, so the processor is idle in between.
+
+        Args:
+            case_id (int): The index of the test case.
+        """
+
+        scheduler = self.get_scheduler(case_id)
+        offset = 1_000_000
+        processes = [
+            Process(
+                process.name,
+                process.execution_time,
+                process.priority_level,
+                process.arrival_time + offset,
+            )
+            for process in scheduler._processes
+        ]
+        completion_time = int(scheduler.results.conclusion_times.max()) + offset
+        last_arrival_time = completion_time + offset
+        processes.append(Process("PL", 3, 1, last_arrival_time))
+
+        last_process_results = self.Scheduler([Process("PL", 3, 1, 0)]).results
+        expected_conclusion_times = [
+            *(scheduler.results.conclusion_times + offset),
+            *(last_process_results.conclusion_times + last_arrival_time),
+        ]
+        expected_idle_time = (
+            scheduler.results.idle_time + offset + last_process_results.idle_time
+        )
+
+        sparse_scheduler = self.Scheduler(processes)
+        results = sparse_scheduler.results
+
+        assert (
+            results.conclusion_times.tolist() == expected_conclusion_times
+        ), f"incorrect conclusion times. Expected {expected_conclusion_times}, got {results.conclusion_times.tolist()}"
+        assert (
+            results.idle_time == expected_idle_time
+        ), f"incorrect idle time. Expected {expected_idle_time}, got {results.idle_time}"
+
+        segment_report = sparse_scheduler.run_segments()
+
+        assert segment_report["start"].min() == offset, "schedule did not start late"
+        assert (
+            segment_report["end"].max() == expected_conclusion_times[-1] + 1
+        ), "schedule did not end with the last conclusion"
@@ -0,0 +1,241 @@
+import numpy as np
+import pytest
+
+from scheduling_sim import (
+    FirstComeFirstServeScheduler,
+    PriorityPreemptiveScheduler,
+    Process,
+    ProcessTable,
+    RoundRobinScheduler,
+    ShortestRemainingTimeFirstScheduler,
+    compare_algorithms,
+    simulate_batch,
+    sweep_quantum_lengths,
+)
+from scheduling_sim.batch import (
+    DEFAULT_ALGORITHMS,
+    METRICS_COLUMNS,
+    RANKED_METRICS,
+    SWEEP_COLUMNS,
+    scheduler_metrics,
+)
+
+from .schedulers.scheduling_algorithm import random_table
+
+# Ranges of the random workloads of the tests.
+WORKLOAD: dict[str,] = {
+    "arrival_times": (5, 150),
+    "execution_times": (1, 25),
+    "priority_levels": None,
+}
+
+
+class TestSimulateBatch:
+    """Test Class for the batch simulation of workloads.
+
+    Methods:
+        workloads(self) -> dict[str, ProcessTable]: Builds the workloads of the tests.
+        test_metrics_table(self): Test the layout of the metrics table.
+        test_matches_single_runs(self): Test that the batch metrics match the
+        metrics of each scheduler run on its own.
+        test_invalid_algorithm(self): Test that only scheduling algorithm classes
+        are accepted.
+    """
+
+    algorithms: list[type] = [
+        FirstComeFirstServeScheduler,
+        RoundRobinScheduler,
+        ShortestRemainingTimeFirstScheduler,
+        PriorityPreemptiveScheduler,
+    ]
+
+    params: dict[str,] = {"quantum_length": 3, "use_reverse_priority": False}
+
+    def workloads(self) -> dict[str, ProcessTable]:
+        """Builds the workloads of the tests.
+
+        Returns:
+            dict[str, ProcessTable]: Random workloads, labeled by name.
+        """
+
+        rng = np.random.default_rng(0)
+        workloads = {}
+
+        for index in range(3):
+            size = 50 + index
+            arrival_time = rng.integers(0, 200, size)
+            arrival_time[0] = 0
+
+            workloads[f"W{index}"] = ProcessTable(
+                arrival_time, rng.integers(1, 10, size), rng.integers(1, 5, size)
+            )
+
+        workloads["list"] = [Process("A", 5, 2, 0), Process("B", 3, 1, 1)]
+
+        return workloads
+
+    def test_metrics_table(self):
+        """Test the layout of the metrics table."""
+
+        workloads = self.workloads()
+        report = simulate_batch(workloads, self.algorithms, max_workers=1)
+
+        assert tuple(report.columns) == METRICS_COLUMNS
+        assert len(report) == len(workloads) * len(self.algorithms)
+        assert report["workload"].tolist()[:: len(self.algorithms)] == list(workloads)
+        assert report["algorithm"].tolist()[: len(self.algorithms)] == [
+            algorithm.algorithm_name for algorithm in self.algorithms
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_single_runs(self, max_workers: int):
+        """Test that the batch metrics match the metrics of each scheduler run on its own."""
+
+        workloads = self.workloads()
+        report = simulate_batch(workloads, self.algorithms, self.params, max_workers)
+        rows = iter(report.to_dict(orient="records"))
+
+        for label, workload in workloads.items():
+            for algorithm in self.algorithms:
+                row = next(rows)
+
+                if algorithm == RoundRobinScheduler:
+                    scheduler = algorithm(workload, quantum_length=3)
+                elif algorithm == PriorityPreemptiveScheduler:
+                    scheduler = algorithm(workload, use_reverse_priority=False)
+                else:
+                    scheduler = algorithm(workload)
+
+                assert row["workload"] == label
+                assert row["number_of_processes"] == scheduler.number_of_processes
+                assert row["total_execution_time"] == scheduler.total_execution_time
+                assert row["average_wait_time"] == scheduler.average_wait_time
+                assert (
+                    row["average_turnaround_time"] == scheduler.average_turnaround_time
+                )
+
+    def test_invalid_algorithm(self):
+        """Test that only scheduling algorithm classes are accepted."""
+
+        with pytest.raises(TypeError):
+            simulate_batch(self.workloads(), ["FCFS"])
+
+
+class TestCompareAlgorithms:
+    """Test Class for the ranking of scheduling algorithms.
+
+    Methods:
+        workload(self) -> list[Process]: Builds the workload of the tests.
+        test_ranking(self): Test that the algorithms are ranked by their metrics.
+        test_labels(self): Test that algorithms can be labeled.
+    """
+
+    def workload(self) -> list[Process]:
+        """Builds the workload of the tests.
+
+        Returns:
+            list[Process]: The processes of the workload.
+        """
+
+        return [
+            Process("P1", 10, 2, 0),
+            Process("P2", 4, 3, 0),
+            Process("P3", 25, 1, 1),
+            Process("P4", 1, 4, 3),
+            Process("P5", 7, 5, 5),
+        ]
+
+    def test_ranking(self):
+        """Test that the algorithms are ranked by their metrics."""
+
+        workload = self.workload()
+        ranking = compare_algorithms(workload, max_workers=2)
+
+        assert len(ranking) == len(DEFAULT_ALGORITHMS)
+
+        for metric, rank in RANKED_METRICS.items():
+            expected = ranking[metric].rank(method="min").astype(int)
+
+            assert ranking[rank].tolist() == expected.tolist()
+
+        wait_times = {
+            algorithm.algorithm_name: algorithm(workload).average_wait_time
+            for algorithm in DEFAULT_ALGORITHMS
+        }
+
+        assert ranking["average_wait_time"].tolist() == sorted(wait_times.values())
+        assert ranking["average_wait_time"][0] == wait_times[ranking["algorithm"][0]]
+
+    def test_labels(self):
+        """Test that algorithms can be labeled."""
+
+        algorithms = {
+            "FCFS": FirstComeFirstServeScheduler,
+            "SRTF": ShortestRemainingTimeFirstScheduler,
+        }
+        ranking = compare_algorithms(self.workload(), algorithms, max_workers=1)
+
+        assert ranking["algorithm"].tolist() == ["SRTF", "FCFS"]
+
+
+class TestSweepQuantumLengths:
+    """Test Class for the Round Robin quantum sweep.
+
+    Methods:
+        test_sweep_table(self): Test the layout of the sweep table.
+        test_matches_single_runs(self, max_workers: int): Test that the sweep
+        metrics match the metrics of each quantum length run on its own.
+        test_invalid_quantum_lengths(self): Test that invalid quantum lengths are
+        rejected.
+    """
+
+    def test_sweep_table(self):
+        """Test the layout of the sweep table."""
+
+        report = sweep_quantum_lengths(
+            random_table(0, **WORKLOAD),
+            [8, 2, 5, 2],
+            max_workers=1,
+        )
+
+        assert tuple(report.columns) == SWEEP_COLUMNS
+        assert report["quantum_length"].tolist() == [2, 5, 8]
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_single_runs(self, max_workers: int):
+        """Test that the sweep metrics match the metrics of each quantum length run
+        on its own.
+
+        Args:
+            max_workers (int): The number of worker processes.
+        """
+
+        for seed in range(5):
+            workload = random_table(seed, **WORKLOAD)
+            quantum_lengths = [1, 2, 3, 5, 8, 13, 21]
+            report = sweep_quantum_lengths(workload, quantum_lengths, max_workers)
+
+            for row, quantum_length in zip(
+                report.itertuples(index=False), quantum_lengths
+            ):
+                scheduler = RoundRobinScheduler(
+                    workload.copy(), quantum_length=quantum_length
+                )
+
+                assert tuple(row)[1:] == scheduler_metrics(
+                    scheduler
+                ), f"incorrect metrics for quantum length {quantum_length}"
+
+    def test_invalid_quantum_lengths(self):
+        """Test that invalid quantum lengths are rejected."""
+
+        workload = random_table(0, **WORKLOAD)
+
+        with pytest.raises(ValueError):
+            sweep_quantum_lengths(workload, [])
+
+        with pytest.raises(ValueError):
+            sweep_quantum_lengths(workload, [2, 0])
+
+        with pytest.raises(TypeError):
+            sweep_quantum_lengths(workload, [2, 1.5])
@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from benchmarks.suite import SCHEDULERS, compare_results, main, run_suite
+
+
+class TestBenchmarkSuite:
+    """Test Class for the scheduler benchmark suite.
+
+    Methods:
+        test_run_suite(self): Test that every scheduler is measured on every case.
+        test_compare_results(self): Test that regressions are flagged.
+        test_command_line(self, tmp_path): Test the run and compare commands.
+    """
+
+    grid: dict[str, list] = {
+        "number_of_processes": [20],
+        "mean_burst": [2, 4],
+        "arrival_pattern": ["bursty"],
+    }
+
+    def test_run_suite(self):
+        """Test that every scheduler is measured on every case."""
+
+        results = run_suite(self.grid, repeat=1)
+
+        assert len(results["results"]) == 2 * len(SCHEDULERS)
+        assert results["import_time"] > 0
+
+        for result in results["results"]:
+            assert result["wall_time"] > 0
+            assert result["peak_memory"] > 0
+            assert result["tick_time"] * result["number_of_steps"] == pytest.approx(
+                result["wall_time"]
+            )
+
+    def test_compare_results(self):
+        """Test that regressions are flagged."""
+
+        case = {
+            "scheduler": "RoundRobinScheduler",
+            "number_of_processes": 20,
+            "mean_burst": 2,
+            "arrival_pattern": "bursty",
+            "wall_time": 1.0,
+            "peak_memory": 1000,
+        }
+        baseline = {"import_time": 0.1, "results": [case]}
+        current = {
+            "import_time": 0.1,
+            "results": [{**case, "wall_time": 1.5, "peak_memory": 1100}],
+        }
+
+        comparisons = compare_results(baseline, current, threshold=0.2)
+        regressions = {
+            comparison["measurement"]: comparison["regression"]
+            for comparison in comparisons
+        }
+
+        assert regressions == {
+            "wall_time": True,
+            "peak_memory": False,
+            "import_time": False,
+        }
+
+    def test_command_line(self, tmp_path, monkeypatch):
+        """Test the run and compare commands."""
+
+        monkeypatch.setattr("benchmarks.suite.QUICK_GRID", self.grid)
+        baseline = tmp_path / "baseline.json"
+
+        assert main(["run", "--quick", "-r", "1", "-o", str(baseline)]) == 0
+
+        results = json.loads(baseline.read_text())
+        results["import_time"] *= 2
+
+        current = tmp_path / "current.json"
+        current.write_text(json.dumps(results))
+
+        assert main(["compare", str(baseline), str(current)]) == 1
+        assert main(["compare", str(baseline), str(baseline)]) == 0
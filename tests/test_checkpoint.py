@@ -0,0 +1,206 @@
+import json
+
+import numpy as np
+import pytest
+
+from scheduling_sim import (
+    FirstComeFirstServeScheduler,
+    MultilevelFeedbackQueueScheduler,
+    PriorityCooperativeScheduler,
+    PriorityPreemptiveScheduler,
+    RoundRobinScheduler,
+    ShortestJobFirstScheduler,
+    ShortestRemainingTimeFirstScheduler,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+from .schedulers.scheduling_algorithm import random_table
+
+SCHEDULERS = [
+    (FirstComeFirstServeScheduler, {}),
+    (ShortestJobFirstScheduler, {}),
+    (PriorityCooperativeScheduler, {"use_reverse_priority": True}),
+    (PriorityPreemptiveScheduler, {}),
+    (RoundRobinScheduler, {"quantum_length": 3}),
+    (ShortestRemainingTimeFirstScheduler, {}),
+    (
+        MultilevelFeedbackQueueScheduler,
+        {"quantum_lengths": (1, 3), "boost_interval": 20},
+    ),
+]
+
+METRICS = (
+    "average_turnaround_time",
+    "average_wait_time",
+    "average_response_time",
+    "throughput",
+    "cpu_utilization",
+    "idle_time",
+    "context_switches",
+    "wait_time_percentiles",
+    "turnaround_time_percentiles",
+)
+
+
+class TestCheckpoint:
+    """Test Class for advancing, saving and resuming simulations.
+
+    Methods:
+        assert_same_results(self, results, expected): Asserts that two results
+        match.
+        test_resume_matches_uninterrupted(self, tmp_path, Scheduler: type, params:
+        dict): Test that resumed simulations conclude as uninterrupted ones.
+        test_advance_in_windows(self): Test that advancing a simulation in windows
+        matches simulating it at once.
+        test_checkpoint_contents(self, tmp_path): Test the contents of a checkpoint
+        file.
+        test_concluded_checkpoint(self, tmp_path): Test that concluded schedules
+        are saved at their end.
+        test_invalid_checkpoint(self, tmp_path): Test that checkpoints of other
+        versions are rejected.
+        test_invalid_step(self): Test that only integer steps are accepted.
+    """
+
+    def assert_same_results(self, results, expected):
+        """Asserts that two results match.
+
+        Args:
+            results (SchedulingResult): The results to check.
+            expected (SchedulingResult): The expected results.
+        """
+
+        assert (
+            results.conclusion_times == expected.conclusion_times
+        ).all(), "incorrect conclusion times"
+
+        for metric in METRICS:
+            assert getattr(results, metric) == getattr(
+                expected, metric
+            ), f"incorrect {metric}"
+
+    @pytest.mark.parametrize("Scheduler, params", SCHEDULERS)
+    def test_resume_matches_uninterrupted(
+        self, tmp_path, Scheduler: type, params: dict
+    ):
+        """Test that resumed simulations conclude as uninterrupted ones.
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory.
+            Scheduler (type): The scheduling algorithm class.
+            params (dict): The parameters of the scheduling algorithm.
+        """
+
+        path = tmp_path / "checkpoint.npz"
+
+        for seed in range(10):
+            table = random_table(seed)
+            expected = Scheduler(table.copy(), **params).results
+            start_time = int(table.arrival_time.min())
+            length = int(expected.conclusion_times.max()) - start_time
+
+            scheduler = Scheduler(table.copy(), **params)
+
+            for step in (start_time + length // 3, start_time + 2 * length // 3):
+                scheduler.advance(step)
+
+                assert scheduler.current_time == step + 1, "incorrect current time"
+
+                save_checkpoint(scheduler, path)
+                scheduler = load_checkpoint(path)
+
+                assert type(scheduler) == Scheduler, "incorrect scheduling algorithm"
+                assert (
+                    scheduler._parameters() == Scheduler(table, **params)._parameters()
+                ), "incorrect parameters"
+
+            self.assert_same_results(scheduler.results, expected)
+
+    def test_advance_in_windows(self):
+        """Test that advancing a simulation in windows matches simulating it at
+        once."""
+
+        table = random_table(0)
+        expected = RoundRobinScheduler(table.copy()).results
+
+        scheduler = RoundRobinScheduler(table.copy())
+        step = 0
+
+        while not scheduler.advance(step):
+            step += 7
+
+        assert scheduler.current_time == int(expected.conclusion_times.max()) + 1
+        self.assert_same_results(scheduler.results, expected)
+
+    def test_checkpoint_contents(self, tmp_path):
+        """Test the contents of a checkpoint file.
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory.
+        """
+
+        path = tmp_path / "checkpoint"
+        scheduler = RoundRobinScheduler(random_table(1), quantum_length=4)
+        scheduler.advance(50)
+        save_checkpoint(scheduler, path)
+
+        assert path.exists(), "checkpoint was saved to another path"
+
+        with np.load(path, allow_pickle=False) as archive:
+            metadata = json.loads(archive["metadata"].item())
+            status = archive["status"]
+            names = archive["names"]
+
+        assert metadata["algorithm"] == "RoundRobinScheduler"
+        assert metadata["parameters"] == {"quantum_length": 4}
+        assert metadata["state"]["time"] == 51
+        assert (status == scheduler._table.status).all(), "incorrect statuses"
+        assert names.tolist() == scheduler._table.names, "incorrect names"
+
+    def test_concluded_checkpoint(self, tmp_path):
+        """Test that concluded schedules are saved at their end.
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory.
+        """
+
+        path = tmp_path / "checkpoint.npz"
+        scheduler = ShortestJobFirstScheduler(random_table(2))
+        expected = scheduler.results
+        save_checkpoint(scheduler, path)
+
+        resumed = load_checkpoint(path)
+
+        assert resumed.advance(0), "schedule was not concluded"
+        self.assert_same_results(resumed.results, expected)
+
+    def test_invalid_checkpoint(self, tmp_path):
+        """Test that checkpoints of other versions are rejected.
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory.
+        """
+
+        path = tmp_path / "checkpoint.npz"
+        save_checkpoint(FirstComeFirstServeScheduler(random_table(3)), path)
+
+        with np.load(path, allow_pickle=False) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+
+        metadata = json.loads(arrays["metadata"].item())
+        metadata["version"] += 1
+        arrays["metadata"] = np.array(json.dumps(metadata))
+
+        with open(path, "wb") as file:
+            np.savez(file, **arrays)
+
+        with pytest.raises(ValueError):
+            load_checkpoint(path)
+
+    def test_invalid_step(self):
+        """Test that only integer steps are accepted."""
+
+        scheduler = RoundRobinScheduler(random_table(4))
+
+        with pytest.raises(TypeError):
+            scheduler.advance(1.5)
@@ -0,0 +1,135 @@
+import pandas as pd
+import pytest
+
+from scheduling_sim import FirstComeFirstServeScheduler, RoundRobinScheduler
+from scheduling_sim.cli import main
+from scheduling_sim.workload import read_workload
+
+
+class TestCommandLine:
+    """Test Class for the command line batch runner.
+
+    Methods:
+        write_workload(self, directory) -> str: Writes a workload file.
+        test_read_workload(self, tmp_path): Test that workload files are read into
+        process tables.
+        test_reports(self, tmp_path): Test that metrics and execution reports are
+        exported.
+        test_no_report(self, tmp_path): Test that only metrics are exported when
+        reports are disabled.
+        test_invalid_arguments(self, tmp_path, arguments: list[str]): Test that
+        invalid numeric arguments are rejected before any simulation.
+        test_duplicate_workload_names(self, tmp_path): Test that workloads with the
+        same file name are rejected instead of overwriting each other's reports.
+    """
+
+    def write_workload(self, directory) -> str:
+        """Writes a workload file.
+
+        Args:
+            directory (pathlib.Path): The directory of the file.
+
+        Returns:
+            str: The path of the workload file.
+        """
+
+        path = str(directory / "workload.csv")
+
+        pd.DataFrame(
+            {
+                "Process Name": ["A", "B", "C"],
+                "Arrival Time": [0, 1, 2],
+                "Execution Time": [5, 3, 8],
+                "Priority Level": [2, 1, 3],
+            }
+        ).to_csv(path, index=False)
+
+        return path
+
+    def test_read_workload(self, tmp_path):
+        """Test that workload files are read into process tables."""
+
+        table = read_workload(self.write_workload(tmp_path))
+
+        assert table.names == ["A", "B", "C"]
+        assert table.arrival_time.tolist() == [0, 1, 2]
+        assert table.execution_time.tolist() == [5, 3, 8]
+        assert table.priority_level.tolist() == [2, 1, 3]
+
+    def test_reports(self, tmp_path):
+        """Test that metrics and execution reports are exported."""
+
+        path = self.write_workload(tmp_path)
+        output = tmp_path / "output"
+
+        main([path, "-a", "FCFS", "RR", "-q", "3", "-o", str(output), "-j", "1"])
+
+        metrics = pd.read_csv(output / "metrics.csv")
+        scheduler = RoundRobinScheduler(read_workload(path), quantum_length=3)
+
+        assert metrics["algorithm"].tolist() == ["FCFS", "RR"]
+        assert metrics["average_wait_time"][1] == scheduler.average_wait_time
+
+        report = pd.read_csv(output / "workload_RR.csv")
+
+        assert report.equals(scheduler.run())
+        assert (output / "workload_FCFS.csv").exists()
+
+    def test_no_report(self, tmp_path):
+        """Test that only metrics are exported when reports are disabled."""
+
+        path = self.write_workload(tmp_path)
+        output = tmp_path / "output"
+
+        main([path, "-a", "FCFS", "-o", str(output), "--no-report", "-j", "1"])
+
+        metrics = pd.read_csv(output / "metrics.csv")
+        scheduler = FirstComeFirstServeScheduler(read_workload(path))
+
+        assert sorted(file.name for file in output.iterdir()) == ["metrics.csv"]
+        assert metrics["average_turnaround_time"][0] == (
+            scheduler.average_turnaround_time
+        )
+
+    @pytest.mark.parametrize(
+        "arguments",
+        [["-q", "0"], ["-q", "two"], ["--aging", "-1"], ["-j", "0"]],
+    )
+    def test_invalid_arguments(self, tmp_path, arguments: list[str]):
+        """Test that invalid numeric arguments are rejected before any simulation.
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory.
+            arguments (list[str]): The invalid arguments.
+        """
+
+        path = self.write_workload(tmp_path)
+        output = tmp_path / "output"
+
+        with pytest.raises(SystemExit) as exit_info:
+            main([path, "-o", str(output), *arguments])
+
+        assert exit_info.value.code == 2, "arguments were not rejected as usage errors"
+        assert not output.exists(), "work was done before rejecting the arguments"
+
+    def test_duplicate_workload_names(self, tmp_path):
+        """Test that workloads with the same file name are rejected instead of
+        overwriting each other's reports.
+
+        Args:
+            tmp_path (pathlib.Path): A temporary directory.
+        """
+
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        paths = [
+            self.write_workload(tmp_path / "a"),
+            self.write_workload(tmp_path / "b"),
+        ]
+        output = tmp_path / "output"
+
+        with pytest.raises(SystemExit) as exit_info:
+            main([*paths, "-o", str(output)])
+
+        assert exit_info.value.code == 2, "workloads were not rejected as usage errors"
+        assert not output.exists(), "work was done before rejecting the workloads"
@@ -0,0 +1,112 @@
+import numpy as np
+
+from scheduling_sim import (
+    FirstComeFirstServeScheduler,
+    PriorityCooperativeScheduler,
+    ProcessTable,
+    ShortestJobFirstScheduler,
+)
+from scheduling_sim.scheduling_algorithms.closed_form import (
+    first_come_first_serve_start_times,
+    non_preemptive_start_times,
+)
+
+from .schedulers.scheduling_algorithm import random_table
+
+# Ranges of the random workloads of the tests.
+WORKLOAD: dict[str,] = {
+    "sizes": (1, 30),
+    "arrival_times": (0, 60),
+    "execution_times": (1, 10),
+}
+
+
+class TestClosedForm:
+    """Test Class for the closed-form metrics of the non-preemptive schedulers.
+
+    Methods:
+        test_first_come_first_serve_start_times(self): Test the First Come First
+        Serve start times against a hand-made example.
+        test_non_preemptive_start_times(self): Test the non-preemptive start times
+        against a hand-made example.
+        test_large_keys(self): Test that keys too large for 64-bit heap entries give
+        the same start times.
+        test_closed_form_matches_simulation(self): Test that the closed form leaves
+        the processes as the simulation does.
+    """
+
+    def test_first_come_first_serve_start_times(self):
+        """Test the First Come First Serve start times against a hand-made example."""
+
+        arrival_time = np.array([0, 10, 2, 2])
+        execution_time = np.array([3, 1, 4, 2])
+
+        start_time = first_come_first_serve_start_times(arrival_time, execution_time)
+
+        assert start_time.tolist() == [0, 10, 3, 7], f"Got {start_time.tolist()}"
+
+    def test_non_preemptive_start_times(self):
+        """Test the non-preemptive start times against a hand-made example."""
+
+        arrival_time = np.array([0, 1, 1, 2, 20])
+        execution_time = np.array([5, 4, 2, 2, 1])
+
+        start_time = non_preemptive_start_times(
+            arrival_time, execution_time, execution_time
+        )
+
+        assert start_time.tolist() == [0, 9, 5, 7, 20], f"Got {start_time.tolist()}"
+
+    def test_large_keys(self):
+        """Test that keys too large for 64-bit heap entries give the same start
+        times."""
+
+        for seed in range(20):
+            table = random_table(seed, **WORKLOAD)
+            keys = table.execution_time
+
+            start_time = non_preemptive_start_times(
+                table.arrival_time, table.execution_time, keys
+            )
+            large_key_start_time = non_preemptive_start_times(
+                table.arrival_time, table.execution_time, keys * 2**58
+            )
+
+            assert np.array_equal(
+                start_time, large_key_start_time
+            ), f"incorrect start times for seed {seed}"
+
+    def test_closed_form_matches_simulation(self):
+        """Test that the closed form leaves the processes as the simulation does."""
+
+        schedulers = [
+            lambda table: FirstComeFirstServeScheduler(table),
+            lambda table: ShortestJobFirstScheduler(table),
+            lambda table: PriorityCooperativeScheduler(table),
+            lambda table: PriorityCooperativeScheduler(table, False),
+        ]
+
+        for seed in range(50):
+            table = random_table(seed, **WORKLOAD)
+
+            for build_scheduler in schedulers:
+                scheduler = build_scheduler(table)
+
+                results = scheduler.results
+                closed_form = {
+                    column: getattr(table, column).copy()
+                    for column in ProcessTable.columns
+                }
+
+                scheduler.run()
+
+                for column, values in closed_form.items():
+                    simulated = getattr(table, column)
+
+                    assert np.array_equal(
+                        values, simulated
+                    ), f"incorrect {column} for seed {seed}. Got {values}, expected {simulated}"
+
+                assert np.array_equal(
+                    results.conclusion_times, scheduler.results.conclusion_times
+                ), f"incorrect conclusion times for seed {seed}"
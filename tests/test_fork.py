@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from scheduling_sim import (
+    FirstComeFirstServeScheduler,
+    MultilevelFeedbackQueueScheduler,
+    PriorityPreemptiveScheduler,
+    ProcessTable,
+    RoundRobinScheduler,
+    ShortestRemainingTimeFirstScheduler,
+)
+from scheduling_sim.process_table import TERMINATED
+
+from .schedulers.scheduling_algorithm import random_table
+
+SCHEDULERS = [
+    (FirstComeFirstServeScheduler, {}),
+    (PriorityPreemptiveScheduler, {}),
+    (RoundRobinScheduler, {"quantum_length": 3}),
+    (ShortestRemainingTimeFirstScheduler, {}),
+    (
+        MultilevelFeedbackQueueScheduler,
+        {"quantum_lengths": (1, 3), "boost_interval": 20},
+    ),
+]
+
+
+class TestFork:
+    """Test Class for forking simulations in flight.
+
+    Methods:
+        test_fork_matches_uninterrupted(self, Scheduler: type, params: dict): Test
+        that forks with the same algorithm conclude as the original simulation.
+        test_fork_at_start(self, Scheduler: type, params: dict): Test that forks at
+        the start of a schedule conclude as new simulations.
+        test_policy_switch(self): Test that forks keep the processes concluded
+        before the switch.
+        test_shared_columns(self): Test that forks share the process attributes.
+        test_invalid_algorithm(self): Test that only scheduling algorithms are
+        accepted.
+    """
+
+    @pytest.mark.parametrize("Scheduler, params", SCHEDULERS)
+    def test_fork_matches_uninterrupted(self, Scheduler: type, params: dict):
+        """Test that forks with the same algorithm conclude as the original
+        simulation.
+
+        Args:
+            Scheduler (type): The scheduling algorithm class.
+            params (dict): The parameters of the scheduling algorithm.
+        """
+
+        for seed in range(10):
+            table = random_table(seed)
+            expected = Scheduler(table.copy(), **params).results
+
+            scheduler = Scheduler(table.copy(), **params)
+            scheduler.advance(int(expected.conclusion_times.mean()))
+            forked = scheduler.fork()
+
+            assert forked.current_time == scheduler.current_time
+            assert (
+                forked.results.conclusion_times == expected.conclusion_times
+            ).all(), "incorrect conclusion times of the fork"
+            assert (
+                scheduler.results.conclusion_times == expected.conclusion_times
+            ).all(), "the fork changed the original simulation"
+            assert (
+                forked.results.wait_time_percentiles == expected.wait_time_percentiles
+            ), "incorrect wait time percentiles of the fork"
+
+    @pytest.mark.parametrize("Scheduler, params", SCHEDULERS)
+    def test_fork_at_start(self, Scheduler: type, params: dict):
+        """Test that forks at the start of a schedule conclude as new simulations.
+
+        Args:
+            Scheduler (type): The scheduling algorithm class.
+            params (dict): The parameters of the scheduling algorithm.
+        """
+
+        table = random_table(0)
+        expected = Scheduler(table.copy(), **params).results
+
+        forked = PriorityPreemptiveScheduler(table.copy()).fork(Scheduler, **params)
+
+        assert type(forked) == Scheduler, "incorrect scheduling algorithm"
+        assert (
+            forked.results.conclusion_times == expected.conclusion_times
+        ).all(), "incorrect conclusion times"
+
+    def test_policy_switch(self):
+        """Test that forks keep the processes concluded before the switch."""
+
+        table = random_table(1)
+        scheduler = PriorityPreemptiveScheduler(table.copy())
+        scheduler.advance(60)
+
+        concluded = scheduler._table.status == TERMINATED
+        conclusion_times = scheduler._table.conclusion_time[concluded]
+
+        for quantum_length in (1, 2, 5):
+            forked = scheduler.fork(RoundRobinScheduler, quantum_length=quantum_length)
+            results = forked.results
+
+            assert forked.quantum_length == quantum_length, "incorrect parameters"
+            assert (
+                forked._table.status == TERMINATED
+            ).all(), "processes were not concluded"
+            assert (
+                results.conclusion_times[concluded] == conclusion_times
+            ).all(), "processes concluded before the switch changed"
+
+        assert scheduler.current_time == 61, "the forks advanced the original"
+
+    def test_shared_columns(self):
+        """Test that forks share the process attributes."""
+
+        scheduler = RoundRobinScheduler(random_table(2))
+        scheduler.advance(40)
+        forked = scheduler.fork(quantum_length=5)
+
+        assert forked.quantum_length == 5, "incorrect parameters"
+        assert np.shares_memory(
+            forked._table.arrival_time, scheduler._table.arrival_time
+        ), "arrival times were copied"
+        assert not np.shares_memory(
+            forked._table.status, scheduler._table.status
+        ), "statuses were shared"
+
+    def test_invalid_algorithm(self):
+        """Test that only scheduling algorithms are accepted."""
+
+        scheduler = RoundRobinScheduler(random_table(3))
+
+        with pytest.raises(TypeError):
+            scheduler.fork(ProcessTable)
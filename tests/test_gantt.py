@@ -0,0 +1,89 @@
+import numpy as np
+from matplotlib.figure import Figure
+
+from scheduling_sim import Process, ProcessTable, RoundRobinScheduler
+from scheduling_sim.gantt import gantt_intervals, merge_intervals, plot_gantt_chart
+
+
+class TestGanttChart:
+    """Test Class for drawing the Gantt chart of a schedule.
+
+    Methods:
+        test_merge_intervals(self): Test that intervals are merged within groups.
+        test_gantt_intervals(self): Test the bars of a small schedule.
+        test_level_of_detail(self): Test that long schedules are aggregated.
+        test_plot_gantt_chart(self): Test that each process is drawn with one
+        artist per kind of bar.
+    """
+
+    def scheduler(self) -> RoundRobinScheduler:
+        """Builds a small Round Robin schedule.
+
+        Returns:
+            RoundRobinScheduler: The scheduler.
+        """
+
+        return RoundRobinScheduler(
+            [Process("A", 5, 2, 0), Process("B", 3, 1, 1), Process("C", 8, 3, 2)]
+        )
+
+    def test_merge_intervals(self):
+        """Test that intervals are merged within groups."""
+
+        start = np.array([0, 2, 5, 6, 0, 1])
+        end = np.array([2, 4, 6, 8, 1, 3])
+        groups = np.array([0, 0, 0, 0, 1, 1])
+
+        bars, bar_groups = merge_intervals(start, end, groups)
+
+        assert bars.tolist() == [[0, 4], [5, 3], [0, 3]]
+        assert bar_groups.tolist() == [0, 0, 1]
+
+        bars, bar_groups = merge_intervals(start, end, groups, resolution=1)
+
+        assert bars.tolist() == [[0, 8], [0, 3]]
+
+    def test_gantt_intervals(self):
+        """Test the bars of a small schedule."""
+
+        intervals = gantt_intervals(self.scheduler().run_segments(), max_bars=None)
+
+        assert list(intervals) == ["A", "B", "C"]
+        assert intervals["A"]["running"].tolist() == [[0, 2], [6, 2], [11, 1]]
+        assert intervals["B"]["waiting"].tolist() == [[1, 1], [4, 4]]
+
+    def test_level_of_detail(self):
+        """Test that long schedules are aggregated."""
+
+        rng = np.random.default_rng(0)
+        arrival_time = rng.integers(0, 5000, 20)
+        arrival_time[0] = 0
+        table = ProcessTable(arrival_time, rng.integers(1, 500, 20))
+        scheduler = RoundRobinScheduler(table)
+        segment_report = scheduler.run_segments()
+
+        intervals = gantt_intervals(segment_report, max_bars=50)
+
+        for bars in intervals.values():
+            for kind_bars in bars.values():
+                assert len(kind_bars) <= 50 + 1, "too many bars"
+
+        running_time = sum(
+            bars["running"][:, 1].sum()
+            for bars in gantt_intervals(segment_report, max_bars=None).values()
+        )
+
+        running_steps = (scheduler.run()["process_status"] == "Running").sum()
+
+        assert running_time == running_steps
+
+    def test_plot_gantt_chart(self):
+        """Test that each process is drawn with one artist per kind of bar."""
+
+        intervals = gantt_intervals(self.scheduler().run_segments())
+        ax = Figure().subplots()
+
+        plot_gantt_chart(ax, intervals, {process: "#316AD0" for process in intervals})
+
+        assert len(ax.collections) == 2 * len(intervals)
+        assert [label.get_text() for label in ax.get_yticklabels()] == ["A", "B", "C"]
@@ -0,0 +1,149 @@
+import numpy as np
+import pytest
+
+from scheduling_sim import FirstComeFirstServeScheduler, ProcessTable
+from scheduling_sim.generator import WorkloadGenerator
+from scheduling_sim.workload import read_workload
+
+
+class TestWorkloadGenerator:
+    """Test Class for the synthetic workload generator.
+
+    Methods:
+        assert_same_processes(self, table: ProcessTable, other: ProcessTable):
+        Asserts that two tables hold the same processes.
+        test_reproducibility(self): Test that a seed always generates the same
+        workload.
+        test_chunks(self, chunk_size: int): Test that chunks make up the same
+        workload.
+        test_distributions(self): Test the means of the generated attributes.
+        test_write(self, tmp_path): Test that workloads are streamed to disk.
+        test_array_weights(self): Test that priority weights may be a NumPy array.
+        test_invalid_parameters(self): Test that invalid parameters are rejected.
+    """
+
+    def assert_same_processes(self, table: ProcessTable, other: ProcessTable):
+        """Asserts that two tables hold the same processes.
+
+        Args:
+            table (ProcessTable): A table.
+            other (ProcessTable): Another table.
+        """
+
+        for column in ("arrival_time", "execution_time", "priority_level"):
+            assert np.array_equal(
+                getattr(table, column), getattr(other, column)
+            ), f"different {column}"
+
+    def test_reproducibility(self):
+        """Test that a seed always generates the same workload."""
+
+        generator = WorkloadGenerator("bursty", priority_weights=[1, 2], seed=7)
+        table = generator.generate(1000)
+
+        self.assert_same_processes(table, generator.generate(1000))
+        self.assert_same_processes(
+            table,
+            WorkloadGenerator("bursty", priority_weights=[1, 2], seed=7).generate(1000),
+        )
+
+        other = WorkloadGenerator("bursty", priority_weights=[1, 2], seed=8)
+
+        assert not np.array_equal(
+            table.execution_time, other.generate(1000).execution_time
+        )
+
+    @pytest.mark.parametrize("chunk_size", [1, 64, 999, 5000])
+    def test_chunks(self, chunk_size: int):
+        """Test that chunks make up the same workload."""
+
+        for arrival_pattern in ("poisson", "bursty"):
+            for burst_distribution in ("exponential", "lognormal", "bimodal"):
+                generator = WorkloadGenerator(
+                    arrival_pattern,
+                    burst_distribution=burst_distribution,
+                    priority_weights=[3, 1, 1],
+                    seed=1,
+                )
+                chunks = list(generator.chunks(1000, chunk_size))
+                table = generator.generate(1000)
+
+                assert all(len(chunk) <= chunk_size for chunk in chunks)
+
+                for column in ("arrival_time", "execution_time", "priority_level"):
+                    streamed = np.concatenate([getattr(c, column) for c in chunks])
+
+                    assert np.array_equal(
+                        streamed, getattr(table, column)
+                    ), f"different {column} for {arrival_pattern}, {burst_distribution}"
+
+    def test_distributions(self):
+        """Test the means of the generated attributes."""
+
+        size = 200_000
+        table = WorkloadGenerator(
+            arrival_rate=0.5, mean_burst=10, priority_weights=[1, 3], seed=3
+        ).generate(size)
+
+        assert table.arrival_time[0] == 0
+        assert np.all(np.diff(table.arrival_time) >= 0)
+        assert table.arrival_time[-1] == pytest.approx(size / 0.5, rel=0.02)
+        # execution times are rounded up, which adds half a tick on average
+        assert table.execution_time.mean() == pytest.approx(10.5, rel=0.02)
+        assert (table.priority_level == 2).mean() == pytest.approx(0.75, abs=0.01)
+
+        bursty = WorkloadGenerator("bursty", mean_batch_size=5, seed=3).generate(size)
+        batches = len(np.unique(bursty.arrival_time))
+
+        assert size / batches == pytest.approx(5, rel=0.05)
+
+        lognormal = WorkloadGenerator(
+            burst_distribution="lognormal", mean_burst=20, burst_sigma=0.5, seed=3
+        ).generate(size)
+
+        assert lognormal.execution_time.mean() == pytest.approx(20.5, rel=0.02)
+
+        scheduler = FirstComeFirstServeScheduler(bursty)
+
+        assert scheduler.average_wait_time >= 0
+
+    def test_write(self, tmp_path):
+        """Test that workloads are streamed to disk."""
+
+        generator = WorkloadGenerator("bursty", priority_weights=[1, 1, 1], seed=5)
+        path = str(tmp_path / "workload.csv")
+
+        generator.write(path, 2500, chunk_size=1000)
+
+        self.assert_same_processes(read_workload(path), generator.generate(2500))
+
+        with pytest.raises(ValueError):
+            generator.write(str(tmp_path / "workload.txt"), 10)
+
+    def test_array_weights(self):
+        """Test that priority weights may be a NumPy array."""
+
+        table = WorkloadGenerator(priority_weights=np.array([0, 1]), seed=2).generate(
+            100
+        )
+
+        assert (table.priority_level == 2).all(), "levels ignored the weights"
+
+    def test_invalid_parameters(self):
+        """Test that invalid parameters are rejected."""
+
+        for parameters in (
+            {"arrival_pattern": "uniform"},
+            {"burst_distribution": "normal"},
+            {"arrival_rate": 0},
+            {"mean_batch_size": 0.5},
+            {"long_burst_fraction": 2},
+            {"priority_weights": []},
+            {"priority_weights": [0, 0]},
+            {"priority_weights": np.zeros(3)},
+        ):
+            with pytest.raises(ValueError):
+                WorkloadGenerator(**parameters)
+
+        with pytest.raises(ValueError):
+            next(WorkloadGenerator().chunks(10, 0))
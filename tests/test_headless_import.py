@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+
+class TestHeadlessImport:
+    """Test Class for importing the simulator without its optional layers.
+
+    Methods:
+        loaded_modules(self, code: str) -> list[str]: Runs code in a fresh
+        interpreter and returns the heavy modules it loaded.
+        test_core_import(self): Test that importing the core does not load the
+        user interface, pandas or matplotlib.
+        test_lazy_attributes(self): Test that the optional layers load when used.
+    """
+
+    heavy_modules: tuple[str] = ("pandas", "matplotlib", "PySimpleGUI", "tkinter")
+
+    def loaded_modules(self, code: str) -> list[str]:
+        """Runs code in a fresh interpreter and returns the heavy modules it loaded.
+
+        Args:
+            code (str): The code to run.
+
+        Returns:
+            list[str]: The heavy modules loaded by the code.
+        """
+
+        code += f"\nimport sys\nprint(*[m for m in {self.heavy_modules!r} if m in sys.modules])"
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        return output.split()
+
+    def test_core_import(self):
+        """Test that importing the core does not load the user interface, pandas or matplotlib."""
+
+        loaded = self.loaded_modules(
+            "import scheduling_sim\n"
+            "from scheduling_sim import Process, RoundRobinScheduler\n"
+            "scheduler = RoundRobinScheduler([Process('P1', 3), Process('P2', 2)])\n"
+            "assert scheduler.average_wait_time == 2.0"
+        )
+
+        assert loaded == [], f"heavy modules loaded on import: {loaded}"
+
+    def test_lazy_attributes(self):
+        """Test that the optional layers load when used."""
+
+        loaded = self.loaded_modules("from scheduling_sim import simulate_batch")
+
+        assert "pandas" in loaded
@@ -0,0 +1,214 @@
+import math
+
+import numpy as np
+import pytest
+
+from scheduling_sim import (
+    FirstComeFirstServeScheduler,
+    PriorityCooperativeScheduler,
+    Process,
+    RoundRobinScheduler,
+    ShortestJobFirstScheduler,
+    ShortestRemainingTimeFirstScheduler,
+)
+from scheduling_sim.metrics import PERCENTILES, QuantileSketch
+from scheduling_sim.process_table import TERMINATED
+
+from .schedulers.scheduling_algorithm import random_table
+
+# Ranges of the random workloads of the tests.
+WORKLOAD: dict[str,] = {"arrival_times": (0, 80), "execution_times": (1, 10)}
+
+
+class TestQuantileSketch:
+    """Test Class for the streaming quantile sketch.
+
+    Methods:
+        random_values(self, seed: int) -> np.ndarray: Draws random wait times.
+        test_relative_accuracy(self, seed: int): Test that quantiles are estimated
+        within the relative accuracy.
+        test_add_array(self): Test that adding values at once matches adding them
+        one by one.
+        test_merge(self): Test that merged sketches match a single sketch.
+        test_empty_sketch(self): Test the quantiles of an empty sketch.
+        test_invalid_quantile(self): Test that quantiles out of range are rejected.
+    """
+
+    def random_values(self, seed: int) -> np.ndarray:
+        """Draws random wait times, with many zeros and a long tail.
+
+        Args:
+            seed (int): The seed of the random generator.
+
+        Returns:
+            np.ndarray: The random values.
+        """
+
+        rng = np.random.default_rng(seed)
+        values = np.ceil(rng.lognormal(3, 1.5, 5000))
+        values[rng.random(5000) < 0.3] = 0
+
+        return values
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_relative_accuracy(self, seed: int):
+        """Test that quantiles are estimated within the relative accuracy.
+
+        Args:
+            seed (int): The seed of the random values.
+        """
+
+        values = self.random_values(seed)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+
+        for value in values:
+            sketch.add(value)
+
+        for q in (0, 0.1, 0.5, 0.9, 0.95, 0.99, 1):
+            expected = np.quantile(values, q)
+
+            assert sketch.quantile(q) == pytest.approx(
+                expected, rel=0.01
+            ), f"incorrect quantile {q}. Expected about {expected}, got {sketch.quantile(q)}"
+
+    def test_add_array(self):
+        """Test that adding values at once matches adding them one by one."""
+
+        values = self.random_values(0)
+        sketch = QuantileSketch()
+        array_sketch = QuantileSketch()
+
+        for value in values:
+            sketch.add(value)
+
+        array_sketch.add_array(values)
+
+        assert array_sketch.count == sketch.count
+        assert [array_sketch.quantile(q / 100) for q in range(101)] == [
+            sketch.quantile(q / 100) for q in range(101)
+        ]
+
+    def test_merge(self):
+        """Test that merged sketches match a single sketch."""
+
+        values = self.random_values(1)
+        sketch = QuantileSketch()
+        sketch.add_array(values)
+
+        merged = QuantileSketch()
+        merged.add_array(values[:1000])
+        other = QuantileSketch()
+        other.add_array(values[1000:])
+        merged.merge(other)
+
+        assert merged.count == sketch.count
+        assert [merged.quantile(q / 100) for q in range(101)] == [
+            sketch.quantile(q / 100) for q in range(101)
+        ]
+
+        with pytest.raises(ValueError):
+            merged.merge(QuantileSketch(relative_accuracy=0.05))
+
+    def test_empty_sketch(self):
+        """Test the quantiles of an empty sketch."""
+
+        assert math.isnan(QuantileSketch().quantile(0.5))
+
+    def test_invalid_quantile(self):
+        """Test that quantiles out of range are rejected."""
+
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(1.5)
+
+
+class TestOnlineMetrics:
+    """Test Class for the metrics accumulated while a schedule is simulated.
+
+    Methods:
+        test_hand_made_example(self): Test the metrics against a hand-made example.
+        test_closed_form_matches_simulation(self, seed: int): Test that the closed
+        form accumulates the same metrics as the simulation.
+        test_percentiles(self, Scheduler: type): Test the percentiles of the wait and
+        turnaround times.
+    """
+
+    def test_hand_made_example(self):
+        """Test the metrics against a hand-made example.
+
+        P1 runs from 0 to 2, the processor is idle until P2 and P3 arrive at 4, P2
+        runs from 4 to 5 and P3 runs from 5 to 8.
+        """
+
+        processes = [
+            Process("P1", arrival_time=0, execution_time=2),
+            Process("P2", arrival_time=4, execution_time=1),
+            Process("P3", arrival_time=4, execution_time=3),
+        ]
+
+        closed_form = FirstComeFirstServeScheduler(processes).results
+        simulated = FirstComeFirstServeScheduler(processes)
+        simulated.run()
+
+        for results in (closed_form, simulated.results):
+            assert results.idle_time == 2
+            assert results.context_switches == 2
+            assert results.average_response_time == pytest.approx(1 / 3)
+            assert results.throughput == pytest.approx(3 / 8)
+            assert results.cpu_utilization == pytest.approx(6 / 8)
+            assert results.wait_time_percentiles[50] == 0
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_closed_form_matches_simulation(self, seed: int):
+        """Test that the closed form accumulates the same metrics as the simulation.
+
+        Args:
+            seed (int): The seed of the random workload.
+        """
+
+        table = random_table(seed, **WORKLOAD)
+
+        for Scheduler in (
+            FirstComeFirstServeScheduler,
+            ShortestJobFirstScheduler,
+            PriorityCooperativeScheduler,
+        ):
+            closed_form = Scheduler(table.copy()).results
+            scheduler = Scheduler(table.copy())
+            scheduler.run()
+            simulated = scheduler.results
+
+            for metric in (
+                "average_response_time",
+                "throughput",
+                "cpu_utilization",
+                "idle_time",
+                "context_switches",
+                "wait_time_percentiles",
+                "turnaround_time_percentiles",
+            ):
+                assert getattr(closed_form, metric) == getattr(
+                    simulated, metric
+                ), f"incorrect {metric} for {Scheduler.algorithm_name}"
+
+    @pytest.mark.parametrize(
+        "Scheduler", [RoundRobinScheduler, ShortestRemainingTimeFirstScheduler]
+    )
+    def test_percentiles(self, Scheduler: type):
+        """Test the percentiles of the wait and turnaround times.
+
+        Args:
+            Scheduler (type): The scheduling algorithm class.
+        """
+
+        scheduler = Scheduler(random_table(0, **WORKLOAD))
+        results = scheduler.results
+        concluded = scheduler._table.status == TERMINATED
+
+        for percentile in PERCENTILES:
+            for times, percentiles in (
+                (results.wait_times, results.wait_time_percentiles),
+                (results.turnaround_times, results.turnaround_time_percentiles),
+            ):
+                expected = np.quantile(times[concluded], percentile / 100)
+
+                assert percentiles[percentile] == pytest.approx(expected, rel=0.01)
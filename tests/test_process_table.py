@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from scheduling_sim import Process, ProcessStatus, ProcessTable
+from scheduling_sim.process_table import READY, RUNNING, TERMINATED
+
+
+class TestProcessTable:
+    """Test Class for the column-oriented process storage.
+
+    Methods:
+        test_process_views(self): Test that processes are views of the table rows.
+        test_column_validation(self): Test that invalid columns are rejected.
+        test_append(self): Test that appended processes become views of the table.
+        test_shared_copy(self): Test that copies can share the process attributes.
+        test_standalone_process(self): Test that processes created on their own
+        only get a table once they are added to one.
+    """
+
+    def test_process_views(self):
+        """Test that processes are views of the table rows."""
+
+        table = ProcessTable([0, 2, 4], [3, 1, 2], [1, 2, 3], names=["A", "B", "C"])
+        process = table[1]
+
+        assert process.name == "B", f"incorrect name. Got {process.name}"
+        assert process.execution_time == 1, "incorrect execution time"
+        assert process.status == ProcessStatus.READY, "incorrect status"
+
+        process.remaining_execution_time = 0
+        process.conclude()
+
+        assert table.remaining_execution_time[1] == 0, "view did not write the table"
+        assert table[1].is_terminated, "view did not write the status"
+
+    def test_column_validation(self):
+        """Test that invalid columns are rejected."""
+
+        with pytest.raises(TypeError):
+            ProcessTable([0.0, 1.5], [1, 1])
+
+        with pytest.raises(ValueError):
+            ProcessTable([0, 1], [1, 0])
+
+        with pytest.raises(ValueError):
+            ProcessTable([0, 1], [1, 1], [1])
+
+        for names in (["A", ""], ["A", "  "], ["A", None], ["A", float("nan")]):
+            with pytest.raises(ValueError):
+                ProcessTable([0, 1], [1, 1], names=names)
+
+    def test_append(self):
+        """Test that appended processes become views of the table."""
+
+        table = ProcessTable(np.array([0]), np.array([2]))
+        process = Process("P2", execution_time=4, arrival_time=1)
+
+        table.append(process)
+        process.priority_level = 3
+
+        assert len(table) == 2, f"incorrect table length. Got {len(table)}"
+        assert table.names == ["P1", "P2"], f"incorrect names. Got {table.names}"
+        assert table.priority_level[1] == 3, "appended process is not a view"
+
+    def test_shared_copy(self):
+        """Test that copies can share the process attributes."""
+
+        table = ProcessTable([0, 2, 4], [3, 1, 2], [1, 2, 3])
+        table.status[:] = TERMINATED
+        shared = table.copy(share_attributes=True)
+
+        for column in ProcessTable.attribute_columns:
+            assert np.shares_memory(
+                getattr(shared, column), getattr(table, column)
+            ), f"{column} was copied"
+
+        for column in ProcessTable.state_columns:
+            assert not np.shares_memory(
+                getattr(shared, column), getattr(table, column)
+            ), f"{column} was shared"
+
+        assert (shared.status == READY).all(), "copy was not reset"
+
+        with pytest.raises(ValueError):
+            shared[0].arrival_time = 1
+
+    def test_standalone_process(self):
+        """Test that processes created on their own only get a table once they are
+        added to one."""
+
+        process = Process("P1", execution_time=4, priority_level=2, arrival_time=3)
+        process.run()
+
+        assert not isinstance(process._table, ProcessTable), "process built a table"
+        assert process.conclusion_time == 7, "incorrect conclusion time"
+        assert process.is_running, "incorrect status"
+
+        table = ProcessTable(np.array([0]), np.array([2]))
+        table.append(process)
+
+        assert process._table is table, "process is not a view of the table"
+        assert table.status[1] == RUNNING, "status was not copied"
+        assert (
+            table.priority_level[1] == 2 and table.arrival_time[1] == 3
+        ), "attributes were not copied"
@@ -0,0 +1,162 @@
+import pytest
+
+from scheduling_sim import (
+    FirstComeFirstServeScheduler,
+    Process,
+    RoundRobinScheduler,
+    ShortestRemainingTimeFirstScheduler,
+    SimulationStats,
+)
+from scheduling_sim.process_table import RUNNING, TERMINATED
+from scheduling_sim.profiling import PROFILED_PHASES
+
+
+class TestProfiling:
+    """Test Class for the profiling hooks of the scheduling algorithms.
+
+    Methods:
+        processes(self) -> list[Process]: Builds a small workload.
+        test_disabled_profiling(self): Test that disabled profiling leaves no hooks
+        behind.
+        test_results_are_unchanged(self, Scheduler: type): Test that profiling does
+        not change the schedule.
+        test_counters(self, Scheduler: type): Test the counters of a profiled
+        simulation.
+        test_report_phase(self): Test that building a report is profiled.
+        test_closed_form_phase(self): Test that schedules concluded in closed form
+        are profiled.
+        test_invalid_profiling(self): Test that profiling only accepts booleans.
+    """
+
+    def processes(self) -> list[Process]:
+        """Builds a small workload.
+
+        Returns:
+            list[Process]: The processes of the workload.
+        """
+
+        return [
+            Process("P1", arrival_time=0, execution_time=5, priority_level=2),
+            Process("P2", arrival_time=0, execution_time=2, priority_level=3),
+            Process("P3", arrival_time=1, execution_time=4, priority_level=1),
+            Process("P4", arrival_time=3, execution_time=1, priority_level=4),
+            Process("P5", arrival_time=5, execution_time=2, priority_level=5),
+        ]
+
+    def test_disabled_profiling(self):
+        """Test that disabled profiling leaves no hooks behind."""
+
+        scheduler = RoundRobinScheduler(self.processes())
+        scheduler.profiling = True
+        scheduler.run()
+
+        assert isinstance(scheduler.stats, SimulationStats), "stats were not kept"
+
+        scheduler.profiling = False
+        scheduler.run()
+
+        assert scheduler.stats == None, "stats were kept without profiling"
+
+        for name in PROFILED_PHASES.values():
+            assert name not in vars(scheduler), f"{name} is still wrapped"
+
+    @pytest.mark.parametrize(
+        "Scheduler",
+        [
+            FirstComeFirstServeScheduler,
+            RoundRobinScheduler,
+            ShortestRemainingTimeFirstScheduler,
+        ],
+    )
+    def test_results_are_unchanged(self, Scheduler: type):
+        """Test that profiling does not change the schedule.
+
+        Args:
+            Scheduler (type): The scheduling algorithm class.
+        """
+
+        expected_report = Scheduler(self.processes()).run()
+
+        scheduler = Scheduler(self.processes())
+        scheduler.profiling = True
+
+        assert scheduler.run().equals(expected_report), "profiling changed the report"
+
+    @pytest.mark.parametrize(
+        "Scheduler", [RoundRobinScheduler, ShortestRemainingTimeFirstScheduler]
+    )
+    def test_counters(self, Scheduler: type):
+        """Test the counters of a profiled simulation.
+
+        Every dispatch ends with a preemption or a conclusion, unless the process
+        is still running at the end of the schedule.
+
+        Args:
+            Scheduler (type): The scheduling algorithm class.
+        """
+
+        scheduler = Scheduler(self.processes())
+        scheduler.profiling = True
+        scheduler.results
+        stats = scheduler.stats
+
+        status = scheduler._table.status
+        expected_dispatches = (
+            stats.preemptions
+            + int((status == TERMINATED).sum())
+            + int((status == RUNNING).sum())
+        )
+
+        assert (
+            stats.ticks == int(scheduler.results.conclusion_times.max()) + 1
+        ), "incorrect ticks"
+        assert stats.preemptions > 0, "preemptions were not counted"
+        assert (
+            stats.dispatches == expected_dispatches
+        ), f"incorrect dispatches. Expected {expected_dispatches}, got {stats.dispatches}"
+        assert (
+            0 < stats.simulated_steps <= stats.ticks
+        ), "incorrect number of simulated steps"
+        assert (
+            stats.phase_calls["refresh_ready_queue"] == stats.simulated_steps
+        ), "incorrect number of ready queue refreshes"
+        assert (
+            0 < stats.max_ready_queue_length < len(status)
+        ), "incorrect ready queue high-water mark"
+        assert stats.total_time > 0, "phases were not timed"
+
+    def test_report_phase(self):
+        """Test that building a report is profiled."""
+
+        scheduler = RoundRobinScheduler(self.processes())
+        scheduler.profiling = True
+        scheduler.run()
+
+        assert (
+            scheduler.stats.phase_calls["report_step_status"] == scheduler.stats.ticks
+        ), "incorrect number of reported steps"
+
+        results = scheduler.results
+        stats = scheduler.stats
+
+        assert scheduler.results is results, "results were not cached"
+        assert scheduler.stats is stats, "stats of the cached results were discarded"
+
+    def test_closed_form_phase(self):
+        """Test that schedules concluded in closed form are profiled."""
+
+        scheduler = FirstComeFirstServeScheduler(self.processes())
+        scheduler.profiling = True
+        scheduler.results
+        stats = scheduler.stats
+
+        assert stats.phase_calls["conclude_in_closed_form"] == 1, "phase not timed"
+        assert stats.simulated_steps == 0, "closed form was simulated step by step"
+
+    def test_invalid_profiling(self):
+        """Test that profiling only accepts booleans."""
+
+        scheduler = RoundRobinScheduler(self.processes())
+
+        with pytest.raises(TypeError):
+            scheduler.profiling = 1
@@ -0,0 +1,68 @@
+from scheduling_sim.scheduling_algorithms.ready_queue import (
+    MultilevelReadyQueue,
+    PriorityReadyQueue,
+    ReadyQueue,
+)
+
+
+class TestReadyQueue:
+    """Test Class for the ready queues used by the scheduling algorithms.
+
+    Methods:
+        test_fifo_order(self): Test that the ready queue is first-in, first-out.
+        test_priority_order(self): Test that the priority ready queue is ordered by
+        key, enqueue time and index.
+        test_multilevel_order(self): Test that the multilevel ready queue pops the
+        highest level first, and that boosts keep the order of each level.
+    """
+
+    def test_fifo_order(self):
+        """Test that the ready queue is first-in, first-out."""
+
+        queue = ReadyQueue()
+
+        for index, enqueue_time in [(2, 0), (0, 1), (1, 1)]:
+            queue.push(index, enqueue_time)
+
+        popped = [queue.pop() for _ in range(len(queue))]
+
+        assert popped == [2, 0, 1], f"incorrect queue order. Got {popped}"
+
+    def test_priority_order(self):
+        """Test that the priority ready queue is ordered by key, enqueue time and index."""
+
+        keys = [3, 1, 3, 1, 2]
+        queue = PriorityReadyQueue(key=lambda index: keys[index])
+
+        for index, enqueue_time in [(4, 0), (2, 0), (3, 1), (0, 2), (1, 1)]:
+            queue.push(index, enqueue_time)
+
+        assert queue.peek() == 1, f"incorrect first process. Got {queue.peek()}"
+
+        popped = [queue.pop() for _ in range(len(queue))]
+
+        assert popped == [1, 3, 4, 2, 0], f"incorrect queue order. Got {popped}"
+
+    def test_multilevel_order(self):
+        """Test that the multilevel ready queue pops the highest level first, and
+        that boosts keep the order of each level."""
+
+        levels = [1, 0, 2, 1, 0]
+        queue = MultilevelReadyQueue(3, level=lambda index: levels[index])
+
+        for index in [2, 0, 3, 1]:
+            queue.push(index, 0)
+
+        assert queue.top_level == 0, f"incorrect top level. Got {queue.top_level}"
+        assert queue.pop() == 1, "the highest level was not popped first"
+
+        queue.boost()
+        queue.push(4, 1)
+
+        assert queue.top_level == 0, f"incorrect top level. Got {queue.top_level}"
+        assert list(queue) == [0, 3, 2, 4], f"incorrect queue order. Got {list(queue)}"
+
+        popped = [queue.pop() for _ in range(len(queue))]
+
+        assert popped == [0, 3, 2, 4], f"incorrect queue order. Got {popped}"
+        assert queue.top_level == None, "empty queue has a top level"
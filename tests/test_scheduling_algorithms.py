@@ -2,6 +2,7 @@ import pytest
 
 from .schedulers import (
     TestFirstComeFirstServeScheduler,
+    TestMultilevelFeedbackQueueScheduler,
     TestPriorityCooperativeScheduler,
     TestPriorityPreemptiveScheduler,
     TestRoundRobinScheduler,
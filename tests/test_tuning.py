@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from scheduling_sim import ProcessTable, RoundRobinScheduler, tune_quantum_length
+from scheduling_sim.tuning import TUNING_OBJECTIVES, _cost_lower_bound
+
+from .schedulers.scheduling_algorithm import random_table
+
+# Ranges of the random workloads of the tests.
+WORKLOAD: dict[str,] = {
+    "sizes": (2, 60),
+    "arrival_times": (0, 200),
+    "execution_times": (1, 30),
+    "priority_levels": None,
+}
+
+
+class TestTuneQuantumLength:
+    """Test Class for the Round Robin quantum length tuner.
+
+    Methods:
+        exhaustive_costs(self, table: ProcessTable, objective: str,
+        context_switch_cost: float) -> dict[int, float]: Computes the cost of every
+        quantum length.
+        test_lower_bounds(self, objective: str): Test that partial costs never
+        exceed the final cost.
+        test_costs(self, objective: str): Test the costs of the evaluated quantum
+        lengths.
+        test_pruning(self): Test that candidates are stopped once they cannot beat
+        the best cost.
+        test_bounds(self): Test that the search stays within the quantum length
+        bounds.
+        test_invalid_arguments(self): Test that invalid arguments are rejected.
+    """
+
+    def exhaustive_costs(
+        self, table: ProcessTable, objective: str, context_switch_cost: float
+    ) -> dict[int, float]:
+        """Computes the cost of every quantum length up to the longest execution
+        time.
+
+        Args:
+            table (ProcessTable): The processes of the workload.
+            objective (str): One of the `TUNING_OBJECTIVES`.
+            context_switch_cost (float): The cost of each context switch.
+
+        Returns:
+            dict[int, float]: The cost of each quantum length.
+        """
+
+        costs = {}
+
+        for quantum_length in range(1, int(table.execution_time.max()) + 1):
+            scheduler = RoundRobinScheduler(table.copy(), quantum_length=quantum_length)
+            scheduler.results
+            costs[quantum_length] = _cost_lower_bound(
+                scheduler, objective, context_switch_cost
+            )
+
+        return costs
+
+    @pytest.mark.parametrize("objective", TUNING_OBJECTIVES)
+    def test_lower_bounds(self, objective: str):
+        """Test that partial costs never exceed the final cost.
+
+        Args:
+            objective (str): One of the `TUNING_OBJECTIVES`.
+        """
+
+        for seed in range(5):
+            scheduler = RoundRobinScheduler(
+                random_table(seed, **WORKLOAD),
+                quantum_length=3,
+            )
+            lower_bounds = []
+
+            while not scheduler.advance(scheduler.current_time + 4):
+                lower_bounds.append(_cost_lower_bound(scheduler, objective, 2.0))
+
+            cost = _cost_lower_bound(scheduler, objective, 2.0)
+
+            assert all(
+                lower_bound <= cost for lower_bound in lower_bounds
+            ), "a partial cost exceeds the final cost"
+
+    @pytest.mark.parametrize("objective", TUNING_OBJECTIVES)
+    def test_costs(self, objective: str):
+        """Test the costs of the evaluated quantum lengths.
+
+        Args:
+            objective (str): One of the `TUNING_OBJECTIVES`.
+        """
+
+        table = random_table(0, **WORKLOAD)
+        expected_costs = self.exhaustive_costs(table, objective, 1.0)
+        result = tune_quantum_length(table, objective, context_switch_cost=1.0)
+
+        for quantum_length, cost in result.costs.items():
+            assert cost == expected_costs[quantum_length], "incorrect cost"
+
+        for quantum_length, lower_bound in result.pruned.items():
+            assert (
+                result.cost <= lower_bound <= expected_costs[quantum_length]
+            ), "incorrect pruning"
+
+        assert result.cost == min(result.costs.values())
+        assert result.cost == expected_costs[result.quantum_length]
+
+    def test_pruning(self):
+        """Test that candidates are stopped once they cannot beat the best cost."""
+
+        rng = np.random.default_rng(0)
+        table = ProcessTable(
+            np.sort(rng.integers(0, 2000, 100)), rng.integers(1, 40, 100)
+        )
+        result = tune_quantum_length(table)
+
+        assert len(result.pruned) > 0, "no candidate was stopped early"
+        assert len(result.costs) + len(result.pruned) < 40, "the search was exhaustive"
+
+    def test_bounds(self):
+        """Test that the search stays within the quantum length bounds."""
+
+        table = random_table(1, **WORKLOAD)
+        result = tune_quantum_length(
+            table, min_quantum_length=3, max_quantum_length=10**6
+        )
+        evaluated = [*result.costs, *result.pruned]
+
+        assert min(evaluated) == 3
+        assert max(evaluated) == int(table.execution_time.max())
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+
+        table = random_table(2, **WORKLOAD)
+
+        with pytest.raises(ValueError):
+            tune_quantum_length(table, "throughput")
+
+        with pytest.raises(ValueError):
+            tune_quantum_length(table, context_switch_cost=-1)
+
+        with pytest.raises(ValueError):
+            tune_quantum_length(table, min_quantum_length=5, max_quantum_length=2)
+
+        with pytest.raises(TypeError):
+            tune_quantum_length(table, max_quantum_length=2.5)
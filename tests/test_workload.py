@@ -0,0 +1,141 @@
+import os
+
+import pandas as pd
+import pytest
+
+from scheduling_sim import workload
+from scheduling_sim.workload import clear_workload_cache, read_workload
+
+
+class TestReadWorkload:
+    """Test Class for the cached workload loader.
+
+    Methods:
+        write_workload(self, path, execution_times: list[int]): Writes a workload file.
+        test_cache(self, tmp_path, monkeypatch): Test that parsed workloads are cached.
+        test_cache_invalidation(self, tmp_path): Test that modified files are
+        parsed again.
+        test_arrow_formats(self, tmp_path, extension: str): Test the formats read
+        with pyarrow.
+        test_invalid_files(self, tmp_path): Test the errors of invalid workload
+        files.
+        test_invalid_names(self, tmp_path, extension: str): Test that missing and
+        empty process names are rejected.
+    """
+
+    def write_workload(self, path, execution_times: list[int]):
+        """Writes a workload file.
+
+        Args:
+            path (pathlib.Path): The path of the file.
+            execution_times (list[int]): The execution time of each process.
+        """
+
+        workload = pd.DataFrame(
+            {
+                "Process Name": [f"P{i + 1}" for i in range(len(execution_times))],
+                "Arrival Time": list(range(len(execution_times))),
+                "Execution Time": execution_times,
+            }
+        )
+
+        if path.suffix == ".csv":
+            workload.to_csv(path, index=False)
+        elif path.suffix == ".parquet":
+            workload.to_parquet(path)
+        else:
+            workload.to_feather(path)
+
+    def test_cache(self, tmp_path, monkeypatch):
+        """Test that parsed workloads are cached."""
+
+        clear_workload_cache()
+        path = tmp_path / "workload.csv"
+        self.write_workload(path, [3, 1, 2])
+
+        table = read_workload(str(path))
+
+        def parse_workload(path: str):
+            raise AssertionError("cached workload was parsed again")
+
+        monkeypatch.setattr(workload, "_parse_workload", parse_workload)
+        cached = read_workload(str(path))
+
+        assert cached is not table, "cached table was shared"
+        assert cached.execution_time.tolist() == [3, 1, 2]
+        assert cached.names == ["P1", "P2", "P3"]
+
+    def test_cache_invalidation(self, tmp_path):
+        """Test that modified files are parsed again."""
+
+        clear_workload_cache()
+        path = tmp_path / "workload.csv"
+        self.write_workload(path, [3, 1, 2])
+
+        assert read_workload(str(path)).execution_time.tolist() == [3, 1, 2]
+
+        self.write_workload(path, [4, 5, 6])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert read_workload(str(path)).execution_time.tolist() == [4, 5, 6]
+
+    @pytest.mark.parametrize("extension", [".parquet", ".arrow", ".feather"])
+    def test_arrow_formats(self, tmp_path, extension: str):
+        """Test the formats read with pyarrow."""
+
+        pytest.importorskip("pyarrow")
+
+        path = tmp_path / f"workload{extension}"
+        self.write_workload(path, [3, 1, 2])
+
+        table = read_workload(str(path))
+
+        assert table.execution_time.tolist() == [3, 1, 2]
+        assert table.priority_level.tolist() == [1, 1, 1]
+
+    def test_invalid_files(self, tmp_path):
+        """Test the errors of invalid workload files."""
+
+        path = tmp_path / "workload.txt"
+        path.write_text("Arrival Time,Execution Time\n0,1\n")
+
+        with pytest.raises(ValueError):
+            read_workload(str(path))
+
+        path = tmp_path / "workload.csv"
+        path.write_text("Arrival Time\n0\n")
+
+        with pytest.raises(ValueError):
+            read_workload(str(path))
+
+        path.write_text("Arrival Time,Execution Time\n0,0\n")
+
+        with pytest.raises(ValueError):
+            read_workload(str(path), use_cache=False)
+
+    @pytest.mark.parametrize("extension", [".csv", ".parquet"])
+    def test_invalid_names(self, tmp_path, extension: str):
+        """Test that missing and empty process names are rejected."""
+
+        if extension != ".csv":
+            pytest.importorskip("pyarrow")
+
+        path = tmp_path / f"workload{extension}"
+
+        for name in (None, " "):
+            workload = pd.DataFrame(
+                {
+                    "Process Name": ["P1", name],
+                    "Arrival Time": [0, 1],
+                    "Execution Time": [1, 2],
+                }
+            )
+
+            if extension == ".csv":
+                workload.to_csv(path, index=False)
+            else:
+                workload.to_parquet(path)
+
+            with pytest.raises(ValueError):
+                read_workload(str(path), use_cache=False)